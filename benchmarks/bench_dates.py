@@ -0,0 +1,51 @@
+# Usage: python -m benchmarks.bench_dates [events]
+from __future__ import annotations
+
+import sys
+import time
+from datetime import date, datetime
+
+from dateutil import parser as date_parser
+
+from garys_nyc_events.dates import clear_date_cache
+from garys_nyc_events.filters import filter_events_upcoming_week
+
+from .bench_filters import TODAY, history
+
+
+def _dateutil_week(events, today):
+    default = datetime(today.year, today.month, today.day)
+    kept = []
+    for event in events:
+        try:
+            parsed = date_parser.parse(event["date"], fuzzy=True, default=default).date()
+        except (ValueError, OverflowError):
+            continue
+        if today <= parsed < date.fromordinal(today.toordinal() + 7):
+            kept.append(event)
+    return kept
+
+
+def run(count: int) -> None:
+    events = history(count)
+
+    started = time.perf_counter()
+    baseline = _dateutil_week(events, TODAY)
+    dateutil_seconds = time.perf_counter() - started
+
+    clear_date_cache()
+    started = time.perf_counter()
+    cold = filter_events_upcoming_week(events, today=TODAY)
+    cold_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    filter_events_upcoming_week(events, today=TODAY)
+    warm_seconds = time.perf_counter() - started
+
+    assert cold == baseline
+    print(f"{'dateutil':>10} {'cold':>9} {'warm':>9}   ({count} events, seconds)")
+    print(f"{dateutil_seconds:>10.3f} {cold_seconds:>9.3f} {warm_seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
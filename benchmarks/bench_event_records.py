@@ -0,0 +1,73 @@
+# Usage: python -m benchmarks.bench_event_records [events]
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field, replace
+from typing import Callable, List, Tuple
+
+from garys_nyc_events.filters import filter_ai_events, filter_events_by_keyword
+from garys_nyc_events.models import Event
+
+
+@dataclass(frozen=True)
+class _LegacyEvent:
+    title: str
+    date: str
+    price: str
+    url: str
+    source: str
+    time: str = ""
+    location: str = ""
+    description: str = ""
+    tags: List[str] = field(default_factory=list)
+
+
+def _fields(index: int) -> Tuple[str, ...]:
+    return (
+        f"AI Founders Night {index}" if index % 3 == 0 else f"Design Mixer {index}",
+        f"Feb {1 + index % 28}",
+        "FREE" if index % 2 else f"${index % 50}",
+        f"https://www.garysguide.com/events/{index}",
+        "garysguide_web",
+    )
+
+
+def legacy_pipeline(count: int) -> list:
+    # parse_events -> asdict per event, then {**event, "tags": ...} at tagging.
+    events = [asdict(_LegacyEvent(*_fields(index), description="Talks and demos")) for index in range(count)]
+    events = filter_events_by_keyword(events, "ai")
+    events = filter_ai_events(events)
+    return [{**event, "tags": []} for event in events]
+
+
+def record_pipeline(count: int) -> list:
+    events = [Event(*_fields(index), description="Talks and demos") for index in range(count)]
+    events = filter_events_by_keyword(events, "ai")
+    events = filter_ai_events(events)
+    return [replace(event, tags=()) for event in events]
+
+
+def _measure(func: Callable[[int], list], count: int) -> Tuple[float, float]:
+    started = time.perf_counter()
+    func(count)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    retained = func(count)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return elapsed, current / (1024 * 1024)
+
+
+def run(count: int) -> None:
+    print(f"{'pipeline':>10} {'events':>8} {'seconds':>9} {'events/s':>10} {'retained MiB':>13}")
+    for name, func in [("dicts", legacy_pipeline), ("records", record_pipeline)]:
+        elapsed, retained = _measure(func, count)
+        print(f"{name:>10} {count:>8} {elapsed:>9.3f} {count / elapsed:>10.0f} {retained:>13.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,85 @@
+# Usage: python -m benchmarks.bench_extraction [rows ...]
+from __future__ import annotations
+
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+from garys_nyc_events.parsing import FALLBACK_BACKEND, build_tree
+from garys_nyc_events.scraper import ExtractionContext, GarysGuideScraper
+
+from .corpus import scaled_events_page
+
+
+class SelectOneScraper(GarysGuideScraper):
+    # The previous path: one find or select_one pass per container for each
+    # field, plus one per fallback location selector.
+    def _extract_location(self, element: Tag) -> str:
+        tag = element.select_one("font.fdescription")
+        if tag:
+            value = self._context.text(tag)
+            if value:
+                return value
+        for selector in [".venue", ".location", "[class*=venue]", "[class*=location]", "[class*=address]"]:
+            tag = element.select_one(selector)
+            if tag is None:
+                continue
+            value = self._context.text(tag)
+            if value:
+                return value
+        return ""
+
+    def _extract_description(self, element: Tag) -> str:
+        tag = element.select_one("font.fgray")
+        if tag:
+            value = self._context.text(tag)
+            if value:
+                return value[:500]
+        return ""
+
+    def _extract_anchor(self, element: Tag) -> Optional[Tuple[str, str]]:
+        link = element.find("a", href=True)
+        if not link:
+            return None
+        title = self._clean(link.get_text())
+        href = self._clean(link.get("href"))
+        if not title or not href:
+            return None
+        return title, href
+
+    def _extract_date_and_price_from_table(self, element: Tag) -> Tuple[str, str]:
+        cells = element.find_all("td")
+        return self._extract_date_from_table_row(cells), self._extract_price_from_table_row(cells)
+
+
+def _extract_seconds(scraper: GarysGuideScraper, soup: BeautifulSoup) -> Tuple[float, list]:
+    scraper._context = ExtractionContext()
+    elements = list(scraper._candidate_elements(soup))
+    scraper._context = ExtractionContext()
+    started = time.perf_counter()
+    events = [scraper._extract_event_from_element(element) for element in elements]
+    return time.perf_counter() - started, events
+
+
+def _best_of(scraper_type: type, html: str, repeats: int = 5) -> Tuple[float, list]:
+    results = [
+        _extract_seconds(scraper_type(delay_seconds=0), build_tree(html, FALLBACK_BACKEND))
+        for _ in range(repeats)
+    ]
+    return min(seconds for seconds, _events in results), results[0][1]
+
+
+def run(row_counts: List[int]) -> None:
+    print(f"{'rows':>8} {'select_one s':>13} {'single walk s':>14} {'speedup':>8}")
+    for rows in row_counts:
+        html = scaled_events_page(rows)
+        before, expected = _best_of(SelectOneScraper, html)
+        after, events = _best_of(GarysGuideScraper, html)
+        assert events == expected
+        print(f"{rows:>8} {before:>13.3f} {after:>14.3f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or [2000, 5000])
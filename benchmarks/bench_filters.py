@@ -0,0 +1,70 @@
+# Usage: python -m benchmarks.bench_filters [events]
+from __future__ import annotations
+
+import sys
+import time
+from datetime import date
+from typing import Callable, List
+
+from garys_nyc_events.batch import EventBatch
+from garys_nyc_events.filters import filter_ai_events, filter_events_by_keyword, filter_events_upcoming_week
+from garys_nyc_events.models import Event
+
+
+TODAY = date(2026, 2, 1)
+
+
+def history(count: int) -> List[Event]:
+    return [
+        Event(
+            title=f"AI Founders Night {index}" if index % 3 == 0 else f"Design Mixer {index}",
+            date=f"{('Mon', 'Tue', 'Wed', 'Thu', 'Fri')[index % 5]}, Feb {1 + index % 28}",
+            price="FREE",
+            url=f"https://www.garysguide.com/events/{index}",
+            source="garysguide_web",
+            description="Talks, demos and networking for builders",
+        )
+        for index in range(count)
+    ]
+
+
+def _timed(func: Callable[[], object], repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def chained_lists(events: List[Event]) -> List[Event]:
+    # The runner's SCRAPER_SEARCH_TERM=ai path, one list pass per filter.
+    return filter_events_upcoming_week(filter_ai_events(filter_events_by_keyword(events, "ai")), today=TODAY)
+
+
+def chained_batch(batch: EventBatch) -> EventBatch:
+    return batch.filter_keyword("ai").filter_ai().filter_upcoming_week(TODAY)
+
+
+def run(count: int) -> None:
+    events = history(count)
+    warm = EventBatch(events)
+    warm.lower_haystacks
+    warm.parsed_dates(TODAY)
+
+    cases = [
+        ("keyword", lambda: filter_events_by_keyword(events, "mixer"), lambda b: b.filter_keyword("mixer")),
+        ("ai", lambda: filter_ai_events(events), lambda b: b.filter_ai()),
+        ("upcoming week", lambda: filter_events_upcoming_week(events, today=TODAY), lambda b: b.filter_upcoming_week(TODAY)),
+        ("chained (ai)", lambda: chained_lists(events), chained_batch),
+    ]
+    print(f"{'filter':>14} {'lists':>9} {'batch cold':>11} {'batch warm':>11}   ({count} events, best of 5, seconds)")
+    for name, listwise, batchwise in cases:
+        lists = _timed(listwise)
+        cold = _timed(lambda: batchwise(EventBatch(events)))
+        hot = _timed(lambda: batchwise(warm))
+        print(f"{name:>14} {lists:>9.3f} {cold:>11.3f} {hot:>11.3f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
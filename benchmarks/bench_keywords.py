@@ -0,0 +1,61 @@
+# Usage: python -m benchmarks.bench_keywords [events]
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from garys_nyc_events.filters import filter_ai_events
+from garys_nyc_events.keywords import AI_KEYWORDS
+
+
+WORDS = (
+    "email chair detail html mail rain paint domain said train ml-ops "
+    "founders demo night product design startup capital network brunch"
+).split()
+PHRASES = sorted(AI_KEYWORDS)
+
+
+def corpus(count: int, seed: int = 7) -> List[dict]:
+    rng = random.Random(seed)
+    events = []
+    for index in range(count):
+        words = rng.choices(WORDS, k=24)
+        if index % 4 == 0:
+            words.insert(rng.randrange(len(words)), rng.choice(PHRASES))
+        events.append({"title": " ".join(words[:6]).title(), "description": " ".join(words[6:])})
+    return events
+
+
+def substring_scan(events: List[dict]) -> List[dict]:
+    filtered = []
+    for event in events:
+        haystack = f"{event['title'].lower()} {event['description'].lower()}"
+        if any(keyword in haystack for keyword in AI_KEYWORDS):
+            filtered.append(event)
+    return filtered
+
+
+def _timed(func: Callable[[], List[dict]], repeats: int = 5) -> Tuple[float, int]:
+    best = float("inf")
+    kept: List[dict] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        kept = func()
+        best = min(best, time.perf_counter() - started)
+    return best, len(kept)
+
+
+def run(count: int) -> None:
+    events = corpus(count)
+    print(f"{'matcher':>16} {'seconds':>9} {'ratio':>6} {'kept':>8}   ({count} events, best of 5)")
+    baseline = 0.0
+    for name, func in (("substring any()", substring_scan), ("compiled regex", filter_ai_events)):
+        seconds, kept = _timed(lambda: func(events))
+        baseline = baseline or seconds
+        print(f"{name:>16} {seconds:>9.3f} {seconds / baseline:>5.2f}x {kept:>8}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
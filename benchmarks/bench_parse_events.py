@@ -0,0 +1,55 @@
+# Usage: python -m benchmarks.bench_parse_events [rows ...]
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from garys_nyc_events.parsing import FALLBACK_BACKEND, LXML_BACKEND, build_tree, lxml_available
+from garys_nyc_events.scraper import GarysGuideScraper
+
+from .corpus import scaled_events_page, with_page_chrome
+
+
+def _measure(func: Callable[[], object]) -> Tuple[float, float]:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def run(row_counts: List[int]) -> None:
+    backends = [FALLBACK_BACKEND]
+    if lxml_available():
+        backends.append(LXML_BACKEND)
+
+    print(f"{'rows':>8} {'backend':>12} {'stage':>13} {'seconds':>9} {'peak MiB':>9}")
+    for rows in row_counts:
+        html = with_page_chrome(scaled_events_page(rows))
+        for backend in backends:
+            planned = GarysGuideScraper(delay_seconds=0, parser_backend=backend)
+            planned.parse_events(html)
+            stages = [
+                ("build_tree", lambda: build_tree(html, backend)),
+                (
+                    "full_parse",
+                    lambda: GarysGuideScraper(
+                        delay_seconds=0, parser_backend=backend, region_slicing=False
+                    ).parse_events(html),
+                ),
+                ("sliced", lambda: GarysGuideScraper(delay_seconds=0, parser_backend=backend).parse_events(html)),
+                ("planned", lambda: planned.parse_events(html)),
+            ]
+            for stage, func in stages:
+                elapsed, peak = _measure(func)
+                print(f"{rows:>8} {backend:>12} {stage:>13} {elapsed:>9.3f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or [1000, 5000])
@@ -0,0 +1,75 @@
+# Usage: python -m benchmarks.bench_persist [events ...]
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, List
+
+from garys_nyc_events.models import Event
+from garys_nyc_events.storage import SQLiteEventStore, UpsertResult, upsert_all_events_sql
+
+
+TODAY = date(2026, 2, 26)
+OBSERVED_AT = "2026-02-26T00:00:00+00:00"
+
+
+def synthetic_events(count: int) -> List[Event]:
+    return [
+        Event(
+            title=f"AI Founders Night {index}",
+            date=f"{('Mon', 'Tue', 'Wed', 'Thu', 'Fri')[index % 5]}, Feb {1 + index % 28}",
+            price="FREE",
+            url=f"https://www.garysguide.com/events/{index}",
+            source="garysguide_web",
+            time="6:30 PM",
+            location="Manhattan",
+            description="Talks, demos and networking for builders",
+            tags=("ai", "networking"),
+        )
+        for index in range(count)
+    ]
+
+
+def per_row_upsert(store: SQLiteEventStore, conn, events: List[Event]) -> List[int]:
+    # The previous path: one upsert and one id lookup per event.
+    sql = upsert_all_events_sql(1).rsplit("RETURNING", 1)[0]
+    ids = []
+    for event in events:
+        params = store._all_event_params(event, date_found=OBSERVED_AT, today=TODAY)
+        conn.execute(sql, params)
+        row = conn.execute('SELECT id FROM "all events" WHERE canonical_key = ?', (params[0],)).fetchone()
+        ids.append(int(row["id"]))
+    return ids
+
+
+def batched_upsert(store: SQLiteEventStore, conn, events: List[Event]) -> UpsertResult:
+    return store._upsert_all_events(conn, events, date_found=OBSERVED_AT, today=TODAY)
+
+
+def _rows_per_second(upsert: Callable, events: List[Event], workdir: Path, name: str) -> float:
+    store = SQLiteEventStore(str(workdir / f"{name}.db"))
+    store.init_schema()
+    with store._connect() as conn:
+        conn.execute("BEGIN")
+        started = time.perf_counter()
+        upsert(store, conn, events)
+        elapsed = time.perf_counter() - started
+    return len(events) / elapsed
+
+
+def run(counts: List[int]) -> None:
+    print(f"{'events':>8} {'per-row rows/s':>15} {'batched rows/s':>15} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for count in counts:
+            events = synthetic_events(count)
+            before = _rows_per_second(per_row_upsert, events, workdir, f"per_row_{count}")
+            after = _rows_per_second(batched_upsert, events, workdir, f"batched_{count}")
+            print(f"{count:>8} {before:>15,.0f} {after:>15,.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,89 @@
+# Usage: python -m benchmarks.bench_token_scanner [rows]
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import List, Tuple
+
+from garys_nyc_events.parsing import build_tree
+from garys_nyc_events.text_scanner import (
+    DATE_REGEXES,
+    PRICE_REGEX,
+    TIME_REGEX,
+    scan_tokens,
+    strip_spans,
+)
+
+from .corpus import scaled_events_page
+
+
+def _separate_fields(text: str) -> Tuple[str, str, str]:
+    # Mirrors the former extractors: each re-normalizes and searches on its own.
+    date = ""
+    for pattern in DATE_REGEXES:
+        match = pattern.search(" ".join(text.split()))
+        if match:
+            date = match.group(0)
+            break
+
+    match = TIME_REGEX.search(" ".join(text.split()))
+    time_value = match.group(0).upper() if match else ""
+
+    match = PRICE_REGEX.search(" ".join(text.split()))
+    price = ""
+    if match:
+        token = match.group(0)
+        price = "FREE" if "free" in token.lower() else token.replace(" ", "")
+    return date, time_value, price
+
+
+def _separate_with_location(text: str) -> Tuple[str, str, str]:
+    date, time_value, price = _separate_fields(text)
+    working = " ".join(text.split())
+    for token in [date, time_value, price]:
+        if token:
+            working = working.replace(token, " ")
+    return date, time_value, price
+
+
+def _single_pass(text: str) -> Tuple[str, str, str]:
+    scan = scan_tokens(" ".join(text.split()))
+    return scan.date, scan.time, scan.price
+
+
+def _single_pass_with_location(text: str) -> Tuple[str, str, str]:
+    normalized = " ".join(text.split())
+    scan = scan_tokens(normalized)
+    strip_spans(normalized, [(span.start, span.end) for span in scan.spans])
+    return scan.date, scan.time, scan.price
+
+
+def corpus(rows: int) -> List[str]:
+    soup = build_tree(scaled_events_page(rows), "html.parser")
+    texts = [row.get_text(" ") for row in soup.find_all("tr")]
+    texts.extend(cell.get_text(" ") for cell in soup.find_all("td"))
+    return texts
+
+
+def _best_of(func, texts: List[str]) -> float:
+    return min(timeit.repeat(lambda: [func(text) for text in texts], number=1, repeat=5))
+
+
+def run(rows: int) -> None:
+    texts = corpus(rows)
+    mismatches = sum(1 for text in texts if _separate_fields(text) != _single_pass(text))
+    print(f"corpus: {len(texts)} text blobs, field mismatches: {mismatches}")
+
+    cases = [
+        ("fields, separate", _separate_fields),
+        ("fields, single-pass", _single_pass),
+        ("+location, separate", _separate_with_location),
+        ("+location, single-pass", _single_pass_with_location),
+    ]
+    for name, func in cases:
+        elapsed = _best_of(func, texts)
+        print(f"{name:>24}: {elapsed * 1000:8.1f} ms  ({elapsed / len(texts) * 1e6:6.2f} us/blob)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import List
+
+
+FIXTURE_PATH = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "sample_events_page.html"
+
+NESTED_ROW_TEMPLATE = """
+<tr>
+  <td align='center' valign='top' width='48'><b>Feb {day}</b><br/>7:00pm</td>
+  <td>&nbsp;</td>
+  <td align='center' width='37' valign='top'>${price}</td>
+  <td>&nbsp;</td>
+  <td align='left' valign='top'>
+    <table width='100%'><tr><td align='left'>
+      <font class='ftitle'><a href='https://www.garysguide.com/events/n{index}/Mixer-{index}'><b>Mixer {index}</b></a></font>
+      <font class='fdescription'><br/><b>Cloud One Lounge</b>, 133 Greenwich St</font>
+      <font class='fgray'>With Jane Doe (CEO, Acme) , John Smith (CTO, Startup) .</font>
+    </td></tr></table>
+  </td>
+</tr>
+"""
+
+CHROME_BLOCK = """
+<div class='nav'><ul>{links}</ul></div>
+<div class='ad'><script>var slot{index} = {{"size": [300, 250]}};</script><img src='/ads/{index}.png'/></div>
+<div class='footer'><p>Copyright GarysGuide. <a href='/about'>About</a> <a href='/contact'>Contact</a></p></div>
+"""
+
+
+def _fixture_rows() -> List[str]:
+    html = FIXTURE_PATH.read_text(encoding="utf-8")
+    return re.findall(r"<tr>.*?</tr>", html, flags=re.DOTALL)
+
+
+def scaled_events_page(rows: int) -> str:
+    templates = _fixture_rows()
+    body: List[str] = []
+    for index in range(rows):
+        if index % 2:
+            body.append(NESTED_ROW_TEMPLATE.format(index=index, day=1 + index % 28, price=5 + index % 40))
+            continue
+        row = templates[(index // 2) % len(templates)]
+        body.append(re.sub(r"/events/(\d+)", rf"/events/\g<1>-{index}", row))
+    return "<html><body><table>" + "".join(body) + "</table></body></html>"
+
+
+def with_page_chrome(html: str, blocks: int = 200) -> str:
+    links = "".join(f"<li><a href='/section/{index}'>Section {index}</a></li>" for index in range(20))
+    chrome = "".join(CHROME_BLOCK.format(links=links, index=index) for index in range(blocks))
+    return html.replace("<body>", "<body>" + chrome, 1).replace("</body>", chrome + "</body>", 1)
@@ -2,7 +2,7 @@ from importlib.metadata import PackageNotFoundError, version
 
 from .filters import filter_events_by_keyword
 from .formatters import get_events_ai_json
-from .models import Event
+from .models import Event, event_to_dict
 from .newsletter_parser import parse_newsletter_html
 from .protocols import EventScraper, EventStore, HttpClient, HttpResponse
 from .scraper import GarysGuideScraper, scrape_default_garys_guide
@@ -14,6 +14,7 @@ except PackageNotFoundError:  # pragma: no cover - local editable usage
 
 __all__ = [
     "Event",
+    "event_to_dict",
     "GarysGuideScraper",
     "EventScraper",
     "EventStore",
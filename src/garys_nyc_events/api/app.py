@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from ..config import PipelineConfig
+from .dependencies import close_stores, get_store
 from .routers import events_router, health_router, runs_router
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    get_store()
+    try:
+        yield
+    finally:
+        close_stores()
+
+
 def create_app(_config: PipelineConfig | None = None) -> FastAPI:
     app = FastAPI(
+        lifespan=lifespan,
         title="Gary's NYC AI Events API",
         version="1.0.0",
         description="Upcoming NYC AI events scraped from Gary's Guide.",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 from functools import lru_cache
+from typing import Dict
 
 from ..config import PipelineConfig, load_config_from_env
 from ..storage import SQLiteEventStore
@@ -11,8 +13,34 @@ def get_config() -> PipelineConfig:
     return load_config_from_env()
 
 
+_store_lock = threading.Lock()
+_stores: Dict[PipelineConfig, SQLiteEventStore] = {}
+
+
+def _store_for(config: PipelineConfig) -> SQLiteEventStore:
+    # Migrations run once, when the store for a config is first built. Only
+    # the current config's store is kept: a replaced store is closed so its
+    # pooled connections do not linger until garbage collection.
+    with _store_lock:
+        store = _stores.get(config)
+        if store is None:
+            stale = list(_stores.values())
+            _stores.clear()
+            for previous in stale:
+                previous.close()
+            store = SQLiteEventStore.from_config(config)
+            store.init_schema()
+            _stores[config] = store
+        return store
+
+
+def close_stores() -> None:
+    with _store_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
+
+
 def get_store() -> SQLiteEventStore:
-    cfg = get_config()
-    store = SQLiteEventStore(cfg.db_path)
-    store.init_schema()
-    return store
+    return _store_for(get_config())
@@ -4,10 +4,9 @@ from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from ...filters import filter_events_upcoming_week
 from ..auth import require_api_token
 from ..dependencies import get_store
-from ..schemas import EventListOut, EventOut
+from ..schemas import EventListOut, EventOut, EventSearchHitOut, EventSearchOut
 
 
 router = APIRouter(dependencies=[Depends(require_api_token)])
@@ -33,16 +32,30 @@ def list_events(
     date_to: date | None = None,
     store=Depends(get_store),
 ):
-    events = store.fetch_events(limit=limit, ai_only=ai_only)
+    events = store.fetch_events(limit=limit, ai_only=ai_only, date_from=date_from, date_to=date_to)
     events = _filter_by_tags(events, tags)
 
-    if date_from is not None and date_to is not None:
-        window = filter_events_upcoming_week(events, today=date_from)
-        events = [event for event in window if event.get("date", "") <= str(date_to)]
-
     return EventListOut(count=len(events), events=[EventOut(**event) for event in events])
 
 
+@router.get("/search", response_model=EventSearchOut)
+def search_events(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    store=Depends(get_store),
+):
+    try:
+        page = store.search_events(q, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return EventSearchOut(
+        count=len(page.events),
+        events=[EventSearchHitOut(**event) for event in page.events],
+        next_cursor=page.next_cursor,
+    )
+
+
 @router.get("/{event_id}", response_model=EventOut)
 def get_event(event_id: int, store=Depends(get_store)):
     events = store.fetch_events(limit=0, ai_only=False)
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from ...config import PipelineConfig
 from ...runner_once import run_once
 from ..auth import require_api_token, require_api_token_for_mutation
 from ..dependencies import get_config, get_store
-from ..schemas import RunOut, TriggerRunOut
+from ..schemas import RunDiffOut, RunOut, TriggerRunOut
 
 
 router = APIRouter()
@@ -27,10 +27,22 @@ def list_runs(store=Depends(get_store)):
             "attempts": latest["attempts"],
             "fetched_count": latest["fetched_count"],
             "error": latest["error"],
+            "unchanged": bool(latest["unchanged"]),
+            "inserted_count": latest["inserted_count"],
+            "updated_count": latest["updated_count"],
+            "unchanged_count": latest["unchanged_count"],
         }
     ]
 
 
+@router.get("/{run_id}/diff", response_model=RunDiffOut, dependencies=[Depends(require_api_token)])
+def diff_run(run_id: int, against: int | None = None, store=Depends(get_store)):
+    diff = store.diff_runs(run_id, base_run_id=against)
+    if diff is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found")
+    return RunDiffOut(**diff.__dict__)
+
+
 @router.post("/trigger", response_model=TriggerRunOut, dependencies=[Depends(require_api_token_for_mutation)])
 def trigger_run(config: PipelineConfig = Depends(get_config), store=Depends(get_store)):
     summary = run_once(
@@ -51,5 +63,8 @@ def trigger_run(config: PipelineConfig = Depends(get_config), store=Depends(get_
             attempts=summary.attempts,
             fetched_count=summary.fetched_count,
             error=summary.error,
+            inserted_count=summary.inserted_count,
+            updated_count=summary.updated_count,
+            unchanged_count=summary.unchanged_count,
         ),
     )
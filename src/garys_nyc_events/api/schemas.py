@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -23,6 +23,16 @@ class EventListOut(BaseModel):
     events: List[EventOut]
 
 
+class EventSearchHitOut(EventOut):
+    score: float
+
+
+class EventSearchOut(BaseModel):
+    count: int
+    events: List[EventSearchHitOut]
+    next_cursor: Optional[str] = None
+
+
 class RunOut(BaseModel):
     run_id: int
     status: str
@@ -30,6 +40,24 @@ class RunOut(BaseModel):
     attempts: int
     fetched_count: int
     error: str
+    inserted_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
+
+
+class RunDiffEventOut(BaseModel):
+    id: int
+    title: str
+    url: str
+    date: str
+
+
+class RunDiffOut(BaseModel):
+    run_id: int
+    base_run_id: Optional[int]
+    added: List[RunDiffEventOut]
+    removed: List[RunDiffEventOut]
+    changed: List[RunDiffEventOut]
 
 
 class TriggerRunOut(BaseModel):
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Dict, Mapping, Optional
+
+import httpx
+
+from .charset import charset_from_content_type, decode_html
+from .exceptions import ResponseTooLargeError, ScraperNetworkError, ScraperTimeoutError
+from .http import DEFAULT_MAX_BODY_BYTES, declared_content_length
+
+
+class HttpxHttpResponse:
+    def __init__(self, response: httpx.Response, content: bytes) -> None:
+        self._response = response
+        self._content = content
+        self._text: Optional[str] = None
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return charset_from_content_type(self._response.headers.get("Content-Type"))
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = decode_html(self._content, self.encoding)
+        return self._text
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    def raise_for_status(self) -> None:
+        try:
+            self._response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            raise ScraperNetworkError(
+                f"Network error fetching {self._response.url}",
+                cause=exc,
+            ) from exc
+
+
+class HttpxAsyncHttpClient:
+    def __init__(
+        self,
+        *,
+        max_connections: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> None:
+        self.max_body_bytes = max_body_bytes
+        self._client = client or httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _read_body(self, url: str, response: httpx.Response) -> bytes:
+        declared = declared_content_length(response.headers)
+        if declared is not None and declared > self.max_body_bytes:
+            raise ResponseTooLargeError(f"Response from {url} declares {declared} bytes (limit {self.max_body_bytes})")
+
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) > self.max_body_bytes:
+                raise ResponseTooLargeError(f"Response from {url} exceeds {self.max_body_bytes} bytes")
+        return bytes(body)
+
+    async def get(self, url: str, *, headers: Dict[str, str], timeout: int) -> HttpxHttpResponse:
+        try:
+            async with self._client.stream("GET", url, headers=headers, timeout=timeout) as response:
+                content = await self._read_body(url, response)
+        except httpx.TimeoutException as exc:
+            raise ScraperTimeoutError(f"Timed out fetching {url}", cause=exc) from exc
+        except httpx.HTTPError as exc:
+            raise ScraperNetworkError(f"Network error fetching {url}", cause=exc) from exc
+        return HttpxHttpResponse(response, content)
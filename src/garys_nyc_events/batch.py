@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, Pattern, Sequence, TypeVar
+
+from .dates import parse_event_date
+from .keywords import AI_KEYWORD_PATTERN, AI_KEYWORDS, keyword_pattern, keyword_terms
+
+
+EventT = TypeVar("EventT", bound=Mapping[str, Any])
+
+
+class EventBatch(Generic[EventT]):
+    def __init__(self, records: Sequence[EventT]) -> None:
+        self.records: List[EventT] = list(records)
+        self._columns: Dict[str, List[Any]] = {}
+        self._dates: Dict[date, List[Optional[date]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[EventT]:
+        return iter(self.records)
+
+    def _cached(self, name: str, build) -> List[Any]:
+        values = self._columns.get(name)
+        if values is None:
+            values = build()
+            self._columns[name] = values
+        return values
+
+    def column(self, name: str) -> List[Any]:
+        return self._cached(name, lambda: [record.get(name, "") or "" for record in self.records])
+
+    @property
+    def lower_titles(self) -> List[str]:
+        return self._cached("title:lower", lambda: [title.lower() for title in self.column("title")])
+
+    @property
+    def lower_haystacks(self) -> List[str]:
+        def build() -> List[str]:
+            # Reuse lowered titles when a keyword filter already built them;
+            # otherwise one lower() per record beats building three columns.
+            titles = self._columns.get("title:lower")
+            if titles is not None:
+                return [
+                    f"{title} {(record.get('description', '') or '').lower()}"
+                    for title, record in zip(titles, self.records)
+                ]
+            return [
+                f"{record.get('title', '') or ''} {record.get('description', '') or ''}".lower()
+                for record in self.records
+            ]
+
+        return self._cached("haystack:lower", build)
+
+    def parsed_dates(self, anchor: date) -> List[Optional[date]]:
+        parsed = self._dates.get(anchor)
+        if parsed is None:
+            raw_dates = self.column("date")
+            distinct = {raw: parse_event_date(raw, anchor) for raw in set(raw_dates)}
+            parsed = [distinct[raw] for raw in raw_dates]
+            self._dates[anchor] = parsed
+        return parsed
+
+    def take(self, rows: Sequence[int]) -> "EventBatch[EventT]":
+        subset: EventBatch[EventT] = EventBatch([self.records[row] for row in rows])
+        # Carry derived columns over so chained filters never recompute them.
+        for name, values in self._columns.items():
+            subset._columns[name] = [values[row] for row in rows]
+        for anchor, values in self._dates.items():
+            subset._dates[anchor] = [values[row] for row in rows]
+        return subset
+
+    def filter_keyword(self, keyword: str, ai_keywords: Iterable[str] = AI_KEYWORDS) -> "EventBatch[EventT]":
+        terms = keyword_terms(keyword, ai_keywords)
+        if not terms:
+            return self
+        search = keyword_pattern(terms).search
+        return self.take([row for row, title in enumerate(self.lower_titles) if search(title)])
+
+    def filter_ai(self, pattern: Pattern[str] = AI_KEYWORD_PATTERN) -> "EventBatch[EventT]":
+        search = pattern.search
+        return self.take([row for row, haystack in enumerate(self.lower_haystacks) if search(haystack)])
+
+    def filter_date_window(self, start: date, end: date, *, anchor: Optional[date] = None) -> "EventBatch[EventT]":
+        parsed = self.parsed_dates(anchor or start)
+        return self.take([row for row, value in enumerate(parsed) if value is not None and start <= value < end])
+
+    def filter_upcoming_week(self, today: Optional[date] = None) -> "EventBatch[EventT]":
+        anchor = today or date.today()
+        return self.filter_date_window(anchor, anchor + timedelta(days=7))
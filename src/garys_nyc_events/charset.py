@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import codecs
+import re
+from typing import Optional, Union
+
+
+DEFAULT_ENCODING = "utf-8"
+FALLBACK_ENCODING = "windows-1252"
+SNIFF_BYTES = 4096
+
+CONTENT_TYPE_CHARSET_REGEX = re.compile(r"""charset\s*=\s*["']?\s*([A-Za-z0-9._:-]+)""", re.IGNORECASE)
+META_CHARSET_REGEX = re.compile(rb"""<meta[^>]+?charset\s*=\s*["']?\s*([A-Za-z0-9._:-]+)""", re.IGNORECASE)
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+# Browsers treat these labels as windows-1252, a superset that never fails.
+WINDOWS_1252_ALIASES = {"ascii", "latin-1", "iso8859-1", "cp1252"}
+
+
+def _known_codec(label: Optional[str]) -> Optional[str]:
+    if not label:
+        return None
+    try:
+        name = codecs.lookup(label.strip()).name
+    except LookupError:
+        return None
+    return FALLBACK_ENCODING if name in WINDOWS_1252_ALIASES else name
+
+
+def charset_from_content_type(value: Optional[str]) -> Optional[str]:
+    match = CONTENT_TYPE_CHARSET_REGEX.search(value or "")
+    return _known_codec(match.group(1)) if match else None
+
+
+def sniff_meta_charset(content: bytes) -> Optional[str]:
+    match = META_CHARSET_REGEX.search(content[:SNIFF_BYTES])
+    if match is None:
+        return None
+    name = _known_codec(match.group(1).decode("ascii", "ignore"))
+    # A meta tag that could be read as ASCII cannot really be UTF-16.
+    return DEFAULT_ENCODING if name and name.startswith("utf-16") else name
+
+
+def detect_encoding(content: bytes, declared: Optional[str] = None) -> str:
+    for bom, name in BOMS:
+        if content.startswith(bom):
+            return name
+    return _known_codec(declared) or sniff_meta_charset(content) or DEFAULT_ENCODING
+
+
+def decode_html(markup: Union[str, bytes], declared: Optional[str] = None) -> str:
+    if isinstance(markup, str):
+        return markup
+    encoding = detect_encoding(markup, declared)
+    for bom, name in BOMS:
+        if name == encoding and markup.startswith(bom):
+            markup = markup[len(bom) :]
+            break
+    try:
+        return markup.decode(encoding)
+    except UnicodeDecodeError:
+        if encoding == DEFAULT_ENCODING:
+            return markup.decode(FALLBACK_ENCODING, errors="replace")
+        return markup.decode(encoding, errors="replace")
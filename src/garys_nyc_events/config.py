@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import FrozenSet, Optional
+
+from .keywords import AI_KEYWORDS, parse_keywords
 
 
 @dataclass(frozen=True)
@@ -12,13 +14,26 @@ class PipelineConfig:
     scraper_strategy: str = "web"
     scraper_search_term: str = ""
     scraper_limit: int = 0
+    scraper_parser: str = "auto"
+    scraper_layout_cache: str = ""
+    ai_keywords: FrozenSet[str] = AI_KEYWORDS
     db_path: str = "./garys_events.db"
+    sqlite_mmap_size: int = 64 * 1024 * 1024
+    sqlite_cache_size_kib: int = 16 * 1024
+    sqlite_busy_timeout_ms: int = 5000
     retry_attempts: int = 3
     retry_backoff_seconds: float = 5.0
     scraper_dedup_window_days: int = 0
     gemini_api_key: Optional[str] = None
     tagging_enabled: bool = True
     api_token: Optional[str] = None
+    http_max_body_bytes: int = 10 * 1024 * 1024
+    http_cache_dir: str = ""
+    http_cache_max_entries: int = 32
+    http_cache_max_age_seconds: float = 7 * 24 * 3600
+    enrichment_enabled: bool = False
+    enrichment_concurrency: int = 4
+    enrichment_rate_per_second: float = 2.0
 
 
 
@@ -38,6 +53,14 @@ def _env_float(name: str, default: float) -> float:
 
 
 
+def _env_keywords(name: str, default: FrozenSet[str]) -> FrozenSet[str]:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return parse_keywords(value)
+
+
+
 def load_config_from_env() -> PipelineConfig:
     return PipelineConfig(
         cron_schedule=os.getenv("CRON_SCHEDULE", "0 */6 * * *"),
@@ -45,11 +68,24 @@ def load_config_from_env() -> PipelineConfig:
         scraper_strategy=os.getenv("SCRAPER_STRATEGY", "web"),
         scraper_search_term=os.getenv("SCRAPER_SEARCH_TERM", ""),
         scraper_limit=_env_int("SCRAPER_LIMIT", 0),
+        scraper_parser=os.getenv("SCRAPER_PARSER", "auto"),
+        scraper_layout_cache=os.getenv("SCRAPER_LAYOUT_CACHE", ""),
+        ai_keywords=_env_keywords("AI_KEYWORDS", AI_KEYWORDS),
         db_path=os.getenv("DB_PATH", "./garys_events.db"),
+        sqlite_mmap_size=_env_int("SQLITE_MMAP_SIZE", 64 * 1024 * 1024),
+        sqlite_cache_size_kib=_env_int("SQLITE_CACHE_SIZE_KIB", 16 * 1024),
+        sqlite_busy_timeout_ms=_env_int("SQLITE_BUSY_TIMEOUT_MS", 5000),
         retry_attempts=_env_int("RETRY_ATTEMPTS", 3),
         retry_backoff_seconds=_env_float("RETRY_BACKOFF_SECONDS", 5.0),
         scraper_dedup_window_days=_env_int("SCRAPER_DEDUP_WINDOW_DAYS", 0),
         gemini_api_key=os.getenv("GEMINI_API_KEY") or os.getenv("GEMNINI_API_KEY"),
         tagging_enabled=os.getenv("TAGGING_ENABLED", "true").lower() != "false",
         api_token=os.getenv("API_TOKEN"),
+        http_max_body_bytes=_env_int("HTTP_MAX_BODY_BYTES", 10 * 1024 * 1024),
+        http_cache_dir=os.getenv("HTTP_CACHE_DIR", ""),
+        http_cache_max_entries=_env_int("HTTP_CACHE_MAX_ENTRIES", 32),
+        http_cache_max_age_seconds=_env_float("HTTP_CACHE_MAX_AGE_SECONDS", 7 * 24 * 3600),
+        enrichment_enabled=os.getenv("ENRICHMENT_ENABLED", "false").lower() == "true",
+        enrichment_concurrency=_env_int("ENRICHMENT_CONCURRENCY", 4),
+        enrichment_rate_per_second=_env_float("ENRICHMENT_RATE_PER_SECOND", 2.0),
     )
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+
+@dataclass(frozen=True)
+class SQLiteTuning:
+    mmap_size: int = 64 * 1024 * 1024
+    cache_size_kib: int = 16 * 1024
+    busy_timeout_ms: int = 5000
+
+
+class SQLiteConnectionPool:
+    # One writer and one read-only reader per thread, opened lazily and kept
+    # for the pool's lifetime. WAL lets readers run beside a write transaction.
+    def __init__(self, db_path: str, tuning: SQLiteTuning = SQLiteTuning()) -> None:
+        self.db_path = db_path
+        self.tuning = tuning
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: List[sqlite3.Connection] = []
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        timeout = self.tuning.busy_timeout_ms / 1000
+        if read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            connection = sqlite3.connect(uri, uri=True, timeout=timeout, check_same_thread=False)
+        else:
+            connection = sqlite3.connect(self.db_path, timeout=timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+        connection.row_factory = sqlite3.Row
+        connection.execute(f"PRAGMA busy_timeout = {int(self.tuning.busy_timeout_ms)}")
+        connection.execute(f"PRAGMA mmap_size = {int(self.tuning.mmap_size)}")
+        connection.execute(f"PRAGMA cache_size = {-int(self.tuning.cache_size_kib)}")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        connection.execute("PRAGMA foreign_keys = ON")
+        if read_only:
+            connection.execute("PRAGMA query_only = ON")
+        with self._lock:
+            self._opened.append(connection)
+        return connection
+
+    def connection(self, *, read_only: bool = False) -> sqlite3.Connection:
+        slot = "reader" if read_only else "writer"
+        connection = getattr(self._local, slot, None)
+        if connection is None:
+            connection = self._open(read_only)
+            setattr(self._local, slot, connection)
+        return connection
+
+    def close(self) -> None:
+        with self._lock:
+            opened, self._opened = self._opened, []
+            self._local = threading.local()
+        for connection in opened:
+            connection.close()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from .exceptions import ScraperNetworkError
+from .protocols import AsyncHttpClient
+
+
+@dataclass(frozen=True)
+class CrawlResult:
+    url: str
+    text: str = ""
+    error: Optional[ScraperNetworkError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.capacity = float(max(1, burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order.
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self.rate_per_second)
+                self._refill()
+            self._tokens -= 1
+
+
+class AsyncCrawler:
+    def __init__(
+        self,
+        client: AsyncHttpClient,
+        *,
+        rate_per_second: float = 1.0,
+        burst: int = 1,
+        max_concurrency: int = 4,
+    ) -> None:
+        self._client = client
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_concurrency = max(1, max_concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_second, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def _request(self, url: str, *, headers: Dict[str, str], timeout: int) -> CrawlResult:
+        try:
+            response = await self._client.get(url, headers=headers, timeout=timeout)
+            response.raise_for_status()
+        except ScraperNetworkError as exc:
+            return CrawlResult(url=url, error=exc)
+        return CrawlResult(url=url, text=response.text)
+
+    async def fetch(self, url: str, *, headers: Dict[str, str], timeout: int) -> CrawlResult:
+        await self._bucket(url).acquire()
+        return await self._request(url, headers=headers, timeout=timeout)
+
+    async def fetch_all(
+        self,
+        urls: Iterable[str],
+        *,
+        headers: Dict[str, str],
+        timeout: int,
+    ) -> List[CrawlResult]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(url: str) -> CrawlResult:
+            # Take the host token first so a slot is never held while another
+            # host's bucket is refilling.
+            await self._bucket(url).acquire()
+            async with semaphore:
+                return await self._request(url, headers=headers, timeout=timeout)
+
+        unique_urls = list(dict.fromkeys(urls))
+        return list(await asyncio.gather(*(bounded(url) for url in unique_urls)))
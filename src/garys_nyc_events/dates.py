@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from dateutil import parser as date_parser
+
+
+CACHE_SIZE = 4096
+
+_INFO = date_parser.parserinfo()
+MONTHS: Dict[str, int] = {
+    name.lower(): index + 1 for index, names in enumerate(_INFO.MONTHS) for name in names
+}
+WEEKDAYS = frozenset(name.lower() for names in _INFO.WEEKDAYS for name in names)
+
+# The shapes GarysGuide actually prints: "Tue, Mar 3", "Thu Feb 06",
+# "Feb 25, 2026" and ISO "2026-02-27". Anything else goes to dateutil.
+LISTING_DATE_REGEX = re.compile(
+    r"(?:(?P<weekday>[A-Za-z]+)\s*,?\s+)?"
+    r"(?P<month>[A-Za-z]+)\.?\s+(?P<day>\d{1,2})"
+    r"(?:\s*,\s*(?P<year>\d{4}))?"
+)
+ISO_DATE_REGEX = re.compile(r"(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})")
+CLOCK_REGEX = re.compile(
+    r"\b(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?:(?P<meridiem>[ap])\.?m\b)?",
+    re.IGNORECASE,
+)
+
+
+def _build_date(year: int, month: int, day: int) -> date:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        # Let dateutil decide: "Feb 32" reads as a year there, not a miss.
+        raise LookupError((year, month, day)) from None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_known_shape(cleaned: str, anchor_year: int) -> Optional[date]:
+    iso = ISO_DATE_REGEX.fullmatch(cleaned)
+    if iso:
+        return _build_date(int(iso["year"]), int(iso["month"]), int(iso["day"]))
+
+    match = LISTING_DATE_REGEX.fullmatch(cleaned)
+    if match is None:
+        raise LookupError(cleaned)
+    weekday = match["weekday"]
+    month = MONTHS.get(match["month"].lower())
+    if month is None or (weekday is not None and weekday.lower() not in WEEKDAYS):
+        raise LookupError(cleaned)
+    year = int(match["year"]) if match["year"] else anchor_year
+    return _build_date(year, month, int(match["day"]))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_fuzzy(cleaned: str, anchor: date) -> Optional[date]:
+    try:
+        parsed = date_parser.parse(cleaned, fuzzy=True, default=datetime.combine(anchor, time()))
+    except (ValueError, OverflowError):
+        return None
+    return parsed.date()
+
+
+def parse_event_date(value: str, today: date) -> Optional[date]:
+    cleaned = " ".join((value or "").split())
+    if not cleaned:
+        return None
+    # Known shapes only depend on the anchor's year, so they share cache
+    # entries across days; the dateutil fallback can borrow month/day too.
+    try:
+        return _parse_known_shape(cleaned, today.year)
+    except LookupError:
+        return _parse_fuzzy(cleaned, today)
+
+
+def parse_event_time(value: str) -> Optional[time]:
+    for match in CLOCK_REGEX.finditer(value or ""):
+        if match["minute"] is None and match["meridiem"] is None:
+            continue
+        hour, minute = int(match["hour"]), int(match["minute"] or 0)
+        meridiem = (match["meridiem"] or "").lower()
+        if meridiem:
+            if not 1 <= hour <= 12:
+                continue
+            hour = hour % 12 + (12 if meridiem == "p" else 0)
+        if hour < 24 and minute < 60:
+            return time(hour, minute)
+    return None
+
+
+def normalize_event_start(date_value: str, time_value: str, today: date) -> Tuple[str, str]:
+    day = parse_event_date(date_value, today)
+    if day is None:
+        return "", ""
+    start = datetime.combine(day, parse_event_time(time_value) or time())
+    return start.isoformat(timespec="minutes"), day.isoformat()
+
+
+def clear_date_cache() -> None:
+    _parse_known_shape.cache_clear()
+    _parse_fuzzy.cache_clear()
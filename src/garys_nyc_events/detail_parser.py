@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+from bs4 import Tag
+
+from .parsing import AUTO_BACKEND, build_tree
+from .text_scanner import TIME_REGEX
+
+
+MAX_DESCRIPTION_CHARS = 4000
+LOCATION_SELECTORS = [
+    "[itemprop=location]",
+    ".venue",
+    ".location",
+    "[class*=venue]",
+    "[class*=location]",
+    "[class*=address]",
+]
+DESCRIPTION_SELECTORS = [
+    "[itemprop=description]",
+    ".event-description",
+    ".description",
+]
+
+
+def _text(tag: Optional[Tag]) -> str:
+    if tag is None:
+        return ""
+    return " ".join(tag.get_text(" ").split())
+
+
+def _meta_content(soup: Tag, **attrs: str) -> str:
+    tag = soup.find("meta", attrs=attrs)
+    if tag is None:
+        return ""
+    return " ".join(str(tag.get("content", "")).split())
+
+
+def _first_text(soup: Tag, selectors) -> str:
+    for selector in selectors:
+        value = _text(soup.select_one(selector))
+        if value:
+            return value
+    return ""
+
+
+def _format_clock(value: str) -> str:
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    if "T" not in value and " " not in value.strip():
+        return ""
+    return parsed.strftime("%I:%M %p").lstrip("0")
+
+
+def _extract_start_time(soup: Tag) -> str:
+    start = soup.select_one("[itemprop=startDate]")
+    if start is not None:
+        formatted = _format_clock(str(start.get("content") or start.get("datetime") or ""))
+        if formatted:
+            return formatted
+    for tag in soup.find_all("time", datetime=True):
+        formatted = _format_clock(str(tag["datetime"]))
+        if formatted:
+            return formatted
+    match = TIME_REGEX.search(_text(soup.body or soup))
+    return match.group(0).upper() if match else ""
+
+
+def parse_event_detail(raw_html: Union[str, bytes], parser_backend: str = AUTO_BACKEND) -> Dict[str, str]:
+    soup = build_tree(raw_html, parser_backend)
+    description = (
+        _first_text(soup, DESCRIPTION_SELECTORS)
+        or _meta_content(soup, property="og:description")
+        or _meta_content(soup, name="description")
+    )
+    details = {
+        "description": description[:MAX_DESCRIPTION_CHARS],
+        "location": _first_text(soup, LOCATION_SELECTORS),
+        "time": _extract_start_time(soup),
+    }
+    soup.decompose()
+    return details
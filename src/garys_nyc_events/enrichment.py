@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .crawler import AsyncCrawler
+from .dates import parse_event_date
+from .detail_parser import parse_event_detail
+from .models import EnrichedEvent, Event, as_event
+from .parsing import AUTO_BACKEND
+
+
+logger = logging.getLogger("garys_nyc_events.enrichment")
+
+ENRICHED_FIELDS = ("description", "location", "time")
+
+
+def _is_past(event: Mapping[str, Any], today: date) -> bool:
+    parsed = parse_event_date(event.get("date", ""), today)
+    return parsed is not None and parsed < today
+
+
+def merge_details(event: Mapping[str, Any], details: Mapping[str, str], *, enriched_at: str) -> EnrichedEvent:
+    record = as_event(event)
+    updates: Dict[str, Any] = dict(record)
+    updates["enriched_at"] = enriched_at
+    for field in ENRICHED_FIELDS:
+        value = details.get(field, "")
+        if not value:
+            continue
+        # The listing truncates descriptions, so only a longer one is an upgrade.
+        if field == "description" and len(value) < len(getattr(record, field)):
+            continue
+        updates[field] = value
+    return EnrichedEvent(**updates)
+
+
+class DetailEnricher:
+    def __init__(
+        self,
+        crawler: AsyncCrawler,
+        *,
+        headers: Dict[str, str],
+        timeout_seconds: int = 10,
+        parser_backend: str = AUTO_BACKEND,
+    ) -> None:
+        self._crawler = crawler
+        self._headers = headers
+        self.timeout_seconds = timeout_seconds
+        self.parser_backend = parser_backend
+
+    def _needs_fetch(self, event: Mapping[str, Any], known: Optional[Mapping[str, str]], today: date) -> bool:
+        if not event.get("url"):
+            return False
+        return known is None or _is_past(event, today)
+
+    async def enrich(
+        self,
+        events: List[Mapping[str, Any]],
+        known: Optional[Sequence[Optional[Mapping[str, str]]]] = None,
+        *,
+        today: Optional[date] = None,
+    ) -> List[Event]:
+        anchor = today or date.today()
+        previous = list(known) if known is not None else [None] * len(events)
+        enriched: List[Event] = []
+        pending: Dict[str, List[int]] = {}
+
+        for index, event in enumerate(events):
+            stored = previous[index]
+            if self._needs_fetch(event, stored, anchor):
+                pending.setdefault(event["url"], []).append(index)
+                enriched.append(as_event(event))
+            elif stored is not None:
+                enriched.append(merge_details(event, stored, enriched_at=stored.get("enriched_at", "")))
+            else:
+                enriched.append(as_event(event))
+
+        if not pending:
+            return enriched
+
+        results = await self._crawler.fetch_all(
+            list(pending),
+            headers=self._headers,
+            timeout=self.timeout_seconds,
+        )
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        for result in results:
+            if result.error is not None:
+                logger.warning("Detail fetch failed for %s: %s", result.url, result.error)
+                continue
+            details = parse_event_detail(result.text, self.parser_backend)
+            for index in pending[result.url]:
+                enriched[index] = merge_details(enriched[index], details, enriched_at=fetched_at)
+        return enriched
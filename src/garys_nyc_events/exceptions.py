@@ -17,6 +17,10 @@ class ScraperTimeoutError(ScraperNetworkError):
     pass
 
 
+class ResponseTooLargeError(ScraperNetworkError):
+    pass
+
+
 class ScraperParseError(GarysGuideError):
     pass
 
@@ -1,61 +1,40 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Iterable, List, Mapping, Optional, TypeVar
 
-from dateutil import parser as date_parser
+from .dates import parse_event_date
+from .keywords import AI_KEYWORDS, keyword_pattern, keyword_terms
 
 
-AI_KEYWORDS = frozenset(
-    {
-        "ai",
-        "artificial intelligence",
-        "machine learning",
-        "ml",
-        "llm",
-        "deep learning",
-        "generative ai",
-        "gpt",
-        "nlp",
-        "data science",
-        "neural network",
-        "robotics",
-        "computer vision",
-    }
-)
+EventT = TypeVar("EventT", bound=Mapping[str, Any])
 
 
 def filter_events_by_keyword(
-    events: List[Dict[str, str]],
+    events: List[EventT],
     keyword: str,
-) -> List[Dict[str, str]]:
-    needle = keyword.lower().strip()
-    if not needle:
+    ai_keywords: Iterable[str] = AI_KEYWORDS,
+) -> List[EventT]:
+    terms = keyword_terms(keyword, ai_keywords)
+    if not terms:
         return events
-    return [event for event in events if needle in event.get("title", "").lower()]
+    search = keyword_pattern(terms).search
+    return [event for event in events if search(event.get("title", "").lower())]
 
 
-def _parse_event_date(value: str, today: date) -> Optional[date]:
-    cleaned = value.strip()
-    if not cleaned:
-        return None
-    try:
-        parsed = date_parser.parse(cleaned, fuzzy=True, default=date_parser.parse(str(today)))
-    except (ValueError, OverflowError):
-        return None
-    return parsed.date()
+_parse_event_date = parse_event_date
 
 
 def filter_events_upcoming_week(
-    events: List[Dict[str, str]],
+    events: List[EventT],
     today: Optional[date] = None,
-) -> List[Dict[str, str]]:
+) -> List[EventT]:
     anchor = today or date.today()
     end = anchor + timedelta(days=7)
-    filtered: List[Dict[str, str]] = []
+    filtered: List[EventT] = []
 
     for event in events:
-        parsed_date = _parse_event_date(event.get("date", ""), anchor)
+        parsed_date = parse_event_date(event.get("date", ""), anchor)
         if parsed_date is None:
             continue
         if anchor <= parsed_date < end:
@@ -63,12 +42,12 @@ def filter_events_upcoming_week(
     return filtered
 
 
-def filter_ai_events(events: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    filtered: List[Dict[str, str]] = []
+def filter_ai_events(events: List[EventT], keywords: Iterable[str] = AI_KEYWORDS) -> List[EventT]:
+    search = keyword_pattern(keywords).search
+    filtered: List[EventT] = []
     for event in events:
         title = event.get("title", "").lower()
         description = event.get("description", "").lower()
-        haystack = f"{title} {description}"
-        if any(keyword in haystack for keyword in AI_KEYWORDS):
+        if search(f"{title} {description}"):
             filtered.append(event)
     return filtered
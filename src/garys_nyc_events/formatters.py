@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List
+from typing import Any, List, Mapping
 
 from .filters import filter_events_by_keyword
+from .models import event_to_dict
 
 
-def get_events_ai_json(events: List[Dict[str, str]], keyword: str = "AI") -> str:
+def get_events_ai_json(events: List[Mapping[str, Any]], keyword: str = "AI") -> str:
     ai_events = filter_events_by_keyword(events, keyword)
-    return json.dumps(ai_events, ensure_ascii=False, indent=2)
+    return json.dumps([event_to_dict(event) for event in ai_events], ensure_ascii=False, indent=2)
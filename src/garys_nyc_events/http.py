@@ -1,19 +1,67 @@
 from __future__ import annotations
 
-from typing import Dict
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Mapping, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 
-from .exceptions import ScraperNetworkError, ScraperTimeoutError
+from .charset import charset_from_content_type, decode_html
+from .exceptions import ResponseTooLargeError, ScraperNetworkError, ScraperTimeoutError
+
+
+# Only advertise encodings urllib3 can decode here (br/zstd need their extras).
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+CHUNK_BYTES = 64 * 1024
+
+
+def declared_content_length(headers: Mapping[str, str]) -> Optional[int]:
+    try:
+        return int(headers.get("Content-Length", ""))
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    url: str
+    status_code: int
+    ttfb_seconds: float
+    total_seconds: float
+    body_bytes: int
 
 
 class RequestsHttpResponse:
-    def __init__(self, response: requests.Response) -> None:
+    def __init__(self, response: requests.Response, content: bytes) -> None:
         self._response = response
+        self._content = content
+        self._text: Optional[str] = None
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return charset_from_content_type(self._response.headers.get("Content-Type"))
 
     @property
     def text(self) -> str:
-        return self._response.text
+        if self._text is None:
+            self._text = decode_html(self._content, self.encoding)
+        return self._text
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
 
     def raise_for_status(self) -> None:
         try:
@@ -26,10 +74,68 @@ class RequestsHttpResponse:
 
 
 class RequestsHttpClient:
+    def __init__(
+        self,
+        *,
+        pool_size: int = 10,
+        session: Optional[requests.Session] = None,
+        timing_history: int = 100,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> None:
+        self._session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(
+            {
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+            }
+        )
+        self.timings: Deque[RequestTiming] = deque(maxlen=timing_history)
+        self.max_body_bytes = max_body_bytes
+
+    @property
+    def last_timing(self) -> Optional[RequestTiming]:
+        return self.timings[-1] if self.timings else None
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _record_timing(self, url: str, response: requests.Response, started: float, body_bytes: int) -> None:
+        elapsed = getattr(response, "elapsed", None)
+        self.timings.append(
+            RequestTiming(
+                url=url,
+                status_code=int(getattr(response, "status_code", 0) or 0),
+                ttfb_seconds=elapsed.total_seconds() if elapsed is not None else 0.0,
+                total_seconds=time.perf_counter() - started,
+                body_bytes=body_bytes,
+            )
+        )
+
+    def _read_body(self, url: str, response: requests.Response) -> bytes:
+        declared = declared_content_length(response.headers)
+        if declared is not None and declared > self.max_body_bytes:
+            raise ResponseTooLargeError(f"Response from {url} declares {declared} bytes (limit {self.max_body_bytes})")
+
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=CHUNK_BYTES):
+            body.extend(chunk)
+            if len(body) > self.max_body_bytes:
+                raise ResponseTooLargeError(f"Response from {url} exceeds {self.max_body_bytes} bytes")
+        return bytes(body)
+
     def get(self, url: str, *, headers: Dict[str, str], timeout: int) -> RequestsHttpResponse:
+        started = time.perf_counter()
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            return RequestsHttpResponse(response)
+            response = self._session.get(url, headers=headers, timeout=timeout, stream=True)
+            try:
+                content = self._read_body(url, response)
+            finally:
+                response.close()
+            self._record_timing(url, response, started, len(content))
+            return RequestsHttpResponse(response, content)
         except requests.Timeout as exc:
             raise ScraperTimeoutError(f"Timed out fetching {url}", cause=exc) from exc
         except requests.RequestException as exc:
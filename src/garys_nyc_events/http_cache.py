@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .protocols import HttpClient, HttpResponse
+
+
+logger = logging.getLogger("garys_nyc_events.http_cache")
+
+NOT_MODIFIED = 304
+
+
+class CachedHttpResponse:
+    def __init__(self, text: str, headers: Mapping[str, str], *, not_modified: bool) -> None:
+        self._text = text
+        self.headers = dict(headers)
+        self.status_code = 200
+        self.not_modified = not_modified
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def content(self) -> bytes:
+        return self._text.encode("utf-8")
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return "utf-8"
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class CachingHttpClient:
+    def __init__(
+        self,
+        inner: HttpClient,
+        cache_dir: str,
+        *,
+        max_entries: int = 32,
+        max_bytes: int = 50 * 1024 * 1024,
+        max_age_seconds: float = 7 * 24 * 3600,
+    ) -> None:
+        self._inner = inner
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+    def _entry_path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _load(self, url: str) -> Optional[Dict[str, object]]:
+        path = self._entry_path(url)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Discarding unreadable cache entry for %s", url)
+            path.unlink(missing_ok=True)
+            return None
+
+        if time.time() - float(entry.get("stored_at", 0)) > self.max_age_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _store(self, url: str, response: HttpResponse) -> None:
+        headers = getattr(response, "headers", None) or {}
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "body": response.text,
+        }
+        path = self._entry_path(url)
+        staging = path.with_suffix(".tmp")
+        try:
+            staging.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(staging, path)
+        except OSError as exc:
+            logger.warning("Could not write cache entry for %s: %s", url, exc)
+            return
+        self._evict()
+
+    def _touch(self, url: str) -> None:
+        try:
+            os.utime(self._entry_path(url))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Least recently used first: hits refresh the file mtime.
+        entries.sort()
+        total_bytes = sum(size for _mtime, size, _path in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _mtime, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def _conditional_headers(self, headers: Dict[str, str], entry: Mapping[str, object]) -> Dict[str, str]:
+        conditional = dict(headers)
+        if entry.get("etag"):
+            conditional["If-None-Match"] = str(entry["etag"])
+        if entry.get("last_modified"):
+            conditional["If-Modified-Since"] = str(entry["last_modified"])
+        return conditional
+
+    def get(self, url: str, *, headers: Dict[str, str], timeout: int) -> HttpResponse:
+        entry = self._load(url)
+        request_headers = self._conditional_headers(headers, entry) if entry else headers
+        response = self._inner.get(url, headers=request_headers, timeout=timeout)
+
+        if entry is not None and getattr(response, "status_code", None) == NOT_MODIFIED:
+            self._touch(url)
+            return CachedHttpResponse(
+                str(entry.get("body", "")),
+                {"ETag": str(entry.get("etag", "")), "Last-Modified": str(entry.get("last_modified", ""))},
+                not_modified=True,
+            )
+
+        if getattr(response, "status_code", 200) == 200:
+            self._store(url, response)
+        return response
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Pattern
+
+
+AI_KEYWORDS = frozenset(
+    {
+        "ai",
+        "genai",
+        "openai",
+        "chatgpt",
+        "artificial intelligence",
+        "machine learning",
+        "ml",
+        "llm",
+        "llms",
+        "deep learning",
+        "generative ai",
+        "gpt",
+        "nlp",
+        "data science",
+        "neural network",
+        "robotics",
+        "computer vision",
+    }
+)
+
+NEVER_MATCHES = re.compile(r"(?!)")
+
+
+@lru_cache(maxsize=64)
+def _compile(keywords: FrozenSet[str]) -> Pattern[str]:
+    if not keywords:
+        return NEVER_MATCHES
+    # Longest first so "generative ai" wins over "ai"; lookarounds instead of
+    # \b keep keywords that start or end with punctuation ("c++") matchable.
+    # An optional trailing "s" admits plurals ("LLMs", "GPTs").
+    ordered = sorted(keywords, key=lambda keyword: (-len(keyword), keyword))
+    alternation = "|".join(re.escape(keyword) for keyword in ordered)
+    return re.compile(rf"(?<!\w)(?:{alternation})s?(?!\w)")
+
+
+def keyword_pattern(keywords: Iterable[str]) -> Pattern[str]:
+    return _compile(frozenset(keyword.lower().strip() for keyword in keywords if keyword and keyword.strip()))
+
+
+def keyword_terms(keyword: str, ai_keywords: Iterable[str] = AI_KEYWORDS) -> FrozenSet[str]:
+    # "ai" as a search term stands for the whole AI vocabulary, so compound
+    # titles such as "GenAI Summit" or "OpenAI DevDay" still match it.
+    needle = keyword.lower().strip()
+    if not needle:
+        return frozenset()
+    if needle == "ai":
+        return frozenset(ai_keywords) | {needle}
+    return frozenset({needle})
+
+
+def parse_keywords(value: str) -> FrozenSet[str]:
+    return frozenset(token.strip().lower() for token in value.split(",") if token.strip())
+
+
+AI_KEYWORD_PATTERN = keyword_pattern(AI_KEYWORDS)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bs4 import Tag
+
+
+logger = logging.getLogger("garys_nyc_events.layout")
+
+NodePath = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class LayoutPlan:
+    fingerprint: str
+    row_path: NodePath
+
+
+def node_signature(node: Tag) -> str:
+    classes = node.get("class") or []
+    return ".".join([node.name, *sorted(classes)])
+
+
+class NodePaths:
+    def __init__(self) -> None:
+        self._paths: Dict[int, Tuple[Tag, NodePath]] = {}
+
+    def path(self, node: Tag) -> NodePath:
+        # Climb only until an already-known ancestor, so sibling rows share
+        # the work of signing the table above them.
+        pending: List[Tag] = []
+        prefix: NodePath = ()
+        current: Optional[Tag] = node
+        while current is not None and current.parent is not None:
+            cached = self._paths.get(id(current))
+            if cached is not None:
+                prefix = cached[1]
+                break
+            pending.append(current)
+            current = current.parent
+        for item in reversed(pending):
+            prefix = (*prefix, node_signature(item))
+            self._paths[id(item)] = (item, prefix)
+        return prefix
+
+
+def skeleton_anchor(link: Tag) -> Tag:
+    tables = link.find_parents("table")
+    return tables[-1] if tables else link.parent
+
+
+def select_path(root: Tag, path: NodePath) -> List[Tag]:
+    level = [root]
+    for signature in path:
+        name = signature.split(".", 1)[0]
+        level = [
+            child
+            for node in level
+            for child in node.find_all(name, recursive=False)
+            if node_signature(child) == signature
+        ]
+        if not level:
+            break
+    return level
+
+
+def structure_fingerprint(paths: Iterable[NodePath]) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(set(paths)):
+        digest.update("/".join(path).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+def learn_plan(fingerprint: str, row_paths: Iterable[NodePath], *, min_rows: int = 2) -> Optional[LayoutPlan]:
+    counts = Counter(row_paths)
+    if not counts:
+        return None
+    row_path, count = counts.most_common(1)[0]
+    if count < min_rows:
+        return None
+    return LayoutPlan(fingerprint=fingerprint, row_path=row_path)
+
+
+class LayoutPlanCache:
+    def __init__(self, path: Optional[str] = None, *, max_entries: int = 16) -> None:
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[str, LayoutPlan]" = OrderedDict()
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable layout plan cache at %s", self.path)
+            return
+        for fingerprint, row_path in raw.items():
+            self._plans[fingerprint] = LayoutPlan(fingerprint=fingerprint, row_path=tuple(row_path))
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        payload = {plan.fingerprint: list(plan.row_path) for plan in self._plans.values()}
+        staging = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(staging, self.path)
+        except OSError as exc:
+            logger.warning("Could not write layout plan cache at %s: %s", self.path, exc)
+
+    def get(self, fingerprint: str) -> Optional[LayoutPlan]:
+        plan = self._plans.get(fingerprint)
+        if plan is not None:
+            self._plans.move_to_end(fingerprint)
+        return plan
+
+    def put(self, plan: LayoutPlan) -> None:
+        if self._plans.get(plan.fingerprint) == plan:
+            return
+        self._plans[plan.fingerprint] = plan
+        self._plans.move_to_end(plan.fingerprint)
+        while len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+        self._save()
+
+    def discard(self, fingerprint: str) -> None:
+        if self._plans.pop(fingerprint, None) is not None:
+            self._save()
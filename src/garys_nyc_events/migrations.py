@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from datetime import date
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .dates import normalize_event_start
+
+
+logger = logging.getLogger("garys_nyc_events.migrations")
+
+WEEKLY_WINDOW_KEY = "weekly_window_start"
+
+BASE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    search_term TEXT,
+    record_limit INTEGER,
+    status TEXT NOT NULL CHECK(status IN ('success', 'partial', 'failure')),
+    fetched_count INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    error TEXT,
+    page_hash TEXT NOT NULL DEFAULT '',
+    event_set_hash TEXT NOT NULL DEFAULT '',
+    unchanged INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS "all events" (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    canonical_key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    url TEXT,
+    description TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    price TEXT,
+    event_date TEXT,
+    event_time TEXT,
+    event_location TEXT,
+    event_start TEXT,
+    event_day TEXT,
+    date_found TEXT,
+    enriched_at TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS weekly_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    all_event_id INTEGER NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    url TEXT,
+    description TEXT,
+    tags TEXT,
+    price TEXT,
+    event_date TEXT,
+    event_time TEXT,
+    event_location TEXT,
+    event_start TEXT,
+    event_day TEXT,
+    date_found TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(all_event_id) REFERENCES "all events"(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_runs_fetched_at ON runs(fetched_at);
+CREATE INDEX IF NOT EXISTS idx_all_events_canonical_key ON "all events"(canonical_key);
+CREATE INDEX IF NOT EXISTS idx_weekly_events_date ON weekly_events(event_date);
+"""
+
+# Databases created before versioning may predate these columns; CREATE TABLE
+# IF NOT EXISTS leaves them untouched, so migration 2 adds what is missing.
+ADDED_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    "runs": [
+        ("page_hash", "TEXT NOT NULL DEFAULT ''"),
+        ("event_set_hash", "TEXT NOT NULL DEFAULT ''"),
+        ("unchanged", "INTEGER NOT NULL DEFAULT 0"),
+    ],
+    '"all events"': [
+        ("enriched_at", "TEXT NOT NULL DEFAULT ''"),
+        ("event_start", "TEXT"),
+        ("event_day", "TEXT"),
+    ],
+    "weekly_events": [
+        ("event_start", "TEXT"),
+        ("event_day", "TEXT"),
+    ],
+}
+
+CHANGE_TRACKING_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    "runs": [
+        ("inserted_count", "INTEGER NOT NULL DEFAULT 0"),
+        ("updated_count", "INTEGER NOT NULL DEFAULT 0"),
+        ("unchanged_count", "INTEGER NOT NULL DEFAULT 0"),
+    ],
+    '"all events"': [
+        ("content_hash", "TEXT NOT NULL DEFAULT ''"),
+    ],
+}
+
+# Which events each run saw, and in what state. WITHOUT ROWID keeps the
+# (run_id, all_event_id) key as the table itself, so per-run lookups are
+# primary-key range scans.
+RUN_EVENTS_SQL = """
+CREATE TABLE IF NOT EXISTS run_events (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    all_event_id INTEGER NOT NULL REFERENCES "all events"(id) ON DELETE CASCADE,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (run_id, all_event_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_run_events_all_event ON run_events(all_event_id);
+"""
+
+ADDED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_all_events_event_day ON "all events"(event_day);
+CREATE INDEX IF NOT EXISTS idx_weekly_events_start ON weekly_events(event_start);
+"""
+
+# External-content FTS5 index over "all events"; the triggers keep it in step
+# with every insert, upsert and delete. bm25 weights favour the event name.
+SEARCH_SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    name,
+    description,
+    event_location,
+    tags,
+    content='all events',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS all_events_fts_insert AFTER INSERT ON "all events" BEGIN
+    INSERT INTO events_fts(rowid, name, description, event_location, tags)
+    VALUES (new.id, new.name, new.description, new.event_location, new.tags);
+END;
+
+CREATE TRIGGER IF NOT EXISTS all_events_fts_delete AFTER DELETE ON "all events" BEGIN
+    INSERT INTO events_fts(events_fts, rowid, name, description, event_location, tags)
+    VALUES ('delete', old.id, old.name, old.description, old.event_location, old.tags);
+END;
+
+CREATE TRIGGER IF NOT EXISTS all_events_fts_update
+AFTER UPDATE OF name, description, event_location, tags ON "all events" BEGIN
+    INSERT INTO events_fts(events_fts, rowid, name, description, event_location, tags)
+    VALUES ('delete', old.id, old.name, old.description, old.event_location, old.tags);
+    INSERT INTO events_fts(rowid, name, description, event_location, tags)
+    VALUES (new.id, new.name, new.description, new.event_location, new.tags);
+END;
+"""
+
+SEARCH_RANK = "bm25(10.0, 1.0, 2.0, 4.0)"
+
+
+def _statements(script: str) -> Iterator[str]:
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            if buffer.strip():
+                yield buffer
+            buffer = ""
+
+
+def _run_script(conn: sqlite3.Connection, script: str) -> None:
+    # executescript() would commit the migration's transaction midway.
+    for statement in _statements(script):
+        conn.execute(statement)
+
+
+def _date_found_day(value: Optional[str]) -> Optional[date]:
+    try:
+        return date.fromisoformat((value or "")[:10])
+    except ValueError:
+        return None
+
+
+def create_base_schema(conn: sqlite3.Connection) -> None:
+    _run_script(conn, BASE_SCHEMA_SQL)
+
+
+def _add_columns(conn: sqlite3.Connection, added: Dict[str, List[Tuple[str, str]]]) -> None:
+    for table, columns in added.items():
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for name, definition in columns:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+
+def add_missing_columns(conn: sqlite3.Connection) -> None:
+    _add_columns(conn, ADDED_COLUMNS)
+
+
+def add_change_tracking(conn: sqlite3.Connection) -> None:
+    # Existing rows keep an empty hash, so their first upsert counts as an update.
+    _add_columns(conn, CHANGE_TRACKING_COLUMNS)
+
+
+def create_run_observations(conn: sqlite3.Connection) -> None:
+    _run_script(conn, RUN_EVENTS_SQL)
+
+
+def backfill_event_start(conn: sqlite3.Connection) -> None:
+    _run_script(conn, ADDED_INDEXES)
+    # Unparseable dates are stored as '' so only genuinely new rows are NULL.
+    rows = conn.execute(
+        'SELECT id, event_date, event_time, date_found FROM "all events" WHERE event_day IS NULL'
+    ).fetchall()
+    updates = []
+    for row_id, event_date, event_time, date_found in rows:
+        anchor = _date_found_day(date_found) or date.today()
+        start, day = normalize_event_start(event_date or "", event_time or "", anchor)
+        updates.append((start, day, row_id))
+    conn.executemany('UPDATE "all events" SET event_start = ?, event_day = ? WHERE id = ?', updates)
+    if updates:
+        conn.execute("DELETE FROM store_meta WHERE key = ?", (WEEKLY_WINDOW_KEY,))
+    conn.execute(
+        """
+        UPDATE weekly_events
+        SET event_start = (SELECT a.event_start FROM "all events" a WHERE a.id = weekly_events.all_event_id),
+            event_day = (SELECT a.event_day FROM "all events" a WHERE a.id = weekly_events.all_event_id)
+        WHERE event_day IS NULL
+        """
+    )
+
+
+def create_search_index(conn: sqlite3.Connection) -> None:
+    _run_script(conn, SEARCH_SCHEMA_SQL)
+    conn.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+    conn.execute("INSERT INTO events_fts(events_fts, rank) VALUES ('rank', ?)", (SEARCH_RANK,))
+
+
+# Ordered and append-only: each step must be safe to run against databases
+# that were created by the old unversioned init_schema.
+MIGRATIONS: Tuple[Tuple[int, Callable[[sqlite3.Connection], None]], ...] = (
+    (1, create_base_schema),
+    (2, add_missing_columns),
+    (3, backfill_event_start),
+    (4, create_search_index),
+    (5, add_change_tracking),
+    (6, create_run_observations),
+)
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(conn: sqlite3.Connection) -> List[int]:
+    applied: List[int] = []
+    if schema_version(conn) >= SCHEMA_VERSION:
+        return applied
+    for version, step in MIGRATIONS:
+        # BEGIN IMMEDIATE serialises concurrent migrators (API and cron);
+        # the version is re-read under the lock so a step never runs twice.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if schema_version(conn) < version:
+                step(conn)
+                conn.execute(f"PRAGMA user_version = {version}")
+                applied.append(version)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    if applied:
+        logger.info("Applied schema migrations %s", applied)
+    return applied
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, Tuple
 
 
-@dataclass(frozen=True)
-class Event:
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    names = tuple(item.name for item in fields(cls))
+    return names, frozenset(names)
+
+
+@dataclass(frozen=True, slots=True)
+class Event(Mapping[str, Any]):
     title: str
     date: str
     price: str
@@ -14,4 +22,44 @@ class Event:
     time: str = ""
     location: str = ""
     description: str = ""
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.tags, tuple):
+            object.__setattr__(self, "tags", tuple(self.tags or ()))
+
+    # Read-only mapping access keeps event["title"] / event.get(...) callers
+    # working without materializing a dict per event.
+    def __getitem__(self, key: str) -> Any:
+        if key not in _field_names(type(self))[1]:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_field_names(type(self))[0])
+
+    def __len__(self) -> int:
+        return len(_field_names(type(self))[0])
+
+
+@dataclass(frozen=True, slots=True)
+class EnrichedEvent(Event):
+    enriched_at: str = ""
+
+
+def as_event(record: Mapping[str, Any]) -> Event:
+    if isinstance(record, Event):
+        return record
+    cls = EnrichedEvent if record.get("enriched_at") else Event
+    names = _field_names(cls)[0]
+    values = {name: record[name] for name in names if record.get(name) is not None}
+    for name in ("title", "date", "price", "url", "source"):
+        values.setdefault(name, "")
+    return cls(**values)
+
+
+def event_to_dict(record: Mapping[str, Any]) -> Dict[str, Any]:
+    values = dict(record)
+    if isinstance(record, Event):
+        values["tags"] = list(record.tags)
+    return values
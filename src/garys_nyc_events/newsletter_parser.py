@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Dict, List
+from typing import List, Union
 
 from bs4 import BeautifulSoup
 
+from .charset import decode_html
 from .models import Event
 
 
-def parse_newsletter_html(raw_html: str) -> List[Dict[str, str]]:
-    soup = BeautifulSoup(raw_html, "html.parser")
+def parse_newsletter_html(raw_html: Union[str, bytes]) -> List[Event]:
+    soup = BeautifulSoup(decode_html(raw_html), "html.parser")
     events: List[Event] = []
 
     ignore_tokens = [
@@ -45,4 +45,4 @@ def parse_newsletter_html(raw_html: str) -> List[Dict[str, str]]:
         )
 
     unique = {(e.title, e.url): e for e in events}
-    return [asdict(event) for event in unique.values()]
+    return list(unique.values())
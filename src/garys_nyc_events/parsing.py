@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import re
+from typing import List, Optional, Pattern, Tuple, Union
+
+from bs4 import BeautifulSoup
+
+from .charset import decode_html
+
+
+logger = logging.getLogger("garys_nyc_events.parsing")
+
+AUTO_BACKEND = "auto"
+LXML_BACKEND = "lxml"
+FALLBACK_BACKEND = "html.parser"
+PARSER_BACKENDS = (AUTO_BACKEND, LXML_BACKEND, FALLBACK_BACKEND)
+
+TABLE_TAG_REGEX = re.compile(r"<(/?)table\b", re.IGNORECASE)
+
+
+def lxml_available() -> bool:
+    return importlib.util.find_spec("lxml") is not None
+
+
+def resolve_parser_backend(name: str = AUTO_BACKEND) -> str:
+    choice = (name or AUTO_BACKEND).strip().lower()
+    if choice not in PARSER_BACKENDS:
+        raise ValueError(f"Unsupported parser backend: {name}")
+    if choice == FALLBACK_BACKEND:
+        return FALLBACK_BACKEND
+    if lxml_available():
+        return LXML_BACKEND
+    if choice == LXML_BACKEND:
+        logger.warning("lxml is not installed; falling back to %s", FALLBACK_BACKEND)
+    return FALLBACK_BACKEND
+
+
+def build_tree(markup: Union[str, bytes], backend: str = AUTO_BACKEND) -> BeautifulSoup:
+    # Decode bytes here so BeautifulSoup never runs its slower encoding detection.
+    return BeautifulSoup(decode_html(markup), resolve_parser_backend(backend))
+
+
+def _top_level_tables(markup: str) -> Optional[List[Tuple[int, int]]]:
+    spans: List[Tuple[int, int]] = []
+    depth = 0
+    start = 0
+    for match in TABLE_TAG_REGEX.finditer(markup):
+        if not match.group(1):
+            if depth == 0:
+                start = match.start()
+            depth += 1
+            continue
+        if depth == 0:
+            return None
+        depth -= 1
+        if depth == 0:
+            end = markup.find(">", match.end())
+            if end == -1:
+                return None
+            spans.append((start, end + 1))
+    return spans if depth == 0 else None
+
+
+def _enclosing(spans: List[Tuple[int, int]], position: int) -> Optional[Tuple[int, int]]:
+    for start, end in spans:
+        if start <= position < end:
+            return start, end
+    return None
+
+
+def slice_table_region(markup: str, anchor: Pattern[str]) -> Optional[str]:
+    anchors = [match.start() for match in anchor.finditer(markup)]
+    if not anchors:
+        return None
+    spans = _top_level_tables(markup)
+    if not spans:
+        return None
+
+    # Whole top-level tables only: an event row can sit several tables above
+    # the link it holds, so cutting at the innermost table would lose it.
+    first = _enclosing(spans, anchors[0])
+    last = _enclosing(spans, anchors[-1])
+    if first is None or last is None:
+        return None
+    return markup[first[0] : last[1]]
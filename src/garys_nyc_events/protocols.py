@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Protocol, runtime_checkable
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Protocol, runtime_checkable
+
+from .models import Event
 
 
 @runtime_checkable
@@ -28,7 +31,16 @@ class RunRecordLike(Protocol):
 
 @runtime_checkable
 class EventScraper(Protocol):
-    def get_events(self) -> List[Dict[str, str]]:
+    def get_events(self) -> List[Event]:
+        ...
+
+
+@runtime_checkable
+class ListingScraper(Protocol):
+    def fetch_listing(self) -> str:
+        ...
+
+    def parse_events_iter(self, html: str) -> Iterator[Event]:
         ...
 
 
@@ -47,11 +59,18 @@ class EventStore(Protocol):
         status: str,
         attempts: int,
         error: str,
-        events: Iterable[Dict[str, str]],
+        events: Iterable[Mapping[str, Any]],
     ) -> RunRecordLike:
         ...
 
-    def fetch_events(self, *, limit: int = 0, ai_only: bool = False) -> List[Dict[str, str]]:
+    def fetch_events(
+        self,
+        *,
+        limit: int = 0,
+        ai_only: bool = False,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[Dict[str, str]]:
         ...
 
 
@@ -61,6 +80,14 @@ class HttpResponse(Protocol):
     def text(self) -> str:
         ...
 
+    @property
+    def content(self) -> bytes:
+        ...
+
+    @property
+    def encoding(self) -> Optional[str]:
+        ...
+
     def raise_for_status(self) -> None:
         ...
 
@@ -75,3 +102,15 @@ class HttpClient(Protocol):
         timeout: int,
     ) -> HttpResponse:
         ...
+
+
+@runtime_checkable
+class AsyncHttpClient(Protocol):
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        timeout: int,
+    ) -> HttpResponse:
+        ...
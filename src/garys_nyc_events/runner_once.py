@@ -1,29 +1,52 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import time
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence
 
 from .config import PipelineConfig, load_config_from_env
 from .exceptions import ScraperNetworkError
-from .filters import filter_ai_events, filter_events_by_keyword, filter_events_upcoming_week
-from .protocols import EventScraper, EventStore
+from .filters import filter_events_by_keyword
+from .batch import EventBatch
+from .keywords import keyword_pattern
+from .models import Event, as_event, event_to_dict
+from .protocols import EventScraper, EventStore, HttpClient, ListingScraper
 from .scheduler import backoff_seconds, is_transient_error as scheduler_is_transient_error
 from .tagger import GeminiTagger
 
+if TYPE_CHECKING:
+    from .storage import SQLiteEventStore
+
 
 logger = logging.getLogger("garys_nyc_events.runner")
 
 
 class PartialScrapeError(Exception):
-    def __init__(self, message: str, partial_events: Optional[List[Dict[str, str]]] = None) -> None:
+    def __init__(self, message: str, partial_events: Optional[Sequence[Mapping[str, Any]]] = None) -> None:
         super().__init__(message)
         self.partial_events = partial_events or []
 
 
+class UnchangedScrapeError(Exception):
+    pass
+
+
+@dataclass
+class RunFingerprint:
+    previous_run_id: Optional[int] = None
+    previous_page_hash: str = ""
+    previous_event_set_hash: str = ""
+    page_hash: str = ""
+    event_set_hash: str = ""
+
+
 @dataclass(frozen=True)
 class RunSummary:
     run_id: int
@@ -32,6 +55,10 @@ class RunSummary:
     attempts: int
     fetched_count: int
     error: str
+    unchanged: bool = False
+    inserted_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
 
 
 
@@ -40,38 +67,171 @@ def is_transient_error(exc: Exception) -> bool:
 
 
 
-def _default_scraper(_config: PipelineConfig) -> EventScraper:
+def _default_http_client(config: PipelineConfig) -> HttpClient:
+    from .http import RequestsHttpClient
+
+    client: HttpClient = RequestsHttpClient(max_body_bytes=config.http_max_body_bytes)
+    if config.http_cache_dir:
+        from .http_cache import CachingHttpClient
+
+        client = CachingHttpClient(
+            client,
+            config.http_cache_dir,
+            max_entries=config.http_cache_max_entries,
+            max_age_seconds=config.http_cache_max_age_seconds,
+        )
+    return client
+
+
+
+def _default_scraper(config: PipelineConfig) -> EventScraper:
+    from .layout import LayoutPlanCache
     from .scraper import GarysGuideScraper
 
-    return GarysGuideScraper()
+    return GarysGuideScraper(
+        http_client=_default_http_client(config),
+        parser_backend=config.scraper_parser,
+        layout_cache=LayoutPlanCache(config.scraper_layout_cache or None),
+    )
+
+
+
+def _today() -> date:
+    return date.today()
+
+
+
+def _ai_only(config: PipelineConfig) -> bool:
+    return config.scraper_search_term.strip().lower() == "ai"
+
+
+
+def _pipeline_salt(config: PipelineConfig, today: date) -> str:
+    # Everything between the raw page and the stored rows that is not in the
+    # page itself, so a hash match really means the run would be a no-op.
+    ai_only = _ai_only(config)
+    settings = {
+        "search_term": config.scraper_search_term,
+        "limit": config.scraper_limit,
+        "parser": config.scraper_parser,
+        "ai_keywords": sorted(config.ai_keywords) if ai_only else [],
+        "week_anchor": today.isoformat() if ai_only else "",
+        "anchor_year": today.year,
+        "enrichment": [
+            config.enrichment_enabled,
+            config.enrichment_concurrency,
+            config.enrichment_rate_per_second,
+        ],
+        "tagging": config.tagging_enabled and bool(config.gemini_api_key),
+    }
+    return json.dumps(settings, sort_keys=True) + "\n"
+
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
 
 
+def _event_set_hash(config: PipelineConfig, events: List[Event], today: date) -> str:
+    encoded = sorted(json.dumps(event_to_dict(event), sort_keys=True, ensure_ascii=False) for event in events)
+    return _hash_text(_pipeline_salt(config, today) + "\n".join(encoded))
 
-def _run_scrape(config: PipelineConfig) -> List[Dict[str, str]]:
+
+
+def _scrape_events(
+    config: PipelineConfig,
+    scraper: EventScraper,
+    fingerprint: Optional[RunFingerprint],
+    today: date,
+) -> List[Event]:
+    if fingerprint is None or not isinstance(scraper, ListingScraper):
+        return scraper.get_events()
+
+    html = scraper.fetch_listing()
+    fingerprint.page_hash = _hash_text(_pipeline_salt(config, today) + html)
+    if fingerprint.page_hash == fingerprint.previous_page_hash:
+        raise UnchangedScrapeError("Listing page unchanged since previous run")
+    return list(scraper.parse_events_iter(html))
+
+
+
+def _enrich_events(
+    config: PipelineConfig,
+    events: List[Event],
+    store: Optional[EventStore],
+) -> List[Event]:
+    from .async_http import HttpxAsyncHttpClient
+    from .crawler import AsyncCrawler
+    from .enrichment import DetailEnricher
+    from .scraper import DEFAULT_USER_AGENT
+
+    fetch_enriched_details = getattr(store, "fetch_enriched_details", None)
+    known = fetch_enriched_details(events) if fetch_enriched_details is not None else None
+
+    async def enrich() -> List[Event]:
+        client = HttpxAsyncHttpClient(
+            max_connections=config.enrichment_concurrency,
+            max_body_bytes=config.http_max_body_bytes,
+        )
+        try:
+            crawler = AsyncCrawler(
+                client,
+                rate_per_second=config.enrichment_rate_per_second,
+                max_concurrency=config.enrichment_concurrency,
+            )
+            enricher = DetailEnricher(
+                crawler,
+                headers={"User-Agent": DEFAULT_USER_AGENT},
+                parser_backend=config.scraper_parser,
+            )
+            return await enricher.enrich(events, known)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(enrich())
+
+
+
+def _run_scrape(
+    config: PipelineConfig,
+    fingerprint: Optional[RunFingerprint] = None,
+    store: Optional[EventStore] = None,
+) -> List[Event]:
     if config.scraper_strategy != "web":
         raise ValueError(f"Unsupported SCRAPER_STRATEGY: {config.scraper_strategy}")
 
+    today = _today()
     scraper = _default_scraper(config)
-    events = scraper.get_events()
-
-    if config.scraper_search_term:
+    events = _scrape_events(config, scraper, fingerprint, today)
+
+    if _ai_only(config):
+        # Chained filters share the batch's lowered and parsed columns; a
+        # single keyword filter is cheaper as one list pass.
+        batch = EventBatch(events).filter_keyword(config.scraper_search_term, config.ai_keywords)
+        events = batch.filter_ai(keyword_pattern(config.ai_keywords)).filter_upcoming_week(today).records
+    elif config.scraper_search_term:
         events = filter_events_by_keyword(events, config.scraper_search_term)
 
-    if config.scraper_search_term.strip().lower() == "ai":
-        events = filter_ai_events(events)
-        events = filter_events_upcoming_week(events)
-
     if config.scraper_limit > 0:
         events = events[: config.scraper_limit]
 
+    if fingerprint is not None:
+        fingerprint.event_set_hash = _event_set_hash(config, events, today)
+        if fingerprint.event_set_hash == fingerprint.previous_event_set_hash:
+            raise UnchangedScrapeError("Event set unchanged since previous run")
+
+    if config.enrichment_enabled:
+        events = _enrich_events(config, events, store)
+
     if config.tagging_enabled:
         tagger = GeminiTagger(api_key=config.gemini_api_key)
         if tagger.is_available():
             events = tagger.tag_events(events)
         else:
-            events = [{**event, "tags": []} for event in events]
+            events = [replace(as_event(event), tags=()) for event in events]
     else:
-        events = [{**event, "tags": []} for event in events]
+        events = [replace(as_event(event), tags=()) for event in events]
 
     return events
 
@@ -79,17 +239,34 @@ def _run_scrape(config: PipelineConfig) -> List[Dict[str, str]]:
 
 def run_once(
     config: Optional[PipelineConfig] = None,
-    scrape_func: Optional[Callable[[PipelineConfig], List[Dict[str, str]]]] = None,
+    scrape_func: Optional[Callable[[PipelineConfig], Sequence[Mapping[str, Any]]]] = None,
     store: Optional[EventStore] = None,
 ) -> RunSummary:
     cfg = config or load_config_from_env()
-    scrape = scrape_func or _run_scrape
-    event_store = store or _default_store(cfg)
+    if store is not None:
+        return _run_pipeline(cfg, scrape_func, store)
+    # A store created here is closed here; a caller's store stays open.
+    owned_store = _default_store(cfg)
+    try:
+        return _run_pipeline(cfg, scrape_func, owned_store)
+    finally:
+        owned_store.close()
+
+
+def _run_pipeline(
+    cfg: PipelineConfig,
+    scrape_func: Optional[Callable[[PipelineConfig], Sequence[Mapping[str, Any]]]],
+    event_store: EventStore,
+) -> RunSummary:
     event_store.init_schema()
 
+    fingerprint = _load_fingerprint(event_store, cfg) if scrape_func is None else None
+    scrape = scrape_func or functools.partial(_run_scrape, fingerprint=fingerprint, store=event_store)
+
     attempts = 0
-    events: List[Dict[str, str]] = []
+    events: Sequence[Mapping[str, Any]] = []
     error_message = ""
+    unchanged = False
 
     while attempts < max(1, cfg.retry_attempts):
         attempts += 1
@@ -97,6 +274,14 @@ def run_once(
             events = scrape(cfg)
             error_message = ""
             break
+        except UnchangedScrapeError as exc:
+            logger.info("Skipping parse, tagging and upserts: %s", exc)
+            events = []
+            error_message = ""
+            unchanged = True
+            if fingerprint is not None and not fingerprint.event_set_hash:
+                fingerprint.event_set_hash = fingerprint.previous_event_set_hash
+            break
         except PartialScrapeError as exc:
             events = list(exc.partial_events)
             error_message = str(exc)
@@ -118,6 +303,15 @@ def run_once(
     else:
         status = "success"
 
+    fingerprint_fields: Dict[str, object] = {}
+    if fingerprint is not None:
+        fingerprint_fields = {
+            "page_hash": fingerprint.page_hash if status == "success" else "",
+            "event_set_hash": fingerprint.event_set_hash if status == "success" else "",
+            "unchanged": unchanged,
+            "matched_run_id": fingerprint.previous_run_id if unchanged else None,
+        }
+
     run_record = event_store.persist_run(
         source=cfg.scraper_strategy,
         fetched_at=datetime.now(timezone.utc).isoformat(),
@@ -127,6 +321,7 @@ def run_once(
         attempts=attempts,
         error=error_message,
         events=events,
+        **fingerprint_fields,
     )
 
     summary = RunSummary(
@@ -136,25 +331,54 @@ def run_once(
         attempts=run_record.attempts,
         fetched_count=run_record.fetched_count,
         error=run_record.error,
+        unchanged=unchanged,
+        inserted_count=getattr(run_record, "inserted_count", 0),
+        updated_count=getattr(run_record, "updated_count", 0),
+        unchanged_count=getattr(run_record, "unchanged_count", 0),
     )
 
     logger.info(
-        "run_id=%s status=%s source=%s attempts=%s fetched_count=%s error=%s",
+        "run_id=%s status=%s source=%s attempts=%s fetched_count=%s inserted=%s updated=%s unchanged_events=%s "
+        "unchanged=%s error=%s",
         summary.run_id,
         summary.status,
         summary.source,
         summary.attempts,
         summary.fetched_count,
+        summary.inserted_count,
+        summary.updated_count,
+        summary.unchanged_count,
+        summary.unchanged,
         summary.error,
     )
 
     return summary
 
 
-def _default_store(config: PipelineConfig) -> EventStore:
+def _load_fingerprint(event_store: EventStore, config: PipelineConfig) -> Optional[RunFingerprint]:
+    fetch_latest_fingerprint = getattr(event_store, "fetch_latest_fingerprint", None)
+    if fetch_latest_fingerprint is None:
+        return None
+    previous = fetch_latest_fingerprint(
+        source=config.scraper_strategy,
+        search_term=config.scraper_search_term,
+        record_limit=config.scraper_limit,
+    )
+    if previous is None:
+        return RunFingerprint()
+    run_id, page_hash, event_set_hash = previous
+    return RunFingerprint(
+        previous_run_id=run_id,
+        previous_page_hash=page_hash,
+        previous_event_set_hash=event_set_hash,
+    )
+
+
+
+def _default_store(config: PipelineConfig) -> SQLiteEventStore:
     from .storage import SQLiteEventStore
 
-    return SQLiteEventStore(config.db_path)
+    return SQLiteEventStore.from_config(config)
 
 
 
@@ -5,7 +5,7 @@ import argparse
 from croniter import croniter
 
 from .config import load_config_from_env
-from .exceptions import ScraperNetworkError
+from .exceptions import ResponseTooLargeError, ScraperNetworkError
 
 
 
@@ -15,7 +15,7 @@ def validate_cron_schedule(schedule: str) -> None:
 
 
 def is_transient_error(exc: Exception) -> bool:
-    return isinstance(exc, ScraperNetworkError)
+    return isinstance(exc, ScraperNetworkError) and not isinstance(exc, ResponseTooLargeError)
 
 
 def backoff_seconds(base_seconds: float, attempt: int) -> float:
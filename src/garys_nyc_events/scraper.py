@@ -1,18 +1,35 @@
 from __future__ import annotations
 
+import logging
 import re
 import time
-from dataclasses import asdict
-from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup, Tag
 
+from .charset import decode_html
+from .crawler import AsyncCrawler
 from .exceptions import ScraperNetworkError
 from .http import RequestsHttpClient
+from .layout import (
+    LayoutPlan,
+    LayoutPlanCache,
+    NodePath,
+    NodePaths,
+    learn_plan,
+    select_path,
+    skeleton_anchor,
+    structure_fingerprint,
+)
 from .models import Event
+from .parsing import AUTO_BACKEND, build_tree, resolve_parser_backend, slice_table_region
 from .protocols import HttpClient
+from .text_scanner import ScanResult, scan_tokens, strip_spans
+
 
+logger = logging.getLogger("garys_nyc_events.scraper")
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -21,22 +38,100 @@ DEFAULT_USER_AGENT = (
 )
 
 EVENT_LINK_FRAGMENT = "/events/"
-PRICE_REGEX = re.compile(r"\bFREE\b|\$\s?\d+(?:\.\d{2})?", re.IGNORECASE)
-TIME_REGEX = re.compile(r"\b\d{1,2}:\d{2}\s?(?:AM|PM)\b", re.IGNORECASE)
-DATE_REGEXES = [
-    re.compile(
-        r"\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\b\s*"
-        r"(?:,\s*)?"
-        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b\s+\d{1,2}"
-        r"(?:,\s*\d{4})?",
-        re.IGNORECASE,
-    ),
-    re.compile(
-        r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b\s+\d{1,2}"
-        r"(?:,\s*\d{4})?",
-        re.IGNORECASE,
-    ),
-]
+EVENT_HREF_REGEX = re.compile(r"""href\s*=\s*["']?[^"'\s>]*/events/""", re.IGNORECASE)
+FINGERPRINT_SAMPLE = 3
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+# Fallback location slots, in priority order: .venue, .location,
+# [class*=venue], [class*=location], [class*=address].
+LOCATION_CLASSES = ("venue", "location")
+LOCATION_CLASS_FRAGMENTS = ("venue", "location", "address")
+
+
+@dataclass
+class ContainerParts:
+    anchor: Optional[Tag] = None
+    cells: List[Tag] = field(default_factory=list)
+    venue: Optional[Tag] = None
+    details: Optional[Tag] = None
+    locations: List[Optional[Tag]] = field(
+        default_factory=lambda: [None] * (len(LOCATION_CLASSES) + len(LOCATION_CLASS_FRAGMENTS))
+    )
+
+
+def find_container_parts(element: Tag) -> ContainerParts:
+    # One walk over the container records the first link, the cells and the
+    # first match for every selector location and description would try.
+    parts = ContainerParts()
+    locations = parts.locations
+    for node in element.descendants:
+        if not isinstance(node, Tag):
+            continue
+        if node.name == "td":
+            parts.cells.append(node)
+        elif node.name == "a" and parts.anchor is None and node.has_attr("href"):
+            parts.anchor = node
+        classes = node.get("class")
+        if not classes:
+            continue
+        if node.name == "font":
+            if parts.venue is None and "fdescription" in classes:
+                parts.venue = node
+            if parts.details is None and "fgray" in classes:
+                parts.details = node
+        joined = " ".join(classes)
+        for slot, name in enumerate(LOCATION_CLASSES):
+            if locations[slot] is None and name in classes:
+                locations[slot] = node
+        for slot, fragment in enumerate(LOCATION_CLASS_FRAGMENTS, start=len(LOCATION_CLASSES)):
+            if locations[slot] is None and fragment in joined:
+                locations[slot] = node
+    return parts
+
+
+class ExtractionContext:
+    def __init__(self) -> None:
+        self._texts: Dict[int, Tuple[Tag, str]] = {}
+        self._outer_rows: Dict[int, Tuple[Tag, bool]] = {}
+        self._scans: Dict[int, Tuple[Tag, ScanResult]] = {}
+        self._parts: Dict[int, Tuple[Tag, ContainerParts]] = {}
+
+    def text(self, node: Tag) -> str:
+        key = id(node)
+        cached = self._texts.get(key)
+        if cached is None:
+            # Keep the node alive alongside its text so the id() key stays unique.
+            cached = (node, _normalize_text(node.get_text(" ")))
+            self._texts[key] = cached
+        return cached[1]
+
+    def scan(self, node: Tag) -> ScanResult:
+        key = id(node)
+        cached = self._scans.get(key)
+        if cached is None:
+            cached = (node, scan_tokens(self.text(node)))
+            self._scans[key] = cached
+        return cached[1]
+
+    def parts(self, element: Tag) -> ContainerParts:
+        key = id(element)
+        cached = self._parts.get(key)
+        if cached is None:
+            cached = (element, find_container_parts(element))
+            self._parts[key] = cached
+        return cached[1]
+
+    def outer_row(self, row: Tag, decide: Callable[[Tag], bool]) -> bool:
+        key = id(row)
+        cached = self._outer_rows.get(key)
+        if cached is None:
+            cached = (row, decide(row))
+            self._outer_rows[key] = cached
+        return cached[1]
 
 
 class GarysGuideScraper:
@@ -48,11 +143,20 @@ class GarysGuideScraper:
         user_agent: str = DEFAULT_USER_AGENT,
         timeout_seconds: int = 10,
         http_client: Optional[HttpClient] = None,
+        parser_backend: str = AUTO_BACKEND,
+        layout_cache: Optional[LayoutPlanCache] = None,
+        region_slicing: bool = True,
     ) -> None:
         self.delay_seconds = delay_seconds
         self.user_agent = user_agent
         self.timeout_seconds = timeout_seconds
+        self.parser_backend = resolve_parser_backend(parser_backend)
         self._http = http_client or RequestsHttpClient()
+        self._context = ExtractionContext()
+        self.layout_cache = layout_cache if layout_cache is not None else LayoutPlanCache()
+        self.last_layout_plan: Optional[LayoutPlan] = None
+        self.region_slicing = region_slicing
+        self.region_fallbacks = 0
 
     def _headers(self) -> Dict[str, str]:
         return {
@@ -83,45 +187,22 @@ class GarysGuideScraper:
         return urljoin(self.BASE_URL, href)
 
     def _extract_price(self, text: str) -> str:
-        normalized = " ".join(text.split())
-        if not normalized:
-            return ""
-        match = PRICE_REGEX.search(normalized)
-        if not match:
-            return ""
-        token = match.group(0)
-        return "FREE" if "free" in token.lower() else token.replace(" ", "")
+        return scan_tokens(_normalize_text(text)).price
 
     def _extract_date(self, text: str) -> str:
-        normalized = " ".join(text.split())
-        if not normalized:
-            return ""
-        for pattern in DATE_REGEXES:
-            match = pattern.search(normalized)
-            if match:
-                return match.group(0)
-        return ""
+        return scan_tokens(_normalize_text(text)).date
 
     def _extract_time(self, text: str) -> str:
-        normalized = " ".join(text.split())
-        if not normalized:
-            return ""
-        match = TIME_REGEX.search(normalized)
-        return match.group(0).upper() if match else ""
+        return scan_tokens(_normalize_text(text)).time
 
     def _extract_location(self, element: Tag) -> str:
-        # GarysGuide uses font.fdescription for venue + address
-        tag = element.select_one("font.fdescription")
-        if tag:
-            value = " ".join(tag.get_text(" ", strip=True).split())
-            if value:
-                return value
-        # Generic fallback selectors
-        for selector in [".venue", ".location", "[class*=venue]", "[class*=location]", "[class*=address]"]:
-            tag = element.select_one(selector)
+        # GarysGuide uses font.fdescription for venue + address, then the
+        # generic fallback classes
+        parts = self._context.parts(element)
+        for tag in (parts.venue, *parts.locations):
             if tag is None:
                 continue
-            value = self._clean(tag.get_text(" "))
+            value = self._context.text(tag)
             if value:
                 return value
         return ""
@@ -134,15 +215,21 @@ class GarysGuideScraper:
         date: str,
         time_value: str,
         price: str,
+        scan: Optional[ScanResult] = None,
     ) -> str:
-        working = self._clean(text)
+        working = _normalize_text(text)
         if not working:
             return ""
 
+        tokens = scan if scan is not None else scan_tokens(working)
+        spans = [(span.start, span.end) for span in tokens.spans]
         for token in [title, date, time_value, price]:
-            cleaned = self._clean(token)
-            if cleaned:
-                working = working.replace(cleaned, " ")
+            cleaned = _normalize_text(token)
+            start = working.find(cleaned) if cleaned else -1
+            while start != -1:
+                spans.append((start, start + len(cleaned)))
+                start = working.find(cleaned, start + len(cleaned))
+        working = strip_spans(working, spans)
 
         lowered = working.lower()
         split_markers = [" with ", " w/ "]
@@ -157,15 +244,15 @@ class GarysGuideScraper:
 
     def _extract_description(self, element: Tag) -> str:
         # GarysGuide stores event details (speakers, notes) in font.fgray
-        tag = element.select_one("font.fgray")
+        tag = self._context.parts(element).details
         if tag:
-            value = " ".join(tag.get_text(" ", strip=True).split())
+            value = self._context.text(tag)
             if value:
                 return value[:500]
         return ""
 
     def _extract_anchor(self, element: Tag) -> Optional[Tuple[str, str]]:
-        link = element.find("a", href=True)
+        link = self._context.parts(element).anchor
         if not link:
             return None
 
@@ -178,12 +265,12 @@ class GarysGuideScraper:
     def _extract_date_from_table_row(self, cells: List[Tag]) -> str:
         if not cells:
             return ""
-        return self._extract_date(self._clean(cells[0].get_text(" ")))
+        return self._context.scan(cells[0]).date
 
     def _extract_price_from_table_row(self, cells: List[Tag]) -> str:
         if len(cells) <= 1:
             return ""
-        return self._extract_price(self._clean(cells[-1].get_text(" ")))
+        return self._context.scan(cells[-1]).price
 
     def _extract_date_and_price_from_element(
         self,
@@ -204,7 +291,7 @@ class GarysGuideScraper:
         date = ""
         price = ""
 
-        cells = element.find_all("td")
+        cells = self._context.parts(element).cells
         date = self._extract_date_from_table_row(cells)
         price = self._extract_price_from_table_row(cells)
         return date, price
@@ -213,15 +300,8 @@ class GarysGuideScraper:
         self,
         element: Tag,
     ) -> Tuple[str, str]:
-        date = ""
-        price = ""
-
-        text_blob = self._clean(element.get_text(" "))
-        if not date:
-            date = self._extract_date(text_blob)
-        if not price:
-            price = self._extract_price(text_blob)
-        return date, price
+        scan = self._context.scan(element)
+        return scan.date, scan.price
 
     def _build_event_from_anchor(
         self,
@@ -233,9 +313,10 @@ class GarysGuideScraper:
 
         title, href = anchor
         url = self._normalize_url(href)
-        text_blob = self._clean(element.get_text(" "))
+        text_blob = self._context.text(element)
+        scan = self._context.scan(element)
         date, price = self._extract_date_and_price_from_element(element)
-        time_value = self._extract_time(text_blob)
+        time_value = scan.time
         location = self._extract_location(element)
         if not location:
             location = self._extract_location_from_text(
@@ -244,6 +325,7 @@ class GarysGuideScraper:
                 date=date,
                 time_value=time_value,
                 price=price,
+                scan=scan,
             )
         description = self._extract_description(element)
         return Event(
@@ -257,21 +339,6 @@ class GarysGuideScraper:
             description=description,
         )
 
-    def _events_from_candidates(self, soup: BeautifulSoup) -> List[Event]:
-        events: List[Event] = []
-        for element in self._candidate_elements(soup):
-            event = self._extract_event_from_element(element)
-            if event is not None:
-                events.append(event)
-        return events
-
-    def _deduplicate_events(self, events: List[Event]) -> List[Event]:
-        unique = {}
-        for event in events:
-            key = (event.title, event.url)
-            unique[key] = event
-        return list(unique.values())
-
     def _extract_event_from_element(self, element: Tag) -> Optional[Event]:
         anchor = self._extract_anchor(element)
         return self._build_event_from_anchor(element, anchor)
@@ -280,38 +347,149 @@ class GarysGuideScraper:
         cells = row.find_all("td", recursive=False)
         if len(cells) < 3:
             return False
-        date_text = self._clean(cells[0].get_text(" "))
-        price_text = self._clean(cells[2].get_text(" ")) if len(cells) > 2 else ""
-        has_date = bool(self._extract_date(date_text))
-        has_price = bool(self._extract_price(price_text)) or "$" in price_text
+        price_text = self._context.text(cells[2])
+        has_date = bool(self._context.scan(cells[0]).date)
+        has_price = bool(self._context.scan(cells[2]).price) or "$" in price_text
         return has_date or has_price
 
     def _preferred_container(self, link: Tag) -> Tag:
         for row in link.find_parents("tr"):
-            if self._is_outer_event_row(row):
+            if self._context.outer_row(row, self._is_outer_event_row):
                 return row
         container = link.find_parent(["tr", "li", "div", "article"])
         return container if container else link
 
+    def _event_links(self, soup: BeautifulSoup) -> List[Tag]:
+        return [link for link in soup.find_all("a", href=True) if EVENT_LINK_FRAGMENT in link["href"]]
+
+    def _layout_fingerprint(self, links: List[Tag], paths: NodePaths) -> str:
+        # Only the table skeleton around a few links is signed; the row layout
+        # below it is checked by the plan itself when it is applied.
+        sample = links[:FINGERPRINT_SAMPLE] + links[-1:]
+        return structure_fingerprint(paths.path(skeleton_anchor(link)) for link in sample)
+
+    def _planned_rows(self, soup: BeautifulSoup, plan: LayoutPlan) -> Dict[int, Tag]:
+        rows: Dict[int, Tag] = {}
+        for row in select_path(soup, plan.row_path):
+            for link in row.find_all("a", href=True):
+                rows.setdefault(id(link), row)
+        return rows
+
+    def _learned_row_path(self, container: Tag, paths: NodePaths) -> Optional[NodePath]:
+        if container.name != "tr" or not self._context.outer_row(container, self._is_outer_event_row):
+            return None
+        return paths.path(container)
+
     def _candidate_elements(self, soup: BeautifulSoup) -> Iterable[Tag]:
-        for link in soup.select("a[href]"):
-            href = link.get("href", "")
-            if EVENT_LINK_FRAGMENT not in href:
+        links = self._event_links(soup)
+        paths = NodePaths()
+        fingerprint = self._layout_fingerprint(links, paths)
+        plan = self.layout_cache.get(fingerprint)
+        planned: Dict[int, Tag] = {}
+        if plan is not None:
+            planned = self._planned_rows(soup, plan)
+            if not any(id(link) in planned for link in links):
+                logger.info("Cached layout plan %s selected no rows; falling back to heuristics", fingerprint)
+                self.layout_cache.discard(fingerprint)
+                plan = None
+        self.last_layout_plan = plan
+
+        seen: Set[int] = set()
+        row_paths: List[NodePath] = []
+        for link in links:
+            container = planned.get(id(link)) if plan is not None else None
+            if container is None:
+                container = self._preferred_container(link)
+                if plan is None:
+                    row_path = self._learned_row_path(container, paths)
+                    if row_path is not None:
+                        row_paths.append(row_path)
+            if id(container) in seen:
                 continue
-            yield self._preferred_container(link)
-
-    def parse_events(self, html: str) -> List[Dict[str, str]]:
-        soup = BeautifulSoup(html, "html.parser")
-        events = self._events_from_candidates(soup)
-        unique_events = self._deduplicate_events(events)
-        return [asdict(event) for event in unique_events]
+            seen.add(id(container))
+            yield container
+
+        if plan is None:
+            learned = learn_plan(fingerprint, row_paths)
+            if learned is not None:
+                self.layout_cache.put(learned)
+
+    def _iter_tree_events(self, soup: BeautifulSoup) -> Iterator[Event]:
+        context = ExtractionContext()
+        self._context = context
+        seen: Set[Tuple[str, str]] = set()
+        try:
+            for element in self._candidate_elements(soup):
+                self._context = context
+                event = self._extract_event_from_element(element)
+                if event is None:
+                    continue
+                key = (event.title, event.url)
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield event
+        finally:
+            self._context = ExtractionContext()
+            soup.decompose()
+
+    def parse_events_iter(self, html: Union[str, bytes]) -> Iterator[Event]:
+        html = decode_html(html)
+        if self.region_slicing:
+            region = slice_table_region(html, EVENT_HREF_REGEX)
+            if region is not None:
+                found = False
+                for event in self._iter_tree_events(build_tree(region, self.parser_backend)):
+                    found = True
+                    yield event
+                if found:
+                    return
+            self.region_fallbacks += 1
+            logger.debug("Events region not found; parsing the full document")
+        yield from self._iter_tree_events(build_tree(html, self.parser_backend))
+
+    def parse_events(self, html: Union[str, bytes]) -> List[Event]:
+        return list(self.parse_events_iter(html))
+
+    def fetch_listing(self) -> str:
+        return self._fetch_html(self.BASE_URL)
+
+    def iter_events(self) -> Iterator[Event]:
+        return self.parse_events_iter(self.fetch_listing())
+
+    def get_events(self) -> List[Event]:
+        return list(self.iter_events())
+
+    async def get_events_async(
+        self,
+        crawler: AsyncCrawler,
+        urls: Optional[Iterable[str]] = None,
+    ) -> List[Event]:
+        results = await crawler.fetch_all(
+            list(urls) if urls is not None else [self.BASE_URL],
+            headers=self._headers(),
+            timeout=self.timeout_seconds,
+        )
+        failures = [result for result in results if result.error is not None]
+        if failures and len(failures) == len(results):
+            raise failures[0].error  # type: ignore[misc]
+        for failure in failures:
+            logger.warning("Skipping listing page %s: %s", failure.url, failure.error)
 
-    def get_events(self) -> List[Dict[str, str]]:
-        html = self._fetch_html(self.BASE_URL)
-        return self.parse_events(html)
+        seen: Set[Tuple[str, str]] = set()
+        events: List[Event] = []
+        for result in results:
+            if not result.ok:
+                continue
+            for event in self.parse_events_iter(result.text):
+                key = (event.title, event.url)
+                if key not in seen:
+                    seen.add(key)
+                    events.append(event)
+        return events
 
 
 def scrape_default_garys_guide(
     delay_seconds: float = 1.5,
-) -> List[Dict[str, str]]:
+) -> List[Event]:
     return GarysGuideScraper(delay_seconds=delay_seconds).get_events()
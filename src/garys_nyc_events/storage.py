@@ -1,72 +1,149 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import re
 import sqlite3
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from dataclasses import dataclass
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
 from urllib.parse import urlsplit, urlunsplit
 
-from .filters import filter_ai_events, filter_events_upcoming_week
-
-
-SCHEMA_SQL = """
-PRAGMA foreign_keys = ON;
-
-CREATE TABLE IF NOT EXISTS runs (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    source TEXT NOT NULL,
-    fetched_at TEXT NOT NULL,
-    search_term TEXT,
-    record_limit INTEGER,
-    status TEXT NOT NULL CHECK(status IN ('success', 'partial', 'failure')),
-    fetched_count INTEGER NOT NULL DEFAULT 0,
-    attempts INTEGER NOT NULL DEFAULT 1,
-    error TEXT,
-    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-);
-
-CREATE TABLE IF NOT EXISTS "all events" (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    canonical_key TEXT NOT NULL UNIQUE,
-    name TEXT NOT NULL,
-    url TEXT,
-    description TEXT,
-    tags TEXT NOT NULL DEFAULT '[]',
-    price TEXT,
-    event_date TEXT,
-    event_time TEXT,
-    event_location TEXT,
-    date_found TEXT,
-    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-);
-
-CREATE TABLE IF NOT EXISTS weekly_events (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    all_event_id INTEGER NOT NULL UNIQUE,
-    name TEXT NOT NULL,
-    url TEXT,
-    description TEXT,
-    tags TEXT,
-    price TEXT,
-    event_date TEXT,
-    event_time TEXT,
-    event_location TEXT,
-    date_found TEXT NOT NULL,
-    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY(all_event_id) REFERENCES "all events"(id) ON DELETE CASCADE
-);
-
-CREATE INDEX IF NOT EXISTS idx_runs_fetched_at ON runs(fetched_at);
-CREATE INDEX IF NOT EXISTS idx_all_events_canonical_key ON "all events"(canonical_key);
-CREATE INDEX IF NOT EXISTS idx_weekly_events_date ON weekly_events(event_date);
+from .config import PipelineConfig
+from .connections import SQLiteConnectionPool, SQLiteTuning
+from .dates import normalize_event_start
+from .filters import filter_ai_events
+from .keywords import AI_KEYWORDS
+from .migrations import WEEKLY_WINDOW_KEY, migrate
+
+
+T = TypeVar("T")
+
+# weekly_events is maintained incrementally; store_meta remembers which
+# window start it was last brought up to date for.
+WEEKLY_MIN_DATE_FOUND = "2026-02-27"
+WEEKLY_WINDOW_CONDITION = "a.event_day >= ? AND a.event_day < ? AND date(a.date_found) >= date(?)"
+
+SEARCH_TOKEN_REGEX = re.compile(r"\w+")
+
+
+def fts_match_expression(query: str) -> str:
+    # Quote every token so user input can never be read as FTS5 syntax.
+    return " ".join(f'"{token}"' for token in SEARCH_TOKEN_REGEX.findall(query or ""))
+
+
+def encode_search_cursor(rank: float, row_id: int) -> str:
+    return f"{rank!r}:{row_id}"
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    rank, _, row_id = cursor.rpartition(":")
+    try:
+        return float(rank), int(row_id)
+    except ValueError:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from None
+
+
+ALL_EVENT_COLUMNS = (
+    "canonical_key",
+    "name",
+    "url",
+    "description",
+    "tags",
+    "price",
+    "event_date",
+    "event_time",
+    "event_location",
+    "event_start",
+    "event_day",
+    "date_found",
+    "enriched_at",
+    "content_hash",
+)
+# SQLite (3.32+) binds at most 32766 parameters per statement; one upsert
+# binds len(ALL_EVENT_COLUMNS) per row, so the chunk size is capped by it.
+SQLITE_MAX_VARIABLES = 32766
+UPSERT_BATCH_ROWS = min(500, SQLITE_MAX_VARIABLES // len(ALL_EVENT_COLUMNS))
+UPSERT_CONFLICT_SQL = """
+    ON CONFLICT(canonical_key) DO UPDATE SET
+        name=excluded.name,
+        url=COALESCE(excluded.url, "all events".url),
+        description=CASE WHEN excluded.enriched_at = '' AND "all events".enriched_at != ''
+            THEN "all events".description ELSE excluded.description END,
+        tags=excluded.tags,
+        price=excluded.price,
+        event_date=excluded.event_date,
+        event_time=CASE WHEN excluded.enriched_at = '' AND "all events".enriched_at != ''
+            THEN "all events".event_time ELSE excluded.event_time END,
+        event_location=CASE WHEN excluded.enriched_at = '' AND "all events".enriched_at != ''
+            THEN "all events".event_location ELSE excluded.event_location END,
+        event_start=CASE WHEN excluded.enriched_at = '' AND "all events".enriched_at != ''
+            AND excluded.event_day = "all events".event_day
+            THEN "all events".event_start ELSE excluded.event_start END,
+        event_day=excluded.event_day,
+        date_found=excluded.date_found,
+        enriched_at=CASE WHEN excluded.enriched_at = ''
+            THEN "all events".enriched_at ELSE excluded.enriched_at END,
+        content_hash=excluded.content_hash,
+        updated_at=CURRENT_TIMESTAMP
+    WHERE "all events".content_hash != excluded.content_hash
 """
 
 
+@lru_cache(maxsize=8)
+def upsert_all_events_sql(rows: int) -> str:
+    placeholders = "(" + ", ".join("?" for _ in ALL_EVENT_COLUMNS) + ")"
+    return (
+        f'INSERT INTO "all events" ({", ".join(ALL_EVENT_COLUMNS)}) '
+        f"VALUES {', '.join(placeholders for _ in range(rows))}"
+        f"{UPSERT_CONFLICT_SQL}"
+        "RETURNING id, canonical_key"
+    )
+
+
+def content_hash(values: Sequence[Any]) -> str:
+    encoded = json.dumps(list(values), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    events: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+
+@dataclass(frozen=True)
+class UpsertResult:
+    event_ids: List[int]
+    changed_ids: List[int]
+    observed: Dict[int, str]
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+@dataclass(frozen=True)
+class RunDiff:
+    run_id: int
+    base_run_id: Optional[int]
+    added: List[Dict[str, Any]]
+    removed: List[Dict[str, Any]]
+    changed: List[Dict[str, Any]]
+
+
 @dataclass(frozen=True)
 class RunRecord:
     run_id: int
@@ -74,30 +151,60 @@ class RunRecord:
     fetched_count: int
     attempts: int
     error: str
+    unchanged: bool = False
+    inserted_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
 
 
 class SQLiteEventStore:
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        ai_keywords: Iterable[str] = AI_KEYWORDS,
+        tuning: SQLiteTuning = SQLiteTuning(),
+    ) -> None:
         self.db_path = db_path
+        self.ai_keywords = frozenset(ai_keywords)
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.pool = SQLiteConnectionPool(db_path, tuning)
+        self._schema_ready = False
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> "SQLiteEventStore":
+        return cls(
+            config.db_path,
+            ai_keywords=config.ai_keywords,
+            tuning=SQLiteTuning(
+                mmap_size=config.sqlite_mmap_size,
+                cache_size_kib=config.sqlite_cache_size_kib,
+                busy_timeout_ms=config.sqlite_busy_timeout_ms,
+            ),
+        )
 
     @contextmanager
-    def _connect(self):
-        connection = sqlite3.connect(self.db_path)
+    def _connect(self, *, read_only: bool = False):
+        # A read-only connection cannot create the database file.
+        if read_only and not Path(self.db_path).exists():
+            read_only = False
+        connection = self.pool.connection(read_only=read_only)
         try:
-            connection.row_factory = sqlite3.Row
-            connection.execute("PRAGMA foreign_keys = ON;")
             yield connection
             connection.commit()
         except BaseException:
             connection.rollback()
             raise
-        finally:
-            connection.close()
+
+    def close(self) -> None:
+        self.pool.close()
 
     def init_schema(self) -> None:
+        if self._schema_ready:
+            return
         with self._connect() as conn:
-            conn.executescript(SCHEMA_SQL)
+            migrate(conn)
+        self._schema_ready = True
 
     def _normalize_url(self, url: str) -> str:
         cleaned = (url or "").strip()
@@ -106,28 +213,107 @@ class SQLiteEventStore:
         parsed = urlsplit(cleaned)
         return urlunsplit((parsed.scheme, parsed.netloc, parsed.path, "", ""))
 
-    def _canonical_key(self, event: Dict[str, str]) -> str:
+    def _canonical_key(self, event: Mapping[str, Any]) -> str:
         url = self._normalize_url(event.get("url") or "")
         title = (event.get("title") or "").strip().lower()
         if url:
             return f"url:{url}"
         return f"name:{title}"
 
-    def _upsert_all_event(
+    def _all_event_params(self, event: Mapping[str, Any], *, date_found: str, today: date) -> Tuple[Any, ...]:
+        event_start, event_day = normalize_event_start(event.get("date", ""), event.get("time", ""), today)
+        content = (
+            (event.get("title") or "").strip() or "Untitled",
+            self._normalize_url(event.get("url") or "") or None,
+            event.get("description", ""),
+            json.dumps(list(event.get("tags", [])), ensure_ascii=False),
+            event.get("price", ""),
+            event.get("date", ""),
+            event.get("time", ""),
+            event.get("location", ""),
+            event_start,
+            event_day,
+        )
+        enriched_at = event.get("enriched_at", "")
+        return (self._canonical_key(event), *content, date_found, enriched_at, content_hash((*content, enriched_at)))
+
+    def _upsert_all_events(
         self,
         conn: sqlite3.Connection,
-        event: Dict[str, str],
+        events: Iterable[Mapping[str, Any]],
         *,
         date_found: str,
-    ) -> int:
-        key = self._canonical_key(event)
-        name = (event.get("title") or "").strip() or "Untitled"
-        url = self._normalize_url(event.get("url") or "") or None
+        today: date,
+    ) -> UpsertResult:
+        # Collapse repeated keys first (the first occurrence wins, as in the
+        # scraper's streaming dedup), so every key is counted once as
+        # inserted, updated or unchanged and the totals add up to the number
+        # of distinct events. Then, per chunk: one lookup
+        # of the stored hashes and one multi-row INSERT ... RETURNING for the
+        # rows that are new or changed. Unchanged rows are not written at all.
+        # RETURNING order is not guaranteed, so ids are matched back through
+        # canonical_key.
+        first: Dict[str, Tuple[Any, ...]] = {}
+        for event in events:
+            row = self._all_event_params(event, date_found=date_found, today=today)
+            first.setdefault(row[0], row)
+
+        ids: List[int] = []
+        changed: List[int] = []
+        observed: Dict[int, str] = {}
+        inserted = updated = unchanged = 0
+        for chunk in _chunks(first.values(), UPSERT_BATCH_ROWS):
+            placeholders = ", ".join("?" for _ in chunk)
+            stored = {
+                row["canonical_key"]: (int(row["id"]), row["content_hash"])
+                for row in conn.execute(
+                    f'SELECT id, canonical_key, content_hash FROM "all events" WHERE canonical_key IN ({placeholders})',
+                    [row[0] for row in chunk],
+                )
+            }
+            pending = []
+            for row in chunk:
+                known = stored.get(row[0])
+                if known is None:
+                    inserted += 1
+                    pending.append(row)
+                elif known[1] != row[-1]:
+                    updated += 1
+                    pending.append(row)
+                else:
+                    unchanged += 1
+
+            resolved = {key: row_id for key, (row_id, _) in stored.items()}
+            if pending:
+                rows = conn.execute(upsert_all_events_sql(len(pending)), [value for row in pending for value in row])
+                resolved.update({row["canonical_key"]: int(row["id"]) for row in rows})
+            ids.extend(resolved[row[0]] for row in chunk)
+            changed.extend(resolved[row[0]] for row in pending)
+            observed.update((resolved[row[0]], row[-1]) for row in chunk)
+        return UpsertResult(
+            event_ids=ids,
+            changed_ids=changed,
+            observed=observed,
+            inserted=inserted,
+            updated=updated,
+            unchanged=unchanged,
+        )
+
+    def _read_meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
 
+    def _write_meta(self, conn: sqlite3.Connection, key: str, value: str) -> None:
         conn.execute(
-            """
-            INSERT INTO "all events" (
-                canonical_key,
+            "INSERT INTO store_meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _copy_to_weekly(self, conn: sqlite3.Connection, condition: str, params: Sequence[object]) -> None:
+        conn.execute(
+            f"""
+            INSERT INTO weekly_events (
+                all_event_id,
                 name,
                 url,
                 description,
@@ -136,117 +322,186 @@ class SQLiteEventStore:
                 event_date,
                 event_time,
                 event_location,
+                event_start,
+                event_day,
                 date_found
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(canonical_key) DO UPDATE SET
+            SELECT
+                a.id,
+                a.name,
+                a.url,
+                a.description,
+                a.tags,
+                a.price,
+                a.event_date,
+                a.event_time,
+                a.event_location,
+                a.event_start,
+                a.event_day,
+                COALESCE(a.date_found, ?)
+            FROM "all events" a
+            WHERE {condition}
+            ON CONFLICT(all_event_id) DO UPDATE SET
                 name=excluded.name,
-                url=COALESCE(excluded.url, "all events".url),
+                url=excluded.url,
                 description=excluded.description,
                 tags=excluded.tags,
                 price=excluded.price,
                 event_date=excluded.event_date,
                 event_time=excluded.event_time,
                 event_location=excluded.event_location,
-                date_found=excluded.date_found,
-                updated_at=CURRENT_TIMESTAMP
+                event_start=excluded.event_start,
+                event_day=excluded.event_day,
+                date_found=excluded.date_found
             """,
-            (
-                key,
-                name,
-                url,
-                event.get("description", ""),
-                json.dumps(event.get("tags", []), ensure_ascii=False),
-                event.get("price", ""),
-                event.get("date", ""),
-                event.get("time", ""),
-                event.get("location", ""),
-                date_found,
-            ),
+            (datetime.now(timezone.utc).isoformat(), *params),
         )
 
-        row = conn.execute('SELECT id FROM "all events" WHERE canonical_key = ?', (key,)).fetchone()
-        if row is None:
-            raise RuntimeError("Failed to resolve product id after upsert")
-        return int(row["id"])
-
-    def _refresh_weekly_events(self, conn: sqlite3.Connection, today: Optional[date] = None) -> None:
-        rows = conn.execute(
-            '''
-            SELECT
-                id,
-                name,
-                url,
-                description,
-                tags,
-                price,
-                event_date,
-                event_time,
-                event_location,
-                date_found
-            FROM "all events"
-            WHERE date(date_found) >= date('2026-02-27')
-            '''
-        ).fetchall()
-
-        all_events = [
-            {
-                "id": row["id"],
-                "title": row["name"] or "",
-                "url": row["url"] or "",
-                "description": row["description"] or "",
-                "tags": json.loads(row["tags"] or "[]"),
-                "price": row["price"] or "",
-                "date": row["event_date"] or "",
-                "time": row["event_time"] or "",
-                "location": row["event_location"] or "",
-                "date_found": row["date_found"] or "",
-            }
-            for row in rows
-        ]
-
-        weekly = filter_events_upcoming_week(all_events, today=today or date.today())
+    def _refresh_weekly_events(
+        self,
+        conn: sqlite3.Connection,
+        today: Optional[date] = None,
+        touched_ids: Sequence[int] = (),
+    ) -> None:
+        start = today or date.today()
+        end = start + timedelta(days=7)
+        window = (start.isoformat(), end.isoformat(), WEEKLY_MIN_DATE_FOUND)
+        previous = self._read_meta(conn, WEEKLY_WINDOW_KEY)
+        previous_start = date.fromisoformat(previous) if previous else None
+
+        if previous_start is None or previous_start > start:
+            conn.execute("DELETE FROM weekly_events")
+            self._copy_to_weekly(conn, WEEKLY_WINDOW_CONDITION, window)
+        else:
+            if previous_start < start:
+                # Only the window edges move: drop days that fell off the front
+                # and admit days that entered at the back.
+                conn.execute("DELETE FROM weekly_events WHERE event_day < ?", (start.isoformat(),))
+                entering = max(previous_start + timedelta(days=7), start)
+                self._copy_to_weekly(conn, WEEKLY_WINDOW_CONDITION, (entering.isoformat(), *window[1:]))
+            if touched_ids:
+                touched = json.dumps(list(touched_ids))
+                conn.execute(
+                    f"""
+                    DELETE FROM weekly_events
+                    WHERE all_event_id IN (
+                        SELECT a.id FROM "all events" a
+                        WHERE a.id IN (SELECT value FROM json_each(?))
+                          AND NOT ({WEEKLY_WINDOW_CONDITION})
+                    )
+                    """,
+                    (touched, *window),
+                )
+                self._copy_to_weekly(
+                    conn,
+                    f"a.id IN (SELECT value FROM json_each(?)) AND {WEEKLY_WINDOW_CONDITION}",
+                    (touched, *window),
+                )
+
+        self._write_meta(conn, WEEKLY_WINDOW_KEY, start.isoformat())
+
+    def _previous_run_id(
+        self,
+        conn: sqlite3.Connection,
+        run_id: int,
+        *,
+        source: str,
+        search_term: Optional[str],
+        record_limit: Optional[int],
+    ) -> Optional[int]:
+        row = conn.execute(
+            """
+            SELECT id
+            FROM runs
+            WHERE id < ?
+              AND source = ?
+              AND search_term IS ?
+              AND record_limit IS ?
+              AND status != 'failure'
+            ORDER BY id DESC
+            LIMIT 1
+            """,
+            (run_id, source, search_term, record_limit),
+        ).fetchone()
+        return int(row["id"]) if row else None
 
-        conn.execute("DELETE FROM weekly_events")
-        for event in weekly:
+    def _record_observations(
+        self,
+        conn: sqlite3.Connection,
+        run_id: int,
+        observed: Mapping[int, str],
+        *,
+        matched_run_id: Optional[int],
+    ) -> None:
+        # A short-circuited run saw the same events as the run whose
+        # fingerprint it matched, so it inherits that run's observations
+        # instead of recording nothing.
+        if matched_run_id is not None and not observed:
             conn.execute(
                 """
-                INSERT INTO weekly_events (
-                    all_event_id,
-                    name,
-                    url,
-                    description,
-                    tags,
-                    price,
-                    event_date,
-                    event_time,
-                    event_location,
-                    date_found
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(all_event_id) DO UPDATE SET
-                    name=excluded.name,
-                    url=excluded.url,
-                    description=excluded.description,
-                    tags=excluded.tags,
-                    price=excluded.price,
-                    event_date=excluded.event_date,
-                    event_time=excluded.event_time,
-                    event_location=excluded.event_location,
-                    date_found=excluded.date_found
+                INSERT INTO run_events (run_id, all_event_id, content_hash)
+                SELECT ?, all_event_id, content_hash FROM run_events WHERE run_id = ?
                 """,
-                (
-                    event.get("id"),
-                    event.get("title", ""),
-                    event.get("url", ""),
-                    event.get("description", ""),
-                    json.dumps(event.get("tags", []), ensure_ascii=False),
-                    event.get("price", ""),
-                    event.get("date", ""),
-                    event.get("time", ""),
-                    event.get("location", ""),
-                    event.get("date_found", datetime.now(timezone.utc).isoformat()),
-                ),
+                (run_id, matched_run_id),
+            )
+            return
+        conn.executemany(
+            "INSERT INTO run_events (run_id, all_event_id, content_hash) VALUES (?, ?, ?)",
+            [(run_id, event_id, digest) for event_id, digest in observed.items()],
+        )
+
+    def diff_runs(self, run_id: int, base_run_id: Optional[int] = None) -> Optional[RunDiff]:
+        with self._connect(read_only=True) as conn:
+            run = conn.execute(
+                "SELECT id, source, search_term, record_limit FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+            if run is None:
+                return None
+            if base_run_id is None:
+                base_run_id = self._previous_run_id(
+                    conn,
+                    run_id,
+                    source=run["source"],
+                    search_term=run["search_term"],
+                    record_limit=run["record_limit"],
+                )
+            elif conn.execute("SELECT 1 FROM runs WHERE id = ?", (base_run_id,)).fetchone() is None:
+                return None
+            base = -1 if base_run_id is None else base_run_id
+            rows = conn.execute(
+                """
+                SELECT 'added' AS kind, a.id, a.name, a.url, a.event_date
+                FROM run_events n
+                JOIN "all events" a ON a.id = n.all_event_id
+                WHERE n.run_id = :run
+                  AND NOT EXISTS (
+                      SELECT 1 FROM run_events o WHERE o.run_id = :base AND o.all_event_id = n.all_event_id
+                  )
+                UNION ALL
+                SELECT 'removed', a.id, a.name, a.url, a.event_date
+                FROM run_events o
+                JOIN "all events" a ON a.id = o.all_event_id
+                WHERE o.run_id = :base
+                  AND NOT EXISTS (
+                      SELECT 1 FROM run_events n WHERE n.run_id = :run AND n.all_event_id = o.all_event_id
+                  )
+                UNION ALL
+                SELECT 'changed', a.id, a.name, a.url, a.event_date
+                FROM run_events n
+                JOIN run_events o ON o.run_id = :base AND o.all_event_id = n.all_event_id
+                JOIN "all events" a ON a.id = n.all_event_id
+                WHERE n.run_id = :run AND n.content_hash != o.content_hash
+                ORDER BY 1, 2
+                """,
+                {"run": run_id, "base": base},
+            ).fetchall()
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {"added": [], "removed": [], "changed": []}
+        for row in rows:
+            grouped[row["kind"]].append(
+                {"id": row["id"], "title": row["name"] or "", "url": row["url"] or "", "date": row["event_date"] or ""}
             )
+        return RunDiff(run_id=run_id, base_run_id=base_run_id, **grouped)
 
     def persist_run(
         self,
@@ -258,10 +513,13 @@ class SQLiteEventStore:
         status: str,
         attempts: int,
         error: str,
-        events: Iterable[Dict[str, str]],
+        events: Iterable[Mapping[str, Any]],
         today: Optional[date] = None,
+        page_hash: str = "",
+        event_set_hash: str = "",
+        unchanged: bool = False,
+        matched_run_id: Optional[int] = None,
     ) -> RunRecord:
-        event_list: List[Dict[str, str]] = list(events)
         with self._connect() as conn:
             conn.execute("BEGIN")
             cursor = conn.execute(
@@ -275,8 +533,11 @@ class SQLiteEventStore:
                     fetched_count,
                     attempts,
                     error,
+                    page_hash,
+                    event_set_hash,
+                    unchanged,
                     updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
                 """,
                 (
                     source,
@@ -284,31 +545,107 @@ class SQLiteEventStore:
                     search_term,
                     record_limit,
                     status,
-                    len(event_list),
+                    0,
                     attempts,
                     error or "",
+                    page_hash,
+                    event_set_hash,
+                    int(unchanged),
                 ),
             )
             run_id = int(cursor.lastrowid)
 
             observed_at = datetime.now(timezone.utc).isoformat()
-            for event in event_list:
-                self._upsert_all_event(conn, event, date_found=observed_at)
+            anchor = today or date.today()
+            upserted = self._upsert_all_events(conn, events, date_found=observed_at, today=anchor)
+            fetched_count = len(upserted.event_ids)
+
+            conn.execute(
+                """
+                UPDATE runs
+                SET fetched_count = ?, inserted_count = ?, updated_count = ?, unchanged_count = ?
+                WHERE id = ?
+                """,
+                (fetched_count, upserted.inserted, upserted.updated, upserted.unchanged, run_id),
+            )
+            self._record_observations(
+                conn,
+                run_id,
+                upserted.observed,
+                matched_run_id=matched_run_id if unchanged else None,
+            )
 
-            self._refresh_weekly_events(conn, today=today)
+            self._refresh_weekly_events(conn, today=today, touched_ids=upserted.changed_ids)
 
         return RunRecord(
             run_id=run_id,
             status=status,
-            fetched_count=len(event_list),
+            fetched_count=fetched_count,
             attempts=attempts,
             error=error or "",
+            unchanged=unchanged,
+            inserted_count=upserted.inserted,
+            updated_count=upserted.updated,
+            unchanged_count=upserted.unchanged,
         )
 
     def fetch_latest_run(self) -> Optional[sqlite3.Row]:
-        with self._connect() as conn:
+        with self._connect(read_only=True) as conn:
             return conn.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
 
+    def fetch_enriched_details(
+        self,
+        events: Iterable[Mapping[str, Any]],
+    ) -> List[Optional[Dict[str, str]]]:
+        keys = [self._canonical_key(event) for event in events]
+        found: Dict[str, Dict[str, str]] = {}
+        with self._connect(read_only=True) as conn:
+            for offset in range(0, len(keys), 500):
+                chunk = keys[offset : offset + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"""
+                    SELECT canonical_key, description, event_location, event_time, enriched_at
+                    FROM "all events"
+                    WHERE enriched_at != '' AND canonical_key IN ({placeholders})
+                    """,
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    found[row["canonical_key"]] = {
+                        "description": row["description"] or "",
+                        "location": row["event_location"] or "",
+                        "time": row["event_time"] or "",
+                        "enriched_at": row["enriched_at"],
+                    }
+        return [found.get(key) for key in keys]
+
+    def fetch_latest_fingerprint(
+        self,
+        *,
+        source: str,
+        search_term: str,
+        record_limit: int,
+    ) -> Optional[Tuple[int, str, str]]:
+        with self._connect(read_only=True) as conn:
+            row = conn.execute(
+                """
+                SELECT id, page_hash, event_set_hash
+                FROM runs
+                WHERE source = ?
+                  AND search_term = ?
+                  AND record_limit = ?
+                  AND status = 'success'
+                  AND page_hash != ''
+                ORDER BY id DESC
+                LIMIT 1
+                """,
+                (source, search_term, record_limit),
+            ).fetchone()
+        if row is None:
+            return None
+        return int(row["id"]), row["page_hash"], row["event_set_hash"]
+
     def count_rows(self, table_name: str) -> int:
         aliases = {
             "all events": '"all events"',
@@ -316,11 +653,18 @@ class SQLiteEventStore:
             "weekly_events": "weekly_events",
         }
         resolved = aliases.get(table_name, table_name)
-        with self._connect() as conn:
+        with self._connect(read_only=True) as conn:
             row = conn.execute(f"SELECT COUNT(*) AS count FROM {resolved}").fetchone()
             return int(row["count"]) if row else 0
 
-    def fetch_events(self, *, limit: int = 0, ai_only: bool = False) -> List[Dict[str, str]]:
+    def fetch_events(
+        self,
+        *,
+        limit: int = 0,
+        ai_only: bool = False,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[Dict[str, str]]:
         query = """
             SELECT
                 w.all_event_id AS id,
@@ -335,33 +679,85 @@ class SQLiteEventStore:
                 '' AS topics,
                 w.date_found AS date_found
             FROM weekly_events w
-            ORDER BY w.event_date ASC, w.id ASC
         """
+        # event_start is ISO text, so day bounds are plain range comparisons
+        # served by idx_weekly_events_start.
+        conditions: List[str] = []
         params: List[object] = []
+        if date_from is not None:
+            conditions.append("w.event_start >= ?")
+            params.append(date_from.isoformat())
+        if date_to is not None:
+            conditions.append("w.event_start < ?")
+            params.append((date_to + timedelta(days=1)).isoformat())
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY w.event_start ASC, w.id ASC"
         if limit > 0:
             query += " LIMIT ?"
             params.append(limit)
 
-        with self._connect() as conn:
+        with self._connect(read_only=True) as conn:
             rows = conn.execute(query, params).fetchall()
 
-        events = [
-            {
-                "id": row["id"],
-                "title": row["title"] or "",
-                "url": row["url"] or "",
-                "description": row["description"] or "",
-                "tags": json.loads(row["tags"] or "[]"),
-                "price": row["price"] or "",
-                "date": row["date"] or "",
-                "time": row["time"] or "",
-                "location": row["location"] or "",
-                "topics": row["topics"] or "",
-                "date_found": row["date_found"] or "",
-            }
-            for row in rows
-        ]
+        events = [self._row_to_event(row) for row in rows]
 
         if ai_only:
-            events = filter_ai_events(events)
+            events = filter_ai_events(events, self.ai_keywords)
         return events
+
+    @staticmethod
+    def _row_to_event(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "title": row["title"] or "",
+            "url": row["url"] or "",
+            "description": row["description"] or "",
+            "tags": json.loads(row["tags"] or "[]"),
+            "price": row["price"] or "",
+            "date": row["date"] or "",
+            "time": row["time"] or "",
+            "location": row["location"] or "",
+            "topics": row["topics"] or "",
+            "date_found": row["date_found"] or "",
+        }
+
+    def search_events(self, query: str, *, limit: int = 20, cursor: Optional[str] = None) -> SearchPage:
+        match = fts_match_expression(query)
+        if not match:
+            return SearchPage(events=[], next_cursor=None)
+        after = decode_search_cursor(cursor) if cursor else None
+        sql = """
+            SELECT
+                a.id AS id,
+                a.name AS title,
+                a.url AS url,
+                a.description AS description,
+                a.tags AS tags,
+                a.price AS price,
+                a.event_date AS date,
+                a.event_time AS time,
+                a.event_location AS location,
+                '' AS topics,
+                a.date_found AS date_found,
+                f.rank AS score
+            FROM events_fts f
+            JOIN "all events" a ON a.id = f.rowid
+            WHERE events_fts MATCH ?
+        """
+        params: List[object] = [match]
+        if after is not None:
+            sql += " AND (f.rank > ? OR (f.rank = ? AND f.rowid > ?))"
+            params.extend([after[0], after[0], after[1]])
+        sql += " ORDER BY f.rank, f.rowid LIMIT ?"
+        params.append(limit + 1)
+
+        with self._connect(read_only=True) as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        page = rows[:limit]
+        events = [{**self._row_to_event(row), "score": -float(row["score"])} for row in page]
+        next_cursor = None
+        if len(rows) > limit and page:
+            next_cursor = encode_search_cursor(float(page[-1]["score"]), int(page[-1]["id"]))
+        return SearchPage(events=events, next_cursor=next_cursor)
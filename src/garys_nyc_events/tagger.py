@@ -3,10 +3,13 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Dict, List, Optional
+from dataclasses import replace
+from typing import Any, List, Mapping, Optional
 
 import requests
 
+from .models import Event, as_event
+
 
 logger = logging.getLogger("garys_nyc_events.tagger")
 
@@ -42,7 +45,7 @@ class GeminiTagger:
     def is_available(self) -> bool:
         return bool(self.api_key)
 
-    def tag_event(self, event: Dict[str, str]) -> List[str]:
+    def tag_event(self, event: Mapping[str, Any]) -> List[str]:
         if not self.is_available():
             return []
 
@@ -57,8 +60,8 @@ class GeminiTagger:
             logger.warning("Gemini tagging failed for %r: %s", event.get("title"), exc)
             return []
 
-    def tag_events(self, events: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        return [{**event, "tags": self.tag_event(event)} for event in events]
+    def tag_events(self, events: List[Mapping[str, Any]]) -> List[Event]:
+        return [replace(as_event(event), tags=tuple(self.tag_event(event))) for event in events]
 
     def _call_gemini(self, prompt: str) -> List[str]:
         if not self.api_key:
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+
+_MONTH_DAY = (
+    r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b\s+\d{1,2}"
+    r"(?:,\s*\d{4})?"
+)
+_WEEKDAY = r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\b\s*(?:,\s*)?"
+_CLOCK = r"\d{1,2}:\d{2}\s?(?:AM|PM)\b"
+_DOLLARS = r"\$\s?\d+(?:\.\d{2})?"
+
+PRICE_REGEX = re.compile(rf"\bFREE\b|{_DOLLARS}", re.IGNORECASE)
+TIME_REGEX = re.compile(rf"\b{_CLOCK}", re.IGNORECASE)
+DATE_REGEXES = [
+    re.compile(rf"\b{_WEEKDAY}{_MONTH_DAY}", re.IGNORECASE),
+    re.compile(rf"\b{_MONTH_DAY}", re.IGNORECASE),
+]
+
+# Every word token shares one leading \b, so positions inside a word are
+# rejected once instead of once per alternative.
+TOKEN_REGEX = re.compile(
+    rf"(?P<dollars>{_DOLLARS})"
+    rf"|\b(?:(?P<weekday_date>{_WEEKDAY}{_MONTH_DAY})"
+    rf"|(?P<date>{_MONTH_DAY})"
+    rf"|(?P<time>{_CLOCK})"
+    r"|(?P<free>FREE\b))",
+    re.IGNORECASE,
+)
+_PRICE_KINDS = {"dollars": "price", "free": "price"}
+
+
+@dataclass(frozen=True)
+class TokenSpan:
+    kind: str
+    start: int
+    end: int
+    text: str
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    date: str = ""
+    time: str = ""
+    price: str = ""
+    spans: Tuple[TokenSpan, ...] = ()
+
+
+EMPTY_SCAN = ScanResult()
+
+
+def _normalize_price(token: str) -> str:
+    return "FREE" if "free" in token.lower() else token.replace(" ", "")
+
+
+def scan_tokens(normalized: str) -> ScanResult:
+    if not normalized:
+        return EMPTY_SCAN
+
+    spans: List[TokenSpan] = []
+    first = {}
+    for match in TOKEN_REGEX.finditer(normalized):
+        kind = _PRICE_KINDS.get(match.lastgroup or "", match.lastgroup or "")
+        span = TokenSpan(kind=kind, start=match.start(), end=match.end(), text=match.group(0))
+        spans.append(span)
+        first.setdefault(kind, span)
+
+    # A weekday-prefixed date anywhere wins over an earlier bare "Mon DD".
+    date_span = first.get("weekday_date") or first.get("date")
+    time_span = first.get("time")
+    price_span = first.get("price")
+    return ScanResult(
+        date=date_span.text if date_span else "",
+        time=time_span.text.upper() if time_span else "",
+        price=_normalize_price(price_span.text) if price_span else "",
+        spans=tuple(spans),
+    )
+
+
+def strip_spans(text: str, spans: Iterable[Tuple[int, int]]) -> str:
+    pieces: List[str] = []
+    cursor = 0
+    for start, end in sorted(spans):
+        if end <= cursor:
+            continue
+        pieces.append(text[cursor : max(cursor, start)])
+        pieces.append(" ")
+        cursor = max(cursor, end)
+    pieces.append(text[cursor:])
+    return "".join(pieces)
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from garys_nyc_events.exceptions import ScraperNetworkError
 
 
 class StubHttpResponse:
-    def __init__(self, text: str, status_code: int = 200) -> None:
+    def __init__(self, text: str, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
         self._text = text
         self.status_code = status_code
+        self.headers = headers or {}
 
     @property
     def text(self) -> str:
         return self._text
 
+    @property
+    def content(self) -> bytes:
+        return self._text.encode("utf-8")
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return "utf-8"
+
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
             raise ScraperNetworkError(f"HTTP {self.status_code}")
@@ -23,9 +32,11 @@ class StubHttpClient:
     def __init__(self, responses: List[StubHttpResponse]) -> None:
         self._responses = list(responses)
         self.calls = 0
+        self.last_headers: dict = {}
 
     def get(self, url: str, *, headers: dict, timeout: int) -> StubHttpResponse:
         self.calls += 1
+        self.last_headers = dict(headers)
         if not self._responses:
             return StubHttpResponse("", status_code=404)
         return self._responses.pop(0)
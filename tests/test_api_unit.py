@@ -1,9 +1,11 @@
+import sqlite3
 from datetime import date
 
+import pytest
 from fastapi.testclient import TestClient
 
 from garys_nyc_events.api.app import create_app
-from garys_nyc_events.api.dependencies import get_config
+from garys_nyc_events.api.dependencies import get_config, get_store
 from garys_nyc_events.storage import SQLiteEventStore
 
 
@@ -101,6 +103,39 @@ def test_events_ai_only_filter(tmp_path, monkeypatch):
     assert all("ai" in " ".join(event["tags"]).lower() or "ai" in event["title"].lower() for event in payload["events"])
 
 
+def test_events_date_range_uses_normalized_start(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "events.db")
+    monkeypatch.setenv("DB_PATH", db_path)
+    monkeypatch.delenv("API_TOKEN", raising=False)
+    get_config.cache_clear()
+    _seed_events(db_path)
+
+    client = TestClient(create_app())
+    inside = client.get("/events?ai_only=false&date_from=2026-02-27&date_to=2026-02-27").json()
+    outside = client.get("/events?ai_only=false&date_from=2026-02-28").json()
+
+    assert [event["title"] for event in inside["events"]] == ["Cooking Club", "NYC AI Summit"]
+    assert outside["count"] == 0
+
+
+def test_events_search_returns_ranked_hits(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "events.db")
+    monkeypatch.setenv("DB_PATH", db_path)
+    monkeypatch.delenv("API_TOKEN", raising=False)
+    get_config.cache_clear()
+    _seed_events(db_path)
+
+    client = TestClient(create_app())
+    response = client.get("/events/search?q=summit")
+    bad_cursor = client.get("/events/search?q=summit&cursor=nope")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [event["title"] for event in payload["events"]] == ["NYC AI Summit"]
+    assert payload["next_cursor"] is None
+    assert bad_cursor.status_code == 400
+
+
 def test_event_by_id_returns_404_for_missing(tmp_path, monkeypatch):
     db_path = str(tmp_path / "events.db")
     monkeypatch.setenv("DB_PATH", db_path)
@@ -139,6 +174,23 @@ def test_runs_list_returns_recent_runs(tmp_path, monkeypatch):
     assert isinstance(response.json(), list)
 
 
+def test_run_diff_route(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "events.db")
+    monkeypatch.setenv("DB_PATH", db_path)
+    monkeypatch.delenv("API_TOKEN", raising=False)
+    get_config.cache_clear()
+    _seed_events(db_path)
+
+    client = TestClient(create_app())
+    response = client.get("/runs/1/diff")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["base_run_id"] is None
+    assert sorted(event["title"] for event in payload["added"]) == ["Cooking Club", "NYC AI Summit"]
+    assert client.get("/runs/42/diff").status_code == 404
+
+
 def test_openapi_json_is_valid(tmp_path, monkeypatch):
     db_path = str(tmp_path / "events.db")
     monkeypatch.setenv("DB_PATH", db_path)
@@ -151,3 +203,42 @@ def test_openapi_json_is_valid(tmp_path, monkeypatch):
     payload = response.json()
     assert "paths" in payload
     assert "/events" in payload["paths"]
+
+
+def test_store_is_built_and_migrated_once_per_process(tmp_path, monkeypatch):
+    import garys_nyc_events.storage as storage_module
+
+    db_path = str(tmp_path / "events.db")
+    monkeypatch.setenv("DB_PATH", db_path)
+    monkeypatch.delenv("API_TOKEN", raising=False)
+    get_config.cache_clear()
+    _seed_events(db_path)
+    calls = []
+    real_migrate = storage_module.migrate
+    monkeypatch.setattr(storage_module, "migrate", lambda conn: calls.append(1) or real_migrate(conn))
+
+    with TestClient(create_app()) as client:
+        for _ in range(3):
+            assert client.get("/events?ai_only=false").status_code == 200
+        assert client.get("/health").status_code == 200
+        assert get_store() is get_store()
+
+    assert calls == [1]
+
+
+def test_replaced_and_shutdown_stores_are_closed(tmp_path, monkeypatch):
+    monkeypatch.delenv("API_TOKEN", raising=False)
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "first.db"))
+    get_config.cache_clear()
+    first = get_store().pool.connection()
+
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "second.db"))
+    get_config.cache_clear()
+    with TestClient(create_app()) as client:
+        assert client.get("/health").status_code == 200
+        second = get_store().pool.connection()
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        second.execute("SELECT 1")
@@ -0,0 +1,70 @@
+from datetime import date
+
+import garys_nyc_events.batch as batch_module
+from garys_nyc_events.batch import EventBatch, keyword_pattern
+from garys_nyc_events.filters import filter_ai_events, filter_events_by_keyword, filter_events_upcoming_week
+from garys_nyc_events.models import Event
+
+
+def _events():
+    rows = [
+        ("AI Founders Night", "Fri, Feb 27", ""),
+        ("Design Mixer", "Sat, Feb 28", "Talks on machine learning"),
+        ("Crypto Brunch", "Mon, Mar 9", ""),
+        ("ÉCOLE du Web", "Fri, Feb 27", "İstanbul founders"),
+        ("Untitled", "", "LLM office hours"),
+    ]
+    return [
+        Event(title=title, date=when, price="", url=f"https://x/events/{index}", source="web", description=description)
+        for index, (title, when, description) in enumerate(rows)
+    ]
+
+
+def test_batch_filters_match_list_filters():
+    events = _events()
+    batch = EventBatch(events)
+    today = date(2026, 2, 26)
+
+    assert batch.filter_keyword(" ai ").records == filter_events_by_keyword(events, " ai ")
+    assert batch.filter_keyword("école").records == filter_events_by_keyword(events, "école")
+    assert batch.filter_ai().records == filter_ai_events(events)
+    assert batch.filter_upcoming_week(today).records == filter_events_upcoming_week(events, today=today)
+    assert batch.filter_keyword("").records == events
+
+
+def test_batch_accepts_plain_dict_rows():
+    rows = [{"title": "GPT meetup", "description": None}, {"title": "Yoga"}]
+    assert EventBatch(rows).filter_ai().records == [rows[0]]
+
+
+def test_chained_filters_reuse_derived_columns(monkeypatch):
+    batch = EventBatch(_events())
+    batch.lower_haystacks
+    batch.parsed_dates(date(2026, 2, 26))
+
+    calls = []
+    monkeypatch.setattr(batch_module, "parse_event_date", lambda raw, anchor: calls.append(raw))
+    narrowed = batch.filter_ai().filter_upcoming_week(date(2026, 2, 26))
+
+    assert [event.title for event in narrowed] == ["AI Founders Night", "Design Mixer"]
+    assert calls == []
+
+
+def test_date_column_parses_each_distinct_string_once(monkeypatch):
+    calls = []
+
+    def counting_parse(raw, anchor):
+        calls.append(raw)
+        return date(2026, 2, 27) if raw else None
+
+    monkeypatch.setattr(batch_module, "parse_event_date", counting_parse)
+    EventBatch(_events() * 50).filter_upcoming_week(date(2026, 2, 26))
+
+    assert sorted(calls) == sorted({"Fri, Feb 27", "Sat, Feb 28", "Mon, Mar 9", ""})
+
+
+def test_keyword_pattern_escapes_keywords():
+    pattern = keyword_pattern(["c++", "A.I."])
+    assert pattern.search("learn c++ today")
+    assert pattern.search("a.i. night")
+    assert not pattern.search("axi night")
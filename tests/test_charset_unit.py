@@ -0,0 +1,54 @@
+import codecs
+
+import pytest
+
+from garys_nyc_events.charset import charset_from_content_type, decode_html, detect_encoding, sniff_meta_charset
+from garys_nyc_events.parsing import build_tree
+from garys_nyc_events.scraper import GarysGuideScraper
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("text/html; charset=UTF-8", "utf-8"),
+        ('text/html; charset="iso-8859-1"', "windows-1252"),
+        ("text/html", None),
+        ("text/html; charset=made-up", None),
+        (None, None),
+    ],
+)
+def test_charset_from_content_type(header, expected):
+    assert charset_from_content_type(header) == expected
+
+
+def test_sniff_meta_charset_reads_both_meta_forms():
+    assert sniff_meta_charset(b"<head><meta charset='shift_jis'></head>") == "shift_jis"
+    assert (
+        sniff_meta_charset(b'<meta http-equiv="Content-Type" content="text/html; charset=windows-1252">')
+        == "windows-1252"
+    )
+    assert sniff_meta_charset(b"<meta charset='utf-16'>") == "utf-8"
+    assert sniff_meta_charset(b"<p>no meta</p>") is None
+
+
+def test_detect_encoding_prefers_bom_then_header_then_meta():
+    meta = b"<meta charset='windows-1252'>"
+    assert detect_encoding(codecs.BOM_UTF8 + meta, "iso-8859-1") == "utf-8"
+    assert detect_encoding(meta, "utf-8") == "utf-8"
+    assert detect_encoding(meta) == "windows-1252"
+    assert detect_encoding(b"<p></p>") == "utf-8"
+
+
+def test_decode_html_strips_bom_and_survives_mislabelled_bytes():
+    assert decode_html(codecs.BOM_UTF8 + "Café".encode("utf-8")) == "Café"
+    assert decode_html("Café".encode("windows-1252")) == "Café"
+    assert decode_html("already text") == "already text"
+
+
+def test_parsers_accept_bytes():
+    html = "<meta charset='windows-1252'><table><tr><td>Thu Feb 06</td><td><a href='/events/1'>Café Night</a> $5</td></tr></table>"
+    payload = html.encode("windows-1252")
+
+    assert build_tree(payload, "html.parser").a.get_text() == "Café Night"
+    events = GarysGuideScraper(delay_seconds=0).parse_events(payload)
+    assert events[0]["title"] == "Café Night"
@@ -0,0 +1,72 @@
+import sqlite3
+import threading
+from datetime import date
+
+import pytest
+
+from garys_nyc_events.connections import SQLiteConnectionPool, SQLiteTuning
+from garys_nyc_events.storage import SQLiteEventStore
+
+
+def test_writer_is_tuned_and_reused_per_thread(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "events.db"), SQLiteTuning(mmap_size=1 << 20, cache_size_kib=512, busy_timeout_ms=250))
+    writer = pool.connection()
+
+    assert pool.connection() is writer
+    assert writer.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert writer.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert writer.execute("PRAGMA busy_timeout").fetchone()[0] == 250
+    assert writer.execute("PRAGMA cache_size").fetchone()[0] == -512
+    assert writer.execute("PRAGMA temp_store").fetchone()[0] == 2
+    assert writer.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    others = []
+    thread = threading.Thread(target=lambda: others.append(pool.connection()))
+    thread.start()
+    thread.join()
+    assert others[0] is not writer
+    pool.close()
+
+
+def test_reader_is_read_only(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "events.db"))
+    pool.connection().execute("CREATE TABLE t (x INTEGER)")
+    pool.connection().commit()
+    reader = pool.connection(read_only=True)
+
+    assert reader is not pool.connection()
+    assert reader.execute("PRAGMA query_only").fetchone()[0] == 1
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("INSERT INTO t VALUES (1)")
+    pool.close()
+
+
+def test_reads_do_not_wait_for_open_write_transaction(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"), tuning=SQLiteTuning(busy_timeout_ms=100))
+    store.init_schema()
+    store.persist_run(
+        source="web",
+        fetched_at="2026-02-26T00:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        events=[{"title": "AI Summit", "url": "https://www.garysguide.com/events/1", "date": "2026-02-27"}],
+        today=date(2026, 2, 26),
+    )
+
+    blocker = sqlite3.connect(str(tmp_path / "events.db"))
+    blocker.execute("BEGIN IMMEDIATE")
+    blocker.execute('UPDATE "all events" SET name = ?', ("Renamed",))
+    try:
+        counts = []
+        thread = threading.Thread(target=lambda: counts.append(store.count_rows("all events")))
+        thread.start()
+        thread.join()
+        assert counts == [1]
+        assert [event["title"] for event in store.fetch_events()] == ["AI Summit"]
+    finally:
+        blocker.rollback()
+        blocker.close()
+        store.close()
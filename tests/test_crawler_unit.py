@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+from garys_nyc_events.async_http import HttpxAsyncHttpClient
+from garys_nyc_events.crawler import AsyncCrawler, TokenBucket
+from garys_nyc_events.exceptions import ResponseTooLargeError, ScraperNetworkError
+from garys_nyc_events.protocols import AsyncHttpClient
+from garys_nyc_events.scraper import GarysGuideScraper
+from tests.http_doubles import StubHttpResponse
+
+
+PAGE = Path("tests/fixtures/sample_events_page.html").read_text()
+
+
+class _SlowAsyncClient:
+    def __init__(self, delay: float = 0.02, failing=()) -> None:
+        self.delay = delay
+        self.failing = set(failing)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.urls = []
+
+    async def get(self, url: str, *, headers: dict, timeout: int) -> StubHttpResponse:
+        self.urls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if url in self.failing:
+            return StubHttpResponse("", status_code=503)
+        return StubHttpResponse(PAGE)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        type(self).hits.append(time.monotonic())
+        body = PAGE.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def stub_server():
+    _StubHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_slow_async_client_satisfies_protocol():
+    assert isinstance(_SlowAsyncClient(), AsyncHttpClient)
+    assert isinstance(HttpxAsyncHttpClient(), AsyncHttpClient)
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    now = {"value": 0.0}
+    waits = []
+
+    async def fake_sleep(seconds: float) -> None:
+        waits.append(seconds)
+        now["value"] += seconds
+
+    async def scenario():
+        bucket = TokenBucket(2.0, burst=2, clock=lambda: now["value"], sleep=fake_sleep)
+        for _ in range(4):
+            await bucket.acquire()
+
+    asyncio.run(scenario())
+
+    assert waits == [pytest.approx(0.5), pytest.approx(0.5)]
+    assert now["value"] == pytest.approx(1.0)
+
+
+def test_crawler_bounds_concurrency_and_preserves_order():
+    client = _SlowAsyncClient()
+    crawler = AsyncCrawler(client, rate_per_second=1000, burst=100, max_concurrency=3)
+    urls = [f"https://www.garysguide.com/events?page={index}" for index in range(9)]
+
+    results = asyncio.run(crawler.fetch_all(urls + urls[:2], headers={}, timeout=5))
+
+    assert [result.url for result in results] == urls
+    assert all(result.ok for result in results)
+    assert client.max_in_flight == 3
+
+
+def test_crawler_reports_failed_pages_without_aborting():
+    failing = "https://www.garysguide.com/events?page=2"
+    crawler = AsyncCrawler(_SlowAsyncClient(failing=[failing]), rate_per_second=1000, burst=10)
+
+    results = asyncio.run(
+        crawler.fetch_all(["https://www.garysguide.com/events", failing], headers={}, timeout=5)
+    )
+
+    assert results[0].ok
+    assert isinstance(results[1].error, ScraperNetworkError)
+
+
+def test_scraper_merges_events_from_concurrent_pages():
+    crawler = AsyncCrawler(_SlowAsyncClient(), rate_per_second=1000, burst=10)
+    scraper = GarysGuideScraper(delay_seconds=0)
+
+    events = asyncio.run(
+        scraper.get_events_async(
+            crawler,
+            ["https://www.garysguide.com/events", "https://www.garysguide.com/events?page=2"],
+        )
+    )
+
+    assert len(events) == 2
+
+
+def test_scraper_raises_when_every_page_fails():
+    url = "https://www.garysguide.com/events"
+    crawler = AsyncCrawler(_SlowAsyncClient(failing=[url]), rate_per_second=1000, burst=10)
+
+    with pytest.raises(ScraperNetworkError):
+        asyncio.run(GarysGuideScraper(delay_seconds=0).get_events_async(crawler, [url]))
+
+
+def test_crawler_rate_limits_per_host_against_local_server(stub_server):
+    async def scenario():
+        client = HttpxAsyncHttpClient()
+        try:
+            crawler = AsyncCrawler(client, rate_per_second=20, burst=1, max_concurrency=4)
+            urls = [f"{stub_server}/events?page={index}" for index in range(5)]
+            return await crawler.fetch_all(urls, headers={}, timeout=5)
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(scenario())
+
+    assert all(result.ok for result in results)
+    assert "NYC Tech Meetup" in results[0].text
+    hits = sorted(_StubHandler.hits)
+    assert len(hits) == 5
+    assert hits[-1] - hits[0] >= 4 / 20 * 0.9
+
+
+def test_httpx_client_caps_streamed_body_and_decodes_meta_charset():
+    def handler(request):
+        if request.url.path == "/big":
+            return httpx.Response(200, content=b"x" * 5000)
+        return httpx.Response(200, content="<meta charset='windows-1252'>Café".encode("windows-1252"))
+
+    async def scenario():
+        client = HttpxAsyncHttpClient(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), max_body_bytes=1000)
+        try:
+            page = await client.get("https://example.test/page", headers={}, timeout=5)
+            with pytest.raises(ResponseTooLargeError):
+                await client.get("https://example.test/big", headers={}, timeout=5)
+            return page
+        finally:
+            await client.aclose()
+
+    page = asyncio.run(scenario())
+    assert page.text.endswith("Café")
@@ -0,0 +1,92 @@
+from datetime import date, datetime, time
+
+import pytest
+from dateutil import parser as date_parser
+
+from garys_nyc_events import dates as dates_module
+from garys_nyc_events.dates import clear_date_cache, normalize_event_start, parse_event_date, parse_event_time
+
+
+TODAY = date(2026, 2, 26)
+
+
+def _dateutil(value, today):
+    try:
+        return date_parser.parse(value, fuzzy=True, default=datetime(today.year, today.month, today.day)).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Tue, Mar 3",
+        "Thu Feb 06",
+        "Feb 25",
+        "Feb 25, 2026",
+        "Sept 9",
+        "2026-02-27",
+        "  Fri,   Feb 27 ",
+        "Wed, Feb 30",
+        "Feb 29",
+        "Feb 32",
+        "Sat",
+        "Mar 3 @ 6:30pm",
+        "Weekly meetup",
+    ],
+)
+def test_matches_dateutil(value):
+    assert parse_event_date(value, TODAY) == _dateutil(value, TODAY)
+
+
+def test_blank_values_are_none():
+    assert parse_event_date("", TODAY) is None
+    assert parse_event_date("   ", TODAY) is None
+
+
+def test_known_shapes_skip_dateutil(monkeypatch):
+    clear_date_cache()
+    monkeypatch.setattr(dates_module.date_parser, "parse", pytest.fail)
+
+    assert parse_event_date("Tue, Mar 3", TODAY) == date(2026, 3, 3)
+    assert parse_event_date("Feb 25, 2025", TODAY) == date(2025, 2, 25)
+    assert parse_event_date("2026-02-27", TODAY) == date(2026, 2, 27)
+
+
+def test_fallback_is_memoized_per_anchor(monkeypatch):
+    clear_date_cache()
+    calls = []
+    original = dates_module.date_parser.parse
+
+    def counting_parse(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(dates_module.date_parser, "parse", counting_parse)
+    for _ in range(3):
+        parse_event_date("Mar 3 @ 6:30pm", TODAY)
+    parse_event_date("Mar 3 @ 6:30pm", date(2027, 1, 1))
+
+    assert calls == ["Mar 3 @ 6:30pm", "Mar 3 @ 6:30pm"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("7:00 PM", time(19, 0)),
+        ("6:30pm", time(18, 30)),
+        ("12:00 PM - 2:00 PM", time(12, 0)),
+        ("12am", time(0, 0)),
+        ("19:15", time(19, 15)),
+        ("TBD", None),
+        ("", None),
+    ],
+)
+def test_parse_event_time(value, expected):
+    assert parse_event_time(value) == expected
+
+
+def test_normalize_event_start():
+    assert normalize_event_start("Tue, Mar 3", "6:30pm", TODAY) == ("2026-03-03T18:30", "2026-03-03")
+    assert normalize_event_start("2026-02-27", "", TODAY) == ("2026-02-27T00:00", "2026-02-27")
+    assert normalize_event_start("Weekly", "7pm", TODAY) == ("", "")
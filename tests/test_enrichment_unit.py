@@ -0,0 +1,155 @@
+import asyncio
+from dataclasses import replace
+from datetime import date
+
+from garys_nyc_events.crawler import AsyncCrawler
+from garys_nyc_events.detail_parser import parse_event_detail
+from garys_nyc_events.enrichment import DetailEnricher, merge_details
+from garys_nyc_events.models import EnrichedEvent, Event
+from garys_nyc_events.storage import SQLiteEventStore
+from tests.http_doubles import StubHttpResponse
+
+
+DETAIL_PAGE = """
+<html><head><meta property="og:description" content="Short teaser"></head>
+<body>
+  <div itemscope itemtype="https://schema.org/Event">
+    <meta itemprop="startDate" content="2026-02-27T19:00">
+    <div itemprop="location">Cornell Tech, 2 West Loop Rd, Roosevelt Island</div>
+    <div itemprop="description">A full evening of AI demos, lightning talks and networking.</div>
+  </div>
+</body></html>
+"""
+
+
+class _DetailClient:
+    def __init__(self, pages) -> None:
+        self.pages = pages
+        self.urls = []
+
+    async def get(self, url: str, *, headers: dict, timeout: int) -> StubHttpResponse:
+        self.urls.append(url)
+        if url not in self.pages:
+            return StubHttpResponse("", status_code=404)
+        return StubHttpResponse(self.pages[url])
+
+
+def _event(index: int, **overrides) -> Event:
+    event = Event(
+        title=f"AI Event {index}",
+        url=f"https://www.garysguide.com/events/{index}",
+        date="Fri, Feb 27",
+        description="A full evening...",
+        price="FREE",
+        source="garysguide_web",
+    )
+    if "enriched_at" in overrides:
+        return EnrichedEvent(**{**event, **overrides})
+    return replace(event, **overrides)
+
+
+def _enricher(client) -> DetailEnricher:
+    crawler = AsyncCrawler(client, rate_per_second=1000, burst=10, max_concurrency=2)
+    return DetailEnricher(crawler, headers={"User-Agent": "test"})
+
+
+def test_parse_event_detail_reads_schema_org_fields():
+    details = parse_event_detail(DETAIL_PAGE, "html.parser")
+
+    assert details["description"].startswith("A full evening of AI demos")
+    assert details["location"].startswith("Cornell Tech")
+    assert details["time"] == "7:00 PM"
+
+
+def test_parse_event_detail_falls_back_to_meta_description_and_text_time():
+    html = "<html><head><meta name='description' content='Founders meetup'></head><body>Doors 6:30 pm</body></html>"
+
+    details = parse_event_detail(html, "html.parser")
+
+    assert details == {"description": "Founders meetup", "location": "", "time": "6:30 PM"}
+
+
+def test_merge_details_keeps_longer_listing_description():
+    merged = merge_details(
+        {"description": "A long listing description", "location": "NYC"},
+        {"description": "Short", "location": "Cornell Tech", "time": "7:00 PM"},
+        enriched_at="2026-02-26T00:00:00+00:00",
+    )
+
+    assert merged["description"] == "A long listing description"
+    assert merged["location"] == "Cornell Tech"
+    assert merged["time"] == "7:00 PM"
+    assert merged["enriched_at"] == "2026-02-26T00:00:00+00:00"
+
+
+def test_enricher_fetches_detail_pages_and_merges_fields():
+    client = _DetailClient({"https://www.garysguide.com/events/1": DETAIL_PAGE})
+
+    events = asyncio.run(_enricher(client).enrich([_event(1)], today=date(2026, 2, 26)))
+
+    assert events[0]["description"].startswith("A full evening of AI demos")
+    assert events[0]["time"] == "7:00 PM"
+    assert events[0]["enriched_at"]
+
+
+def test_enricher_skips_known_upcoming_events():
+    client = _DetailClient({"https://www.garysguide.com/events/2": DETAIL_PAGE})
+    known = [
+        {"description": "Stored full description", "location": "Stored venue", "time": "6:00 PM", "enriched_at": "x"},
+        None,
+    ]
+
+    events = asyncio.run(
+        _enricher(client).enrich([_event(1), _event(2)], known, today=date(2026, 2, 26))
+    )
+
+    assert client.urls == ["https://www.garysguide.com/events/2"]
+    assert events[0]["description"] == "Stored full description"
+    assert events[0]["location"] == "Stored venue"
+
+
+def test_enricher_refetches_known_events_that_are_past():
+    client = _DetailClient({"https://www.garysguide.com/events/1": DETAIL_PAGE})
+    known = [{"description": "old", "location": "", "time": "", "enriched_at": "x"}]
+
+    asyncio.run(_enricher(client).enrich([_event(1, date="Mon, Feb 2")], known, today=date(2026, 2, 26)))
+
+    assert client.urls == ["https://www.garysguide.com/events/1"]
+
+
+def test_enricher_keeps_listing_fields_when_detail_fetch_fails():
+    client = _DetailClient({})
+    event = _event(1, location="Midtown")
+
+    events = asyncio.run(_enricher(client).enrich([event], today=date(2026, 2, 26)))
+
+    assert events == [event]
+
+
+def test_store_returns_enrichment_and_preserves_it_on_plain_upserts(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    enriched = _event(1, description="Full description", location="Cornell Tech", enriched_at="2026-02-26")
+
+    for events in ([enriched], [_event(1, location="Listing venue")]):
+        store.persist_run(
+            source="web",
+            fetched_at="2026-02-26T00:00:00+00:00",
+            search_term="",
+            record_limit=0,
+            status="success",
+            attempts=1,
+            error="",
+            events=events,
+            today=date(2026, 2, 26),
+        )
+
+    details = store.fetch_enriched_details([_event(1), _event(2)])
+
+    assert details[1] is None
+    assert details[0] == {
+        "description": "Full description",
+        "location": "Cornell Tech",
+        "time": "",
+        "enriched_at": "2026-02-26",
+    }
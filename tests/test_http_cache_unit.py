@@ -0,0 +1,111 @@
+import os
+import time
+
+from garys_nyc_events.http_cache import CachingHttpClient
+from garys_nyc_events.protocols import HttpClient
+from garys_nyc_events.scraper import GarysGuideScraper
+from tests.http_doubles import StubHttpClient, StubHttpResponse
+
+
+URL = "https://www.garysguide.com/events"
+PAGE = "<table><tr><td>Thu Feb 06</td><td><a href='/events/1'>AI Event</a> FREE</td></tr></table>"
+
+
+def _fresh(text: str = PAGE) -> StubHttpResponse:
+    return StubHttpResponse(text, headers={"ETag": '"v1"', "Last-Modified": "Thu, 05 Feb 2026 00:00:00 GMT"})
+
+
+def test_caching_client_satisfies_http_client_protocol(tmp_path):
+    assert isinstance(CachingHttpClient(StubHttpClient([]), str(tmp_path)), HttpClient)
+
+
+def test_second_request_sends_validators(tmp_path):
+    inner = StubHttpClient([_fresh(), StubHttpResponse("", status_code=304)])
+    client = CachingHttpClient(inner, str(tmp_path))
+
+    client.get(URL, headers={"User-Agent": "test"}, timeout=5)
+    client.get(URL, headers={"User-Agent": "test"}, timeout=5)
+
+    assert inner.last_headers["If-None-Match"] == '"v1"'
+    assert inner.last_headers["If-Modified-Since"] == "Thu, 05 Feb 2026 00:00:00 GMT"
+    assert inner.last_headers["User-Agent"] == "test"
+
+
+def test_not_modified_returns_cached_body(tmp_path):
+    inner = StubHttpClient([_fresh(), StubHttpResponse("", status_code=304)])
+    client = CachingHttpClient(inner, str(tmp_path))
+
+    client.get(URL, headers={}, timeout=5)
+    response = client.get(URL, headers={}, timeout=5)
+
+    response.raise_for_status()
+    assert response.text == PAGE
+    assert response.not_modified is True
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    inner = StubHttpClient([StubHttpResponse(PAGE), StubHttpResponse(PAGE)])
+    client = CachingHttpClient(inner, str(tmp_path))
+
+    client.get(URL, headers={}, timeout=5)
+    client.get(URL, headers={}, timeout=5)
+
+    assert "If-None-Match" not in inner.last_headers
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_expired_entries_are_fetched_unconditionally(tmp_path):
+    inner = StubHttpClient([_fresh(), _fresh()])
+    client = CachingHttpClient(inner, str(tmp_path), max_age_seconds=0)
+
+    client.get(URL, headers={}, timeout=5)
+    time.sleep(0.01)
+    client.get(URL, headers={}, timeout=5)
+
+    assert "If-None-Match" not in inner.last_headers
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    inner = StubHttpClient([_fresh(), _fresh(), _fresh()])
+    client = CachingHttpClient(inner, str(tmp_path), max_entries=2)
+
+    client.get(f"{URL}/a", headers={}, timeout=5)
+    client.get(f"{URL}/b", headers={}, timeout=5)
+    stale = client._entry_path(f"{URL}/a")
+    os.utime(stale, (time.time() - 60, time.time() - 60))
+    client.get(f"{URL}/c", headers={}, timeout=5)
+
+    assert not stale.exists()
+    assert client._entry_path(f"{URL}/b").exists()
+    assert client._entry_path(f"{URL}/c").exists()
+
+
+def test_scraper_reuses_cached_body_on_not_modified(tmp_path):
+    inner = StubHttpClient([_fresh(), StubHttpResponse("", status_code=304)])
+    scraper = GarysGuideScraper(delay_seconds=0, http_client=CachingHttpClient(inner, str(tmp_path)))
+
+    assert scraper.get_events() == scraper.get_events()
+
+
+def test_not_modified_listing_skips_parse_in_runner(tmp_path, monkeypatch):
+    from garys_nyc_events import runner_once as runner
+    from garys_nyc_events.config import PipelineConfig
+    from garys_nyc_events.storage import SQLiteEventStore
+
+    inner = StubHttpClient([_fresh(), StubHttpResponse("", status_code=304)])
+    scraper = GarysGuideScraper(delay_seconds=0, http_client=CachingHttpClient(inner, str(tmp_path / "cache")))
+    parses = []
+    parse = scraper.parse_events_iter
+    monkeypatch.setattr(scraper, "parse_events_iter", lambda html: parses.append(html) or parse(html))
+    monkeypatch.setattr(runner, "_default_scraper", lambda _cfg: scraper)
+    config = PipelineConfig(db_path=str(tmp_path / "events.db"), tagging_enabled=False, retry_attempts=1)
+    store = SQLiteEventStore(config.db_path)
+
+    runner.run_once(config=config, store=store)
+    second = runner.run_once(config=config, store=store)
+
+    assert inner.calls == 2
+    assert inner.last_headers["If-None-Match"] == '"v1"'
+    assert len(parses) == 1
+    assert second.unchanged is True
+    assert second.fetched_count == 0
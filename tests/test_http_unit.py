@@ -0,0 +1,138 @@
+from datetime import timedelta
+from typing import Dict, Optional
+
+import pytest
+import requests
+
+from garys_nyc_events.exceptions import ResponseTooLargeError, ScraperTimeoutError
+from garys_nyc_events.http import ACCEPT_ENCODING, CHUNK_BYTES, RequestsHttpClient
+
+
+class _Response:
+    def __init__(
+        self,
+        text: str = "<html></html>",
+        status_code: int = 200,
+        *,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.content = text.encode("utf-8") if content is None else content
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.url = "https://www.garysguide.com/events"
+        self.elapsed = timedelta(milliseconds=40)
+        self.closed = False
+        self.chunks_read = 0
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.content), chunk_size):
+            self.chunks_read += 1
+            yield self.content[start : start + chunk_size]
+
+    def close(self) -> None:
+        self.closed = True
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _Session(requests.Session):
+    def __init__(self, response=None, exc=None) -> None:
+        super().__init__()
+        self._stub_response = response or _Response()
+        self._stub_exc = exc
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        if self._stub_exc is not None:
+            raise self._stub_exc
+        return self._stub_response
+
+
+def test_client_reuses_one_session_across_requests():
+    session = _Session()
+    client = RequestsHttpClient(session=session)
+
+    client.get("https://www.garysguide.com/events", headers={}, timeout=5)
+    client.get("https://www.garysguide.com/events/1", headers={}, timeout=5)
+
+    assert len(session.calls) == 2
+
+
+def test_client_mounts_pooled_adapter_with_configured_size():
+    session = _Session()
+    RequestsHttpClient(session=session, pool_size=4)
+
+    adapter = session.get_adapter("https://www.garysguide.com/events")
+    assert adapter._pool_maxsize == 4
+
+
+def test_client_advertises_compression_and_keep_alive():
+    session = _Session()
+    RequestsHttpClient(session=session)
+
+    assert session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+    assert "gzip" in ACCEPT_ENCODING
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_client_records_per_request_timing():
+    client = RequestsHttpClient(session=_Session(), timing_history=2)
+
+    for index in range(3):
+        client.get(f"https://www.garysguide.com/events/{index}", headers={}, timeout=5)
+
+    assert len(client.timings) == 2
+    timing = client.last_timing
+    assert timing is not None
+    assert timing.url.endswith("/2")
+    assert timing.status_code == 200
+    assert timing.ttfb_seconds == pytest.approx(0.04)
+    assert timing.total_seconds >= 0
+    assert timing.body_bytes == len("<html></html>")
+
+
+def test_client_maps_session_timeout_to_domain_error():
+    client = RequestsHttpClient(session=_Session(exc=requests.Timeout("slow")))
+
+    with pytest.raises(ScraperTimeoutError):
+        client.get("https://www.garysguide.com/events", headers={}, timeout=5)
+
+    assert client.last_timing is None
+
+
+def test_client_streams_body_and_decodes_declared_charset():
+    body = "<html><p>Café Meetup</p></html>".encode("iso-8859-1")
+    response = _Response(content=body, headers={"Content-Type": "text/html; charset=ISO-8859-1"})
+    session = _Session(response=response)
+
+    result = RequestsHttpClient(session=session).get("https://www.garysguide.com/events", headers={}, timeout=5)
+
+    assert session.calls[0][1]["stream"] is True
+    assert response.closed
+    assert result.content == body
+    assert result.encoding == "windows-1252"
+    assert "Café Meetup" in result.text
+
+
+def test_client_rejects_body_over_limit_while_streaming():
+    response = _Response(content=b"x" * (CHUNK_BYTES * 4))
+    client = RequestsHttpClient(session=_Session(response=response), max_body_bytes=CHUNK_BYTES + 1)
+
+    with pytest.raises(ResponseTooLargeError):
+        client.get("https://www.garysguide.com/events", headers={}, timeout=5)
+
+    assert response.chunks_read == 2
+    assert response.closed
+
+
+def test_client_rejects_declared_length_over_limit_without_reading():
+    response = _Response(content=b"x" * 10, headers={"Content-Length": "999"})
+    client = RequestsHttpClient(session=_Session(response=response), max_body_bytes=100)
+
+    with pytest.raises(ResponseTooLargeError):
+        client.get("https://www.garysguide.com/events", headers={}, timeout=5)
+
+    assert response.chunks_read == 0
@@ -0,0 +1,63 @@
+from garys_nyc_events.config import load_config_from_env
+from garys_nyc_events.filters import filter_ai_events, filter_events_by_keyword
+from garys_nyc_events.keywords import AI_KEYWORDS, keyword_pattern, keyword_terms, parse_keywords
+
+
+def test_pattern_matches_whole_words_only():
+    search = keyword_pattern(AI_KEYWORDS).search
+    assert search("nyc ai summit")
+    assert search("hands-on machine learning")
+    assert not search("email marketing in a big chair")
+    assert not search("html basics")
+
+
+def test_pattern_prefers_longest_keyword():
+    match = keyword_pattern(AI_KEYWORDS).search("a generative ai night")
+    assert match.group(0) == "generative ai"
+
+
+def test_pattern_handles_punctuated_keywords_and_empty_sets():
+    assert keyword_pattern(["c++"]).search("learn c++ today")
+    assert not keyword_pattern(["c++"]).search("learn c++x")
+    assert not keyword_pattern([]).search("anything")
+    assert keyword_pattern([" AI "]) is keyword_pattern(["ai"])
+
+
+def test_filters_skip_substring_hits():
+    events = [
+        {"title": "Email Marketing", "description": "chair yoga"},
+        {"title": "AI Founders", "description": ""},
+    ]
+    assert filter_ai_events(events) == [events[1]]
+    assert filter_events_by_keyword(events, "ai") == [events[1]]
+
+
+def test_filter_ai_events_accepts_custom_keywords():
+    events = [{"title": "Quantum Night", "description": ""}, {"title": "AI Night", "description": ""}]
+    assert filter_ai_events(events, {"quantum"}) == [events[0]]
+
+
+def test_ai_keywords_come_from_env(monkeypatch):
+    monkeypatch.setenv("AI_KEYWORDS", "Quantum, agents,,")
+    assert load_config_from_env().ai_keywords == {"quantum", "agents"}
+    monkeypatch.delenv("AI_KEYWORDS")
+    assert load_config_from_env().ai_keywords == AI_KEYWORDS
+    assert parse_keywords(" ") == frozenset()
+
+
+COMPOUND_AI_TITLES = ["LLMs in Production", "GenAI Summit", "OpenAI DevDay", "ChatGPT hack night", "Custom GPTs Workshop"]
+
+
+def test_ai_filters_keep_plural_and_compound_titles():
+    events = [{"title": title, "description": ""} for title in COMPOUND_AI_TITLES]
+    events.append({"title": "Email Marketing Said Chairs", "description": "trains and rails"})
+
+    assert filter_ai_events(events) == events[:-1]
+    assert filter_events_by_keyword(events, "AI") == events[:-1]
+
+
+def test_keyword_terms_expand_only_the_ai_search_term():
+    assert keyword_terms(" AI ", {"quantum"}) == {"ai", "quantum"}
+    assert keyword_terms("Python") == {"python"}
+    assert keyword_terms("  ") == frozenset()
+    assert keyword_pattern(["meetup"]).search("two meetups tonight")
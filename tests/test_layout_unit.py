@@ -0,0 +1,105 @@
+from bs4 import BeautifulSoup
+
+from garys_nyc_events.layout import LayoutPlan, LayoutPlanCache, NodePaths, learn_plan, select_path, structure_fingerprint
+from garys_nyc_events.scraper import GarysGuideScraper
+
+
+def _row(index: int) -> str:
+    return (
+        "<tr><td>Thu Feb 06</td>"
+        f"<td><table><tr><td><a href='/events/{index}'>Event {index}</a></td></tr></table></td>"
+        "<td>$10</td></tr>"
+    )
+
+
+def _listing(count: int, *, wrapper: str = "table", row_class: str = "") -> str:
+    rows = "".join(_row(index) for index in range(count))
+    if row_class:
+        rows = rows.replace("<tr><td>Thu", f"<tr class='{row_class}'><td>Thu")
+    return f"<html><body><a href='/events/nav'>All events</a><{wrapper} class='events'>{rows}</{wrapper}></body></html>"
+
+
+def test_structure_fingerprint_ignores_order_and_duplicates():
+    paths = [("html", "body", "table"), ("html", "body", "div")]
+    assert structure_fingerprint(paths) == structure_fingerprint(list(reversed(paths)) + paths)
+    assert structure_fingerprint(paths) != structure_fingerprint(paths[:1])
+
+
+def test_select_path_walks_down_to_the_rows_a_node_path_names():
+    soup = BeautifulSoup(_listing(3), "html.parser")
+    rows = soup.select("table.events > tr")
+    paths = NodePaths()
+
+    assert [paths.path(row) for row in rows] == [("html", "body", "table.events", "tr")] * 3
+    assert select_path(soup, paths.path(rows[0])) == rows
+    assert select_path(soup, ("html", "body", "ul", "li")) == []
+
+
+def test_learn_plan_needs_a_repeated_row_path():
+    assert learn_plan("fp", [("html", "tr")]) is None
+    plan = learn_plan("fp", [("html", "tr"), ("html", "tr"), ("html", "div")])
+    assert plan == LayoutPlan(fingerprint="fp", row_path=("html", "tr"))
+
+
+def test_scraper_learns_plan_and_reuses_it_with_identical_results():
+    html = _listing(4)
+    scraper = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser")
+
+    first = scraper.parse_events(html)
+    assert scraper.last_layout_plan is None
+
+    second = scraper.parse_events(html)
+    assert scraper.last_layout_plan is not None
+    assert scraper.last_layout_plan.row_path[-2:] == ("table.events", "tr")
+    assert second == first
+    assert {event["price"] for event in second if event["title"].startswith("Event")} == {"$10"}
+
+
+def test_stale_plan_falls_back_to_heuristics():
+    html = _listing(3)
+    scraper = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser")
+    expected = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser").parse_events(html)
+    scraper.parse_events(html)
+    (fingerprint,) = scraper.layout_cache._plans
+    scraper.layout_cache.put(LayoutPlan(fingerprint=fingerprint, row_path=("html", "body", "ul", "li")))
+
+    assert scraper.parse_events(html) == expected
+    assert scraper.last_layout_plan is None
+    assert scraper.layout_cache.get(fingerprint).row_path[-1] == "tr"
+
+
+def test_changed_rows_under_same_table_skeleton_fall_back_and_relearn(caplog):
+    scraper = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser")
+    scraper.parse_events(_listing(3))
+    (fingerprint,) = scraper.layout_cache._plans
+    restyled = _listing(3, row_class="featured")
+    expected = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser").parse_events(restyled)
+
+    with caplog.at_level("INFO", logger="garys_nyc_events.scraper"):
+        assert scraper.parse_events(restyled) == expected
+
+    assert "selected no rows" in caplog.text
+    assert scraper.last_layout_plan is None
+    assert scraper.layout_cache.get(fingerprint).row_path[-1] == "tr.featured"
+    scraper.parse_events(restyled)
+    assert scraper.last_layout_plan is not None
+
+
+def test_layout_plan_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "layout.json"
+    html = _listing(3)
+    GarysGuideScraper(delay_seconds=0, layout_cache=LayoutPlanCache(str(path))).parse_events(html)
+
+    warm = GarysGuideScraper(delay_seconds=0, layout_cache=LayoutPlanCache(str(path)))
+    warm.parse_events(html)
+    assert warm.last_layout_plan is not None
+
+
+def test_layout_plan_cache_ignores_corrupt_file_and_bounds_entries(tmp_path):
+    path = tmp_path / "layout.json"
+    path.write_text("{not json")
+    cache = LayoutPlanCache(str(path), max_entries=2)
+    for index in range(3):
+        cache.put(LayoutPlan(fingerprint=str(index), row_path=("tr",)))
+    assert cache.get("0") is None
+    assert LayoutPlanCache(str(path)).get("2") == LayoutPlan(fingerprint="2", row_path=("tr",))
@@ -0,0 +1,103 @@
+import sqlite3
+
+from garys_nyc_events import migrations
+from garys_nyc_events.migrations import SCHEMA_VERSION, migrate, schema_version
+from garys_nyc_events.storage import SQLiteEventStore
+
+
+def _tables(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")}
+
+
+def test_fresh_database_migrates_to_latest_once(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "events.db"))
+
+    assert migrate(conn) == list(range(1, SCHEMA_VERSION + 1))
+    assert schema_version(conn) == SCHEMA_VERSION
+    assert {"runs", "all events", "weekly_events", "store_meta", "events_fts", "all_events_fts_insert"} <= _tables(conn)
+    assert migrate(conn) == []
+    conn.close()
+
+
+def test_unversioned_database_is_upgraded_in_place(tmp_path):
+    db_path = str(tmp_path / "events.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source TEXT NOT NULL,
+            fetched_at TEXT NOT NULL,
+            search_term TEXT,
+            record_limit INTEGER,
+            status TEXT NOT NULL,
+            fetched_count INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 1,
+            error TEXT,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE "all events" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            canonical_key TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            url TEXT,
+            description TEXT,
+            tags TEXT NOT NULL DEFAULT '[]',
+            price TEXT,
+            event_date TEXT,
+            event_time TEXT,
+            event_location TEXT,
+            date_found TEXT,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO "all events" (canonical_key, name, description, event_date, date_found)
+        VALUES ('name:a', 'Quantum Meetup', 'qubits', '2026-03-02', '2026-02-26T00:00:00+00:00');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    store = SQLiteEventStore(db_path)
+    store.init_schema()
+
+    assert [hit["title"] for hit in store.search_events("qubits").events] == ["Quantum Meetup"]
+    conn = sqlite3.connect(db_path)
+    try:
+        assert schema_version(conn) == SCHEMA_VERSION
+        assert conn.execute('SELECT event_day FROM "all events"').fetchone() == ("2026-03-02",)
+        assert "page_hash" in {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+    finally:
+        conn.close()
+
+
+def test_failed_step_rolls_back_and_keeps_version(tmp_path, monkeypatch):
+    conn = sqlite3.connect(str(tmp_path / "events.db"))
+
+    def broken(connection):
+        connection.execute("CREATE TABLE half_done (x INTEGER)")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", (migrations.MIGRATIONS[0], (2, broken)))
+    monkeypatch.setattr(migrations, "SCHEMA_VERSION", 2)
+    try:
+        migrate(conn)
+    except RuntimeError:
+        pass
+
+    assert schema_version(conn) == 1
+    assert "half_done" not in _tables(conn)
+    conn.close()
+
+
+def test_store_runs_migrations_once_per_instance(tmp_path, monkeypatch):
+    import garys_nyc_events.storage as storage_module
+
+    calls = []
+    monkeypatch.setattr(storage_module, "migrate", lambda conn: calls.append(conn))
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    store.init_schema()
+
+    assert len(calls) == 1
@@ -0,0 +1,66 @@
+import json
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from garys_nyc_events.formatters import get_events_ai_json
+from garys_nyc_events.models import EnrichedEvent, Event, as_event, event_to_dict
+from garys_nyc_events.scraper import GarysGuideScraper
+
+
+def _event(**overrides) -> Event:
+    values = {
+        "title": "AI Meetup",
+        "date": "Thu Feb 06",
+        "price": "FREE",
+        "url": "https://www.garysguide.com/events/1",
+        "source": "garysguide_web",
+    }
+    values.update(overrides)
+    return Event(**values)
+
+
+def test_event_is_slotted_and_immutable():
+    event = _event(tags=["ai"])
+    assert not hasattr(event, "__dict__")
+    assert event.tags == ("ai",)
+    with pytest.raises(FrozenInstanceError):
+        event.title = "changed"  # type: ignore[misc]
+
+
+def test_event_supports_read_only_mapping_access():
+    event = _event()
+    assert event["title"] == "AI Meetup"
+    assert event.get("location", "") == ""
+    assert event.get("id") is None
+    assert "enriched_at" not in event
+    with pytest.raises(KeyError):
+        event["id"]
+
+
+def test_replace_keeps_original_untouched():
+    event = _event()
+    tagged = replace(event, tags=["ai", "free"])
+    assert tagged.tags == ("ai", "free")
+    assert event.tags == ()
+
+
+def test_as_event_and_event_to_dict_round_trip():
+    payload = {"title": "AI Meetup", "url": "https://x/events/1", "tags": ["ai"], "enriched_at": "2026-02-26"}
+    record = as_event(payload)
+    assert isinstance(record, EnrichedEvent)
+    assert record.tags == ("ai",)
+    assert as_event(record) is record
+
+    exported = event_to_dict(record)
+    assert exported["tags"] == ["ai"]
+    assert exported["enriched_at"] == "2026-02-26"
+    assert event_to_dict({"title": "plain"}) == {"title": "plain"}
+
+
+def test_pipeline_emits_records_and_serializes_only_at_the_json_boundary():
+    html = "<table><tr><td>Thu Feb 06</td><td><a href='/events/1'>AI Night</a> FREE</td></tr></table>"
+    events = GarysGuideScraper(delay_seconds=0).parse_events(html)
+
+    assert all(type(event) is Event for event in events)
+    assert json.loads(get_events_ai_json(events))[0]["tags"] == []
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+import garys_nyc_events.parsing as parsing
+from garys_nyc_events.parsing import build_tree, resolve_parser_backend, slice_table_region
+from garys_nyc_events.scraper import EVENT_HREF_REGEX, GarysGuideScraper
+
+
+def test_resolve_parser_backend_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        resolve_parser_backend("html5lib-turbo")
+
+
+def test_resolve_parser_backend_honours_pure_python_choice():
+    assert resolve_parser_backend("html.parser") == "html.parser"
+
+
+def test_resolve_parser_backend_falls_back_without_lxml(monkeypatch):
+    monkeypatch.setattr(parsing, "lxml_available", lambda: False)
+    assert resolve_parser_backend("auto") == "html.parser"
+    assert resolve_parser_backend("lxml") == "html.parser"
+
+
+def test_resolve_parser_backend_prefers_lxml_when_installed(monkeypatch):
+    monkeypatch.setattr(parsing, "lxml_available", lambda: True)
+    assert resolve_parser_backend("auto") == "lxml"
+
+
+def test_auto_backend_uses_installed_lxml():
+    pytest.importorskip("lxml")
+    assert resolve_parser_backend("auto") == "lxml"
+    assert GarysGuideScraper(delay_seconds=0).parser_backend == "lxml"
+    assert build_tree("<p>x</p>").builder.NAME == "lxml"
+
+
+def test_build_tree_returns_navigable_soup():
+    soup = build_tree("<div><a href='/events/1'>AI</a></div>", "html.parser")
+    assert soup.select_one("a[href]").get_text() == "AI"
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def test_parse_events_matches_across_backends(backend):
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    baseline = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser").parse_events(html)
+    events = GarysGuideScraper(delay_seconds=0, parser_backend=backend).parse_events(html)
+    assert events == baseline
+
+
+CHROME = "<div class='nav'><a href='/about'>About</a></div><script>var x = '<div>';</script>"
+
+
+def test_slice_table_region_keeps_whole_top_level_tables():
+    html = (
+        f"<html><body>{CHROME}<table id='a'><tr><td><table><tr><td>"
+        "<a href='/events/1'>One</a></td></tr></table></td></tr></table>"
+        f"<p>gap</p><table id='b'><tr><td><a href=\"/events/2\">Two</a></td></tr></table>{CHROME}</body></html>"
+    )
+    region = slice_table_region(html, EVENT_HREF_REGEX)
+    assert region.startswith("<table id='a'>")
+    assert region.endswith("</table>")
+    assert "/events/2" in region and "nav" not in region
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<div><a href='/events/1'>Outside</a></div><table><tr><td>x</td></tr></table>",
+        "<table><tr><td><a href='/events/1'>Unclosed</a></td></tr>",
+        "<p>No events</p>",
+    ],
+)
+def test_slice_table_region_returns_none_when_region_is_unclear(html):
+    assert slice_table_region(html, EVENT_HREF_REGEX) is None
+
+
+def test_region_slicing_matches_full_parse_and_counts_fallbacks():
+    html = Path("tests/fixtures/sample_events_page.html").read_text().replace("<body>", f"<body>{CHROME}")
+    sliced = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser")
+    full = GarysGuideScraper(delay_seconds=0, parser_backend="html.parser", region_slicing=False)
+
+    assert sliced.parse_events(html) == full.parse_events(html)
+    assert sliced.region_fallbacks == 0
+
+    sliced.parse_events("<div><a href='/events/9'>Div Event</a> Feb 06</div>")
+    assert sliced.region_fallbacks == 1
@@ -0,0 +1,203 @@
+from pathlib import Path
+
+import pytest
+
+from garys_nyc_events import runner_once as runner
+from garys_nyc_events.config import PipelineConfig
+from garys_nyc_events.runner_once import run_once
+from garys_nyc_events.scraper import GarysGuideScraper
+from garys_nyc_events.storage import SQLiteEventStore
+from tests.http_doubles import StubHttpClient, StubHttpResponse
+
+
+PAGE = Path("tests/fixtures/sample_events_page.html").read_text()
+
+
+def _install_pages(monkeypatch, pages):
+    client = StubHttpClient([StubHttpResponse(text=page) for page in pages])
+    monkeypatch.setattr(
+        runner,
+        "_default_scraper",
+        lambda _cfg: GarysGuideScraper(delay_seconds=0, http_client=client),
+    )
+    return client
+
+
+def _config(tmp_path) -> PipelineConfig:
+    return PipelineConfig(db_path=str(tmp_path / "events.db"), tagging_enabled=False, retry_attempts=1)
+
+
+def test_identical_listing_page_short_circuits_run(tmp_path, monkeypatch):
+    _install_pages(monkeypatch, [PAGE, PAGE])
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+
+    first = run_once(config=_config(tmp_path), store=store)
+    second = run_once(config=_config(tmp_path), store=store)
+
+    latest = store.fetch_latest_run()
+    assert first.unchanged is False
+    assert first.fetched_count == 2
+    assert second.unchanged is True
+    assert second.status == "success"
+    assert second.fetched_count == 0
+    assert latest is not None
+    assert latest["unchanged"] == 1
+    assert latest["page_hash"]
+    assert store.count_rows("runs") == 2
+    assert store.count_rows("all events") == 2
+
+
+def test_identical_event_set_short_circuits_before_tagging(tmp_path, monkeypatch):
+    reshuffled_markup = PAGE.replace("<body>", "<body><div class='ad'>Sponsored</div>")
+    _install_pages(monkeypatch, [PAGE, reshuffled_markup])
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+
+    run_once(config=_config(tmp_path), store=store)
+    second = run_once(config=_config(tmp_path), store=store)
+
+    assert second.unchanged is True
+
+
+def test_changed_events_run_full_pipeline(tmp_path, monkeypatch):
+    changed = PAGE.replace("NYC Tech Meetup", "NYC Robotics Meetup")
+    _install_pages(monkeypatch, [PAGE, changed])
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+
+    run_once(config=_config(tmp_path), store=store)
+    second = run_once(config=_config(tmp_path), store=store)
+
+    assert second.unchanged is False
+    assert second.fetched_count == 2
+    assert store.count_rows("all events") == 2
+    assert (second.inserted_count, second.updated_count, second.unchanged_count) == (0, 1, 1)
+
+
+def test_fingerprint_is_scoped_to_search_term(tmp_path, monkeypatch):
+    _install_pages(monkeypatch, [PAGE, PAGE])
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+
+    run_once(config=_config(tmp_path), store=store)
+    filtered = PipelineConfig(**{**_config(tmp_path).__dict__, "scraper_search_term": "founders"})
+    second = run_once(config=filtered, store=store)
+
+    assert second.unchanged is False
+    assert second.fetched_count == 1
+
+
+def test_init_schema_adds_fingerprint_columns_to_existing_runs_table(tmp_path):
+    import sqlite3
+
+    db_path = tmp_path / "events.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, source TEXT NOT NULL, "
+        "fetched_at TEXT NOT NULL, search_term TEXT, record_limit INTEGER, status TEXT NOT NULL, "
+        "fetched_count INTEGER NOT NULL DEFAULT 0, attempts INTEGER NOT NULL DEFAULT 1, error TEXT, "
+        "created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.commit()
+    conn.close()
+
+    SQLiteEventStore(str(db_path)).init_schema()
+
+    conn = sqlite3.connect(str(db_path))
+    names = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+    conn.close()
+    assert {"page_hash", "event_set_hash", "unchanged"} <= names
+
+
+def test_advancing_date_with_identical_page_reruns_week_filter(tmp_path, monkeypatch):
+    from datetime import date
+
+    _install_pages(monkeypatch, [PAGE, PAGE])
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    config = PipelineConfig(**{**_config(tmp_path).__dict__, "scraper_search_term": "ai"})
+
+    monkeypatch.setattr(runner, "_today", lambda: date(2026, 1, 31))
+    first = run_once(config=config, store=store)
+    monkeypatch.setattr(runner, "_today", lambda: date(2026, 2, 1))
+    second = run_once(config=config, store=store)
+
+    assert first.fetched_count == 0
+    assert second.unchanged is False
+    assert second.fetched_count == 1
+    assert store.count_rows("all events") == 1
+
+
+def test_changed_ai_keywords_bust_page_fingerprint(tmp_path, monkeypatch):
+    from datetime import date
+
+    _install_pages(monkeypatch, [PAGE, PAGE])
+    monkeypatch.setattr(runner, "_today", lambda: date(2026, 2, 1))
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    config = PipelineConfig(**{**_config(tmp_path).__dict__, "scraper_search_term": "ai"})
+
+    run_once(config=config, store=store)
+    narrowed = PipelineConfig(**{**config.__dict__, "ai_keywords": frozenset({"robotics"})})
+    second = run_once(config=narrowed, store=store)
+
+    assert second.unchanged is False
+    assert second.fetched_count == 0
+
+
+def test_unchanged_run_inherits_observations_of_matched_run(tmp_path, monkeypatch):
+    _install_pages(monkeypatch, [PAGE, PAGE])
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+
+    first = run_once(config=_config(tmp_path), store=store)
+    store.persist_run(
+        source="web",
+        fetched_at="2026-02-26T03:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="partial",
+        attempts=1,
+        error="timed out",
+        events=[{"title": "Partial Only", "url": "https://www.garysguide.com/events/999", "date": "Feb 06"}],
+    )
+    second = run_once(config=_config(tmp_path), store=store)
+
+    assert second.unchanged is True
+    diff = store.diff_runs(second.run_id, base_run_id=first.run_id)
+    assert (diff.added, diff.removed, diff.changed) == ([], [], [])
+    assert [event["title"] for event in store.diff_runs(second.run_id).removed] == ["Partial Only"]
+
+
+def test_repeated_event_url_keeps_first_listing_end_to_end(tmp_path, monkeypatch):
+    repeated = PAGE.replace(
+        "    </table>",
+        "      <tr>\n        <td>Thu Feb 06</td>\n        <td><a href=\"/events/123\">NYC Tech Meetup (Moved)</a> FREE</td>\n      </tr>\n    </table>",
+    )
+    _install_pages(monkeypatch, [repeated])
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+
+    result = run_once(config=_config(tmp_path), store=store)
+
+    assert result.fetched_count == 2
+    with store._connect() as conn:
+        names = [row["name"] for row in conn.execute('SELECT name FROM "all events" ORDER BY id')]
+    assert names == ["NYC Tech Meetup", "AI Founders Night"]
+
+
+def test_run_once_closes_only_the_store_it_creates(tmp_path, monkeypatch):
+    _install_pages(monkeypatch, [PAGE, PAGE])
+    created = []
+    closed = []
+
+    def default_store(cfg):
+        created.append(SQLiteEventStore.from_config(cfg))
+        return created[-1]
+
+    def broken_scrape(_cfg):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(runner, "_default_store", default_store)
+    monkeypatch.setattr(SQLiteEventStore, "close", lambda self: closed.append(self))
+
+    run_once(config=_config(tmp_path))
+    run_once(config=_config(tmp_path), store=SQLiteEventStore(str(tmp_path / "events.db")))
+    with pytest.raises(RuntimeError):
+        run_once(config=_config(tmp_path), scrape_func=broken_scrape)
+
+    assert len(created) == 2
+    assert closed == created
@@ -1,7 +1,7 @@
 import pytest
 
 from garys_nyc_events.config import PipelineConfig
-from garys_nyc_events.exceptions import ScraperNetworkError
+from garys_nyc_events.exceptions import ResponseTooLargeError, ScraperNetworkError
 from garys_nyc_events.runner_once import PartialScrapeError, is_transient_error, run_once
 from garys_nyc_events.scheduler import validate_cron_schedule
 from garys_nyc_events.storage import SQLiteEventStore
@@ -64,6 +64,7 @@ def test_no_retry_on_non_transient_error(tmp_path):
 def test_transient_error_classifier():
     assert is_transient_error(ScraperNetworkError("timeout")) is True
     assert is_transient_error(ValueError("bad")) is False
+    assert is_transient_error(ResponseTooLargeError("too big")) is False
 
 
 def test_run_once_records_failure_on_unrecoverable_network_error(tmp_path):
@@ -6,7 +6,7 @@ from bs4 import BeautifulSoup
 
 from garys_nyc_events.exceptions import ScraperNetworkError, ScraperTimeoutError
 from garys_nyc_events.http import RequestsHttpClient
-from garys_nyc_events.scraper import GarysGuideScraper
+from garys_nyc_events.scraper import ExtractionContext, GarysGuideScraper
 from tests.http_doubles import FailingHttpClient, StubHttpClient, StubHttpResponse
 
 
@@ -119,6 +119,21 @@ def test_extract_location_returns_venue_text():
     assert scraper._extract_location(element) == "Midtown NYC"
 
 
+@pytest.mark.parametrize(
+    "markup, expected",
+    [
+        ("<span class='street-address'>1 Main St</span><span class='venue'>Midtown NYC</span>", "Midtown NYC"),
+        ("<font class='fdescription'> </font><span class='location'>Brooklyn</span>", "Brooklyn"),
+        ("<span class='venue'></span><span class='event-location'>Queens</span>", "Queens"),
+        ("<span class='address'>1 Main St</span><font class='fdescription'>Cloud One</font>", "Cloud One"),
+    ],
+)
+def test_extract_location_keeps_selector_priority(markup, expected):
+    scraper = GarysGuideScraper(delay_seconds=0)
+    element = _first_tag(f"<div>{markup}</div>")
+    assert scraper._extract_location(element) == expected
+
+
 def test_extract_location_returns_empty_when_absent():
     scraper = GarysGuideScraper(delay_seconds=0)
     element = _first_tag("<div><span>no venue marker</span></div>")
@@ -258,7 +273,7 @@ def test_scraper_network_error_chains_original_cause(monkeypatch):
     def fake_get(*_args, **_kwargs):
         raise requests.ConnectionError("connection failed")
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(requests.Session, "get", fake_get)
     scraper = GarysGuideScraper(delay_seconds=0, http_client=RequestsHttpClient())
 
     with pytest.raises(ScraperNetworkError) as exc_info:
@@ -271,3 +286,148 @@ def test_scraper_network_error_chains_original_cause(monkeypatch):
 def test_scraper_has_no_get_events_safe_method():
     scraper = GarysGuideScraper(delay_seconds=0)
     assert hasattr(scraper, "get_events_safe") is False
+
+
+def test_extraction_context_normalizes_and_memoizes_node_text():
+    element = _first_tag("<div>  AI\n Event   Thu Feb 06 </div>")
+    assert element is not None
+    calls = {"get_text": 0}
+    original_get_text = element.get_text
+
+    def counting_get_text(*args, **kwargs):
+        calls["get_text"] += 1
+        return original_get_text(*args, **kwargs)
+
+    element.get_text = counting_get_text  # type: ignore[method-assign]
+    context = ExtractionContext()
+
+    assert context.text(element) == "AI Event Thu Feb 06"
+    assert context.text(element) == "AI Event Thu Feb 06"
+    assert calls["get_text"] == 1
+
+
+def test_build_event_reads_container_text_once():
+    row = _first_tag(
+        "<tr><td>Thu Feb 06</td><td><a href='/events/1'>AI Event</a> 7:00 PM Midtown</td><td>FREE</td></tr>"
+    )
+    assert row is not None
+    scraper = GarysGuideScraper(delay_seconds=0)
+    calls = {"get_text": 0}
+    original_get_text = row.get_text
+
+    def counting_get_text(*args, **kwargs):
+        calls["get_text"] += 1
+        return original_get_text(*args, **kwargs)
+
+    row.get_text = counting_get_text  # type: ignore[method-assign]
+    event = scraper._extract_event_from_element(row)
+
+    assert event is not None
+    assert event.date == "Thu Feb 06"
+    assert event.time == "7:00 PM"
+    assert calls["get_text"] == 1
+
+
+def test_candidate_elements_yields_each_container_once():
+    html = """
+    <table>
+        <tr>
+            <td>Thu Feb 06</td>
+            <td><a href='/events/1'>AI Event</a> <a href='/events/1/rsvp'>RSVP</a></td>
+            <td>FREE</td>
+        </tr>
+        <tr>
+            <td>Fri Feb 07</td>
+            <td><a href='/events/2'>ML Night</a></td>
+            <td>$10</td>
+        </tr>
+    </table>
+    """
+    scraper = GarysGuideScraper(delay_seconds=0)
+    soup = BeautifulSoup(html, "html.parser")
+
+    containers = list(scraper._candidate_elements(soup))
+
+    assert len(containers) == 2
+    assert [row.find("a").get_text() for row in containers] == ["AI Event", "ML Night"]
+
+
+def test_outer_row_decision_is_cached_per_row():
+    html = """
+    <table>
+        <tr>
+            <td>Thu Feb 06</td>
+            <td><a href='/events/1'>AI Event</a> <a href='/events/1/rsvp'>RSVP</a> <a href='/events/1/map'>Map</a></td>
+            <td>FREE</td>
+        </tr>
+    </table>
+    """
+    scraper = GarysGuideScraper(delay_seconds=0)
+    soup = BeautifulSoup(html, "html.parser")
+    decisions = {"count": 0}
+    original = scraper._is_outer_event_row
+
+    def counting_is_outer_event_row(row):
+        decisions["count"] += 1
+        return original(row)
+
+    scraper._is_outer_event_row = counting_is_outer_event_row  # type: ignore[method-assign]
+
+    containers = list(scraper._candidate_elements(soup))
+
+    assert len(containers) == 1
+    assert decisions["count"] == 1
+
+
+def test_parse_events_iter_streams_unique_events():
+    html = Path("tests/fixtures/sample_events_page.html").read_text()
+    scraper = GarysGuideScraper(delay_seconds=0)
+
+    stream = scraper.parse_events_iter(html)
+    first = next(stream)
+    rest = list(stream)
+
+    assert first["title"] == "NYC Tech Meetup"
+    assert [event["title"] for event in rest] == ["AI Founders Night"]
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        """
+        <div><a href='/events/1'>AI Event</a> Thu Feb 06 FREE</div>
+        <div><a href='/events/1'>AI Event</a> Fri Feb 07 $10</div>
+        """,
+        """
+        <table>
+          <tr><td>Thu Feb 06</td><td><a href='/events/1'>AI Event</a> FREE</td></tr>
+          <tr><td>Fri Feb 07</td><td><a href='/events/1'>AI Event</a> $10</td></tr>
+        </table>
+        """,
+    ],
+)
+def test_parse_events_keeps_first_of_duplicate_events(html):
+    scraper = GarysGuideScraper(delay_seconds=0)
+
+    streamed = list(scraper.parse_events_iter(html))
+
+    assert len(streamed) == 1
+    assert (streamed[0]["date"], streamed[0]["price"]) == ("Thu Feb 06", "FREE")
+    assert scraper.parse_events(html) == streamed
+
+
+def test_parse_events_iter_does_not_free_wrapper_before_nested_rows():
+    html = """
+    <div class='wrapper'>
+        <a href='/events/featured'>Featured AI Night</a>
+        <table>
+            <tr><td>Thu Feb 06</td><td><a href='/events/1'>AI Event</a></td><td>FREE</td></tr>
+            <tr><td>Fri Feb 07</td><td><a href='/events/2'>ML Night</a></td><td>$10</td></tr>
+        </table>
+    </div>
+    """
+    scraper = GarysGuideScraper(delay_seconds=0)
+
+    titles = [event["title"] for event in scraper.parse_events_iter(html)]
+
+    assert titles == ["Featured AI Night", "AI Event", "ML Night"]
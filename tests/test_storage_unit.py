@@ -361,3 +361,389 @@ def test_fetch_events_ai_only_returns_empty_for_no_matches(tmp_path):
     )
 
     assert store.fetch_events(ai_only=True) == []
+
+
+def test_persist_run_consumes_event_generator(tmp_path):
+    db_path = tmp_path / "events.db"
+    store = SQLiteEventStore(str(db_path))
+    store.init_schema()
+
+    def stream():
+        for index in range(3):
+            yield {
+                "title": f"AI Event {index}",
+                "url": f"https://www.garysguide.com/events/{index}",
+                "price": "FREE",
+                "date": "2026-02-27",
+            }
+
+    run = store.persist_run(
+        source="web",
+        fetched_at="2026-02-17T00:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        events=stream(),
+        today=date(2026, 2, 26),
+    )
+
+    latest = store.fetch_latest_run()
+    assert run.fetched_count == 3
+    assert latest is not None
+    assert latest["fetched_count"] == 3
+    assert store.count_rows("all events") == 3
+
+
+def _persist(store, events, today=date(2026, 2, 26)):
+    return store.persist_run(
+        source="web",
+        fetched_at="2026-02-26T00:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        events=events,
+        today=today,
+    )
+
+
+def test_event_start_is_normalized_and_orders_fetch(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    _persist(
+        store,
+        [
+            {"title": "Late", "url": "https://www.garysguide.com/events/1", "date": "Tue, Mar 3", "time": "6:30pm"},
+            {"title": "Early", "url": "https://www.garysguide.com/events/2", "date": "Feb 27", "time": "9:00 AM"},
+            {"title": "Evening", "url": "https://www.garysguide.com/events/3", "date": "Fri, Feb 27", "time": "7:00 PM"},
+        ],
+    )
+
+    assert [event["title"] for event in store.fetch_events()] == ["Early", "Evening", "Late"]
+    assert [event["title"] for event in store.fetch_events(date_from=date(2026, 3, 1))] == ["Late"]
+    assert [event["title"] for event in store.fetch_events(date_to=date(2026, 2, 27))] == ["Early", "Evening"]
+
+    import sqlite3
+
+    conn = sqlite3.connect(str(tmp_path / "events.db"))
+    try:
+        row = conn.execute('SELECT event_start, event_day FROM "all events" WHERE name = ?', ("Late",)).fetchone()
+        plan = " ".join(
+            str(step[-1])
+            for step in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM weekly_events WHERE event_start >= ? ORDER BY event_start",
+                ("2026-03-01",),
+            )
+        )
+    finally:
+        conn.close()
+    assert row == ("2026-03-03T18:30", "2026-03-03")
+    assert "idx_weekly_events_start" in plan
+
+
+def test_init_schema_backfills_event_start_for_legacy_rows(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "events.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE "all events" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            canonical_key TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            url TEXT,
+            description TEXT,
+            tags TEXT NOT NULL DEFAULT '[]',
+            price TEXT,
+            event_date TEXT,
+            event_time TEXT,
+            event_location TEXT,
+            date_found TEXT,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO "all events" (canonical_key, name, event_date, event_time, date_found)
+        VALUES ('name:a', 'A', 'Thu Feb 06', '7:00 PM', '2025-02-01T00:00:00+00:00'),
+               ('name:b', 'B', 'Weekly', '', '2026-02-01T00:00:00+00:00');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    SQLiteEventStore(db_path).init_schema()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute('SELECT name, event_start, event_day FROM "all events" ORDER BY name').fetchall()
+    finally:
+        conn.close()
+    assert rows == [("A", "2025-02-06T19:00", "2025-02-06"), ("B", "", "")]
+
+
+def test_search_events_ranks_and_paginates_full_history(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    _persist(
+        store,
+        [
+            {"title": "Robotics Night", "url": "https://www.garysguide.com/events/1", "date": "Jan 5"},
+            {
+                "title": "Founder Mixer",
+                "url": "https://www.garysguide.com/events/2",
+                "date": "Feb 27",
+                "description": "demos of home robotics kits",
+            },
+            {"title": "Robotics Lab Tour", "url": "https://www.garysguide.com/events/3", "date": "Feb 28"},
+            {"title": "Cooking Club", "url": "https://www.garysguide.com/events/4", "date": "Feb 27"},
+        ],
+    )
+
+    first = store.search_events("robotics", limit=2)
+    second = store.search_events("robotics", limit=2, cursor=first.next_cursor)
+
+    assert [event["title"] for event in first.events] == ["Robotics Night", "Robotics Lab Tour"]
+    assert [event["title"] for event in second.events] == ["Founder Mixer"]
+    assert second.next_cursor is None
+    assert first.events[0]["score"] > second.events[0]["score"]
+
+
+def test_search_index_follows_upserts_and_ignores_query_syntax(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    event = {"title": "AI Summit", "url": "https://www.garysguide.com/events/1", "date": "Feb 27", "tags": ["llm"]}
+    _persist(store, [event])
+    _persist(store, [{**event, "title": "Vision Summit"}])
+
+    assert store.search_events("AI").events == []
+    assert [hit["title"] for hit in store.search_events("vision").events] == ["Vision Summit"]
+    assert [hit["title"] for hit in store.search_events('llm"* (').events] == ["Vision Summit"]
+    assert store.search_events("  ").events == []
+
+
+def test_init_schema_indexes_existing_rows_for_search(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "events.db")
+    store = SQLiteEventStore(db_path)
+    store.init_schema()
+    _persist(store, [{"title": "Quantum Meetup", "url": "https://www.garysguide.com/events/9", "date": "Feb 27"}])
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TABLE events_fts")
+    conn.execute("PRAGMA user_version = 3")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteEventStore(db_path)
+    store.init_schema()
+
+    assert [hit["title"] for hit in store.search_events("quantum").events] == ["Quantum Meetup"]
+
+
+def test_batched_upsert_dedupes_keys_across_chunks(tmp_path, monkeypatch):
+    import garys_nyc_events.storage as storage_module
+
+    monkeypatch.setattr(storage_module, "UPSERT_BATCH_ROWS", 2)
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    events = [
+        {"title": f"Event {index}", "url": f"https://www.garysguide.com/events/{index % 3}", "date": "Feb 27"}
+        for index in range(5)
+    ]
+
+    with store._connect() as conn:
+        result = store._upsert_all_events(conn, iter(events), date_found="2026-02-26T00:00:00+00:00", today=date(2026, 2, 26))
+        names = dict(conn.execute('SELECT id, name FROM "all events"').fetchall())
+
+    ids = result.event_ids
+    assert len(ids) == len(set(ids)) == 3
+    assert (result.inserted, result.updated, result.unchanged) == (3, 0, 0)
+    assert [names[event_id] for event_id in ids] == ["Event 0", "Event 1", "Event 2"]
+    assert store.count_rows("all events") == 3
+
+
+def test_upsert_batch_fits_sqlite_parameter_limit():
+    import garys_nyc_events.storage as storage_module
+
+    assert storage_module.UPSERT_BATCH_ROWS * len(storage_module.ALL_EVENT_COLUMNS) <= storage_module.SQLITE_MAX_VARIABLES
+
+
+def test_run_counts_add_up_to_fetched_count_with_repeated_events(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    event = {"title": "AI Night", "url": "https://www.garysguide.com/events/1", "date": "2026-02-27"}
+    _persist(store, [event])
+
+    run = _persist(store, [event, {**event, "title": "AI Night (updated)"}, event])
+
+    assert run.fetched_count == 1
+    assert (run.inserted_count, run.updated_count, run.unchanged_count) == (0, 0, 1)
+
+    run = _persist(store, [{**event, "title": "AI Night (updated)"}, event])
+
+    assert (run.inserted_count, run.updated_count, run.unchanged_count) == (0, 1, 0)
+    with store._connect() as conn:
+        assert [row["name"] for row in conn.execute('SELECT name FROM "all events"')] == ["AI Night (updated)"]
+
+
+def _weekly_rows(db_path):
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return sorted(conn.execute("SELECT all_event_id, name, event_day FROM weekly_events").fetchall())
+    finally:
+        conn.close()
+
+
+def test_weekly_window_slides_incrementally(tmp_path):
+    db_path = str(tmp_path / "events.db")
+    store = SQLiteEventStore(db_path)
+    store.init_schema()
+    _persist(
+        store,
+        [
+            {"title": f"Day {day}", "url": f"https://www.garysguide.com/events/{day}", "date": f"2026-03-{day:02d}"}
+            for day in range(1, 15)
+        ],
+        today=date(2026, 3, 1),
+    )
+    assert [row[2] for row in _weekly_rows(db_path)] == [f"2026-03-{day:02d}" for day in range(1, 8)]
+
+    _persist(store, [], today=date(2026, 3, 4))
+    assert [row[2] for row in _weekly_rows(db_path)] == [f"2026-03-{day:02d}" for day in range(4, 11)]
+
+    _persist(store, [{"title": "Day 5 moved", "url": "https://www.garysguide.com/events/5", "date": "2026-03-20"}], today=date(2026, 3, 4))
+    assert "2026-03-05" not in [row[2] for row in _weekly_rows(db_path)]
+
+    _persist(store, [{"title": "Day 6 renamed", "url": "https://www.garysguide.com/events/6", "date": "2026-03-06"}], today=date(2026, 3, 4))
+    assert ("Day 6 renamed", "2026-03-06") in [row[1:] for row in _weekly_rows(db_path)]
+
+
+def test_incremental_weekly_matches_full_rebuild(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "events.db")
+    store = SQLiteEventStore(db_path)
+    store.init_schema()
+    for run, today in enumerate([date(2026, 3, 1), date(2026, 3, 3), date(2026, 3, 3), date(2026, 3, 12), date(2026, 3, 2)]):
+        _persist(
+            store,
+            [
+                {
+                    "title": f"Event {index} run {run}",
+                    "url": f"https://www.garysguide.com/events/{index}",
+                    "date": f"2026-03-{1 + (index * 7 + run * 3) % 20:02d}",
+                }
+                for index in range(run, run + 12)
+            ],
+            today=today,
+        )
+        incremental = _weekly_rows(db_path)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM store_meta")
+        conn.commit()
+        conn.close()
+        _persist(store, [], today=today)
+
+        assert incremental == _weekly_rows(db_path)
+
+
+def test_unchanged_events_are_not_rewritten(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "events.db")
+    store = SQLiteEventStore(db_path)
+    store.init_schema()
+    events = [
+        {"title": "AI Summit", "url": "https://www.garysguide.com/events/1", "date": "2026-02-27", "tags": ["ai"]},
+        {"title": "ML Night", "url": "https://www.garysguide.com/events/2", "date": "2026-02-28"},
+    ]
+    first = _persist(store, events)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute('UPDATE "all events" SET updated_at = ?', ("2000-01-01 00:00:00",))
+    conn.commit()
+    conn.close()
+
+    second = _persist(store, [events[0], {**events[1], "price": "$5"}, {"title": "New", "url": "https://x/3", "date": ""}])
+
+    conn = sqlite3.connect(db_path)
+    try:
+        stamps = dict(conn.execute('SELECT name, updated_at FROM "all events"').fetchall())
+        counts = conn.execute(
+            "SELECT inserted_count, updated_count, unchanged_count FROM runs ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert (first.inserted_count, first.updated_count, first.unchanged_count) == (2, 0, 0)
+    assert (second.inserted_count, second.updated_count, second.unchanged_count) == (1, 1, 1)
+    assert counts == [(2, 0, 0), (1, 1, 1)]
+    assert stamps["AI Summit"] == "2000-01-01 00:00:00"
+    assert stamps["ML Night"] != "2000-01-01 00:00:00"
+    assert store.count_rows("weekly_events") == 2
+
+
+def test_diff_runs_reports_added_removed_and_changed(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"))
+    store.init_schema()
+    base = [
+        {"title": f"Event {index}", "url": f"https://www.garysguide.com/events/{index}", "date": "2026-02-27"}
+        for index in range(3)
+    ]
+    first = _persist(store, base)
+    second = _persist(store, [base[0], {**base[1], "price": "$20"}, {"title": "Event 9", "url": "https://x/9", "date": ""}])
+
+    diff = store.diff_runs(second.run_id)
+
+    assert diff.base_run_id == first.run_id
+    assert [event["title"] for event in diff.added] == ["Event 9"]
+    assert [event["title"] for event in diff.removed] == ["Event 2"]
+    assert [event["title"] for event in diff.changed] == ["Event 1"]
+    assert [event["title"] for event in store.diff_runs(first.run_id).added] == ["Event 0", "Event 1", "Event 2"]
+    assert store.diff_runs(first.run_id, base_run_id=second.run_id).removed[0]["title"] == "Event 9"
+    assert store.diff_runs(999) is None
+    assert store.diff_runs(second.run_id, base_run_id=999) is None
+
+
+def test_short_circuited_run_inherits_previous_observations(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "events.db")
+    store = SQLiteEventStore(db_path)
+    store.init_schema()
+    first = _persist(store, [{"title": "AI Summit", "url": "https://www.garysguide.com/events/1", "date": "2026-02-27"}])
+    repeat = store.persist_run(
+        source="web",
+        fetched_at="2026-02-26T06:00:00+00:00",
+        search_term="",
+        record_limit=0,
+        status="success",
+        attempts=1,
+        error="",
+        events=[],
+        today=date(2026, 2, 26),
+        unchanged=True,
+        matched_run_id=first.run_id,
+    )
+
+    diff = store.diff_runs(repeat.run_id)
+    assert (diff.added, diff.removed, diff.changed) == ([], [], [])
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM run_events").fetchone() == (2,)
+        plan = " ".join(
+            str(step[-1])
+            for step in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT 1 FROM run_events o WHERE o.run_id = ? AND o.all_event_id = ?", (1, 1)
+            )
+        )
+    finally:
+        conn.close()
+    assert "PRIMARY KEY" in plan
@@ -156,4 +156,4 @@ def test_tagging_disabled_via_config_flag(monkeypatch):
 
     cfg = PipelineConfig(scraper_search_term="", tagging_enabled=False)
     events = _run_scrape(cfg)
-    assert events[0]["tags"] == []
+    assert events[0]["tags"] == ()
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from garys_nyc_events.text_scanner import DATE_REGEXES, PRICE_REGEX, TIME_REGEX, scan_tokens, strip_spans
+
+
+def _legacy_fields(text: str):
+    normalized = " ".join(text.split())
+    date = ""
+    for pattern in DATE_REGEXES:
+        match = pattern.search(normalized)
+        if match:
+            date = match.group(0)
+            break
+    time_match = TIME_REGEX.search(normalized)
+    price_match = PRICE_REGEX.search(normalized)
+    price = ""
+    if price_match:
+        token = price_match.group(0)
+        price = "FREE" if "free" in token.lower() else token.replace(" ", "")
+    return date, time_match.group(0).upper() if time_match else "", price
+
+
+def test_scan_tokens_prefers_weekday_date_over_earlier_bare_date():
+    scan = scan_tokens("Doors open Jan 3 for Thu, Feb 06, 2025 launch")
+    assert scan.date == "Thu, Feb 06, 2025"
+
+
+def test_scan_tokens_normalizes_time_and_price():
+    scan = scan_tokens("Starts 6:30 pm tickets $ 25.00")
+    assert scan.time == "6:30 PM"
+    assert scan.price == "$25.00"
+    assert scan_tokens("Entry is free!").price == "FREE"
+
+
+def test_scan_tokens_ignores_words_containing_tokens():
+    scan = scan_tokens("Freestyle Monday at Mayfair")
+    assert (scan.date, scan.time, scan.price) == ("", "", "")
+
+
+def test_scan_tokens_reports_every_span_in_order():
+    text = "Thu Feb 06 6:00 PM $10 then Feb 07 FREE"
+    scan = scan_tokens(text)
+    assert [(span.kind, span.text) for span in scan.spans] == [
+        ("weekday_date", "Thu Feb 06"),
+        ("time", "6:00 PM"),
+        ("price", "$10"),
+        ("date", "Feb 07"),
+        ("price", "FREE"),
+    ]
+    assert all(text[span.start : span.end] == span.text for span in scan.spans)
+
+
+def test_strip_spans_handles_overlaps():
+    assert strip_spans("abcdefgh", [(4, 6), (1, 3), (2, 5)]) == "a   gh"
+    assert strip_spans("abc", []) == "abc"
+
+
+@pytest.mark.parametrize("fixture", ["sample_events_page.html", "sample_newsletter.html"])
+def test_scan_tokens_matches_separate_extractors_on_fixtures(fixture):
+    soup = BeautifulSoup((Path("tests/fixtures") / fixture).read_text(), "html.parser")
+    for tag in soup.find_all(True):
+        text = tag.get_text(" ")
+        scan = scan_tokens(" ".join(text.split()))
+        assert (scan.date, scan.time, scan.price) == _legacy_fields(text)